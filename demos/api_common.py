@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+🔌 Shared plumbing for the live API demos
+========================================
+.env loading, the JSON codec and per-provider request limits
+"""
+
+import asyncio
+import json
+import os
+from dotenv import load_dotenv
+
+from request_pacing import rpm_limiter
+
+# orjson is optional; fall back to the stdlib codec
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps(obj):
+    """Serialize a payload to str, as aiohttp's json_serialize expects (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def json_dump_bytes(obj):
+    """Serialize a payload to bytes for a raw request body (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+_ENV_LOADED = False
+
+def load_env():
+    """Load environment variables from .env file (parsed at most once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return True
+    if not os.path.isfile('.env'):
+        print("❌ .env file not found!")
+        return False
+    # .env values win over the inherited environment, as before
+    load_dotenv('.env', override=True)
+    _ENV_LOADED = True
+    return True
+
+# Per-provider request pacing (requests per minute, overridable via env)
+AZURE_LIMIT = rpm_limiter('AZURE_RPM', 60)
+GEMINI_LIMIT = rpm_limiter('GEMINI_RPM', 60)
+PPLX_LIMIT = rpm_limiter('PPLX_RPM', 20)
+
+# Cap in-flight requests per provider regardless of caller fan-out
+AZURE_SEM = asyncio.Semaphore(int(os.getenv('AZURE_MAX_INFLIGHT', '8')))
+GEMINI_SEM = asyncio.Semaphore(int(os.getenv('GEMINI_MAX_INFLIGHT', '8')))
+PPLX_SEM = asyncio.Semaphore(int(os.getenv('PPLX_MAX_INFLIGHT', '4')))
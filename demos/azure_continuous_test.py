@@ -8,28 +8,84 @@ Keep testing until Azure OpenAI is working!
 import os
 import sys
 import asyncio
-import json
 import aiohttp
 from datetime import datetime
 
 # Add src to path
 sys.path.append('src')
 
-def load_env():
-    """Load environment variables from .env file"""
-    try:
-        with open('.env', 'r') as f:
-            for line in f:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    except FileNotFoundError:
-        print("❌ .env file not found!")
-        return False
-    return True
+# Import ENTAERA framework once at module load
+try:
+    from entaera.core.conversation import ConversationManager, Message, MessageRole
+    from entaera.core.logger import LoggerManager
+    from entaera.utils.api_router import SmartAPIRouter, TaskComplexity
+    _FRAMEWORK_ERROR = None
+except ImportError as e:
+    _FRAMEWORK_ERROR = e
 
-async def test_azure_openai_api(prompt):
-    """Test live Azure OpenAI API call"""
+from api_common import (
+    load_env, json_dumps, json_loads,
+    AZURE_LIMIT, GEMINI_LIMIT, PPLX_LIMIT, AZURE_SEM, GEMINI_SEM, PPLX_SEM
+)
+
+# Sampling temperature per provider; None leaves Gemini on its own default
+PROVIDER_TEMPERATURES = {
+    'azure': float(os.getenv('AZURE_TEMPERATURE', '0.7')),
+    'perplexity': float(os.getenv('PPLX_TEMPERATURE', '0.2')),
+    'gemini': float(os.environ['GEMINI_TEMPERATURE']) if os.getenv('GEMINI_TEMPERATURE') else None,
+}
+
+# Shared HTTP session so every API call reuses pooled keep-alive connections
+_SESSION: aiohttp.ClientSession | None = None
+
+async def get_session():
+    """Return the shared aiohttp session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=int(os.getenv('MAX_INFLIGHT', '16')),
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=json_dumps
+        )
+    return _SESSION
+
+async def close_session():
+    """Close the shared aiohttp session"""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+async def warm_up_connections():
+    """Open keep-alive connections to the configured providers ahead of the first request"""
+    urls = []
+    endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
+    if endpoint and 'your-resource-name' not in endpoint:
+        urls.append(endpoint)
+    if os.getenv('GEMINI_API_KEY'):
+        urls.append("https://generativelanguage.googleapis.com/")
+    if os.getenv('PERPLEXITY_API_KEY'):
+        urls.append("https://api.perplexity.ai/")
+    
+    session = await get_session()
+    
+    async def touch(url):
+        # Any response (even 404) leaves a warm TLS connection in the pool
+        try:
+            async with session.head(url):
+                pass
+        except Exception:
+            pass
+    
+    await asyncio.gather(*(touch(url) for url in urls))
+
+def _azure_request(prompt):
+    """Build the Azure OpenAI (url, payload, headers) request, or return an error"""
     api_key = os.getenv('AZURE_OPENAI_API_KEY')
     endpoint = os.getenv('AZURE_OPENAI_ENDPOINT') 
     api_version = os.getenv('AZURE_OPENAI_API_VERSION', '2023-12-01-preview')
@@ -57,7 +113,7 @@ async def test_azure_openai_api(prompt):
             }
         ],
         "max_tokens": 500,
-        "temperature": 0.7,
+        "temperature": PROVIDER_TEMPERATURES['azure'],
         "top_p": 0.95,
         "frequency_penalty": 0,
         "presence_penalty": 0,
@@ -69,23 +125,42 @@ async def test_azure_openai_api(prompt):
         "api-key": api_key
     }
     
+    return (url, payload, headers), None
+
+async def test_azure_openai_api(prompt):
+    """Test live Azure OpenAI API call"""
+    request, error = _azure_request(prompt)
+    if error:
+        return None, error
+    url, payload, headers = request
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers, timeout=30) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'choices' in data and len(data['choices']) > 0:
-                        return data['choices'][0]['message']['content'], None
-                    else:
-                        return None, "No response content"
+        session = await get_session()
+        async with AZURE_SEM, AZURE_LIMIT, session.post(url, json=payload, headers=headers) as response:
+            if response.status == 200:
+                data = await response.json(loads=json_loads)
+                if 'choices' in data and len(data['choices']) > 0:
+                    return data['choices'][0]['message']['content'], None
                 else:
-                    error_text = await response.text()
-                    return None, f"HTTP {response.status}: {error_text}"
+                    return None, "No response content"
+            else:
+                error_text = await response.text()
+                return None, f"HTTP {response.status}: {error_text}"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
-async def test_perplexity_api(prompt):
-    """Test live Perplexity API call with corrected endpoint"""
+# Only the fields Perplexity needs; images, related questions and penalties add server-side work
+_PPLX_BASE_PAYLOAD = {
+    "model": "sonar",
+    "max_tokens": 300,
+    "temperature": PROVIDER_TEMPERATURES['perplexity'],
+    "top_p": 0.9,
+    "search_recency_filter": "month",
+    "stream": False
+}
+
+def _perplexity_request(prompt):
+    """Build the Perplexity (url, payload, headers) request, or return an error"""
     api_key = os.getenv('PERPLEXITY_API_KEY')
     if not api_key or api_key == 'placeholder-for-local-first-mode':
         return None, "No Perplexity API key configured"
@@ -93,23 +168,8 @@ async def test_perplexity_api(prompt):
     url = "https://api.perplexity.ai/chat/completions"
     
     payload = {
-        "model": "sonar",
-        "messages": [
-            {
-                "role": "user", 
-                "content": prompt
-            }
-        ],
-        "max_tokens": 300,
-        "temperature": 0.2,
-        "top_p": 0.9,
-        "return_images": False,
-        "return_related_questions": False,
-        "search_recency_filter": "month",
-        "top_k": 0,
-        "stream": False,
-        "presence_penalty": 0,
-        "frequency_penalty": 1
+        **_PPLX_BASE_PAYLOAD,
+        "messages": [{"role": "user", "content": prompt}]
     }
     
     headers = {
@@ -117,21 +177,69 @@ async def test_perplexity_api(prompt):
         "Content-Type": "application/json"
     }
     
+    return (url, payload, headers), None
+
+async def test_perplexity_api(prompt):
+    """Test live Perplexity API call with corrected endpoint"""
+    request, error = _perplexity_request(prompt)
+    if error:
+        return None, error
+    url, payload, headers = request
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers, timeout=30) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'choices' in data and len(data['choices']) > 0:
-                        return data['choices'][0]['message']['content'], None
-                    else:
-                        return None, "No response content"
+        session = await get_session()
+        async with PPLX_SEM, PPLX_LIMIT, session.post(url, json=payload, headers=headers) as response:
+            if response.status == 200:
+                data = await response.json(loads=json_loads)
+                if 'choices' in data and len(data['choices']) > 0:
+                    return data['choices'][0]['message']['content'], None
                 else:
-                    error_text = await response.text()
-                    return None, f"HTTP {response.status}: {error_text}"
+                    return None, "No response content"
+            else:
+                error_text = await response.text()
+                return None, f"HTTP {response.status}: {error_text}"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
+async def _stream_chat_completion(url, payload, headers, semaphore, limiter):
+    """Yield content deltas from an OpenAI-style server-sent event stream"""
+    session = await get_session()
+    async with semaphore, limiter, session.post(url, json={**payload, "stream": True}, headers=headers) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise RuntimeError(f"HTTP {response.status}: {error_text}")
+        
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            choices = json_loads(data).get('choices')
+            if choices:
+                content = (choices[0].get('delta') or {}).get('content')
+                if content:
+                    yield content
+
+async def stream_azure_openai_api(prompt):
+    """Stream an Azure OpenAI answer chunk by chunk (raises RuntimeError on failure)"""
+    request, error = _azure_request(prompt)
+    if error:
+        raise RuntimeError(error)
+    url, payload, headers = request
+    async for chunk in _stream_chat_completion(url, payload, headers, AZURE_SEM, AZURE_LIMIT):
+        yield chunk
+
+async def stream_perplexity_api(prompt):
+    """Stream a Perplexity answer chunk by chunk (raises RuntimeError on failure)"""
+    request, error = _perplexity_request(prompt)
+    if error:
+        raise RuntimeError(error)
+    url, payload, headers = request
+    async for chunk in _stream_chat_completion(url, payload, headers, PPLX_SEM, PPLX_LIMIT):
+        yield chunk
+
 async def test_gemini_api(prompt):
     """Test live Gemini API call"""
     api_key = os.getenv('GEMINI_API_KEY')
@@ -147,19 +255,21 @@ async def test_gemini_api(prompt):
             }]
         }]
     }
+    if PROVIDER_TEMPERATURES['gemini'] is not None:
+        payload["generationConfig"] = {"temperature": PROVIDER_TEMPERATURES['gemini']}
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, timeout=30) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'candidates' in data and len(data['candidates']) > 0:
-                        return data['candidates'][0]['content']['parts'][0]['text'], None
-                    else:
-                        return None, "No response content"
+        session = await get_session()
+        async with GEMINI_SEM, GEMINI_LIMIT, session.post(url, json=payload) as response:
+            if response.status == 200:
+                data = await response.json(loads=json_loads)
+                if 'candidates' in data and len(data['candidates']) > 0:
+                    return data['candidates'][0]['content']['parts'][0]['text'], None
                 else:
-                    error_text = await response.text()
-                    return None, f"HTTP {response.status}: {error_text}"
+                    return None, "No response content"
+            else:
+                error_text = await response.text()
+                return None, f"HTTP {response.status}: {error_text}"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
@@ -174,14 +284,13 @@ async def azure_continuous_test():
     if not load_env():
         return
     
-    # Import ENTAERA framework
+    if _FRAMEWORK_ERROR is not None:
+        print(f"❌ Framework error: {_FRAMEWORK_ERROR}")
+        return
+    
+    print("\n✅ ENTAERA framework loaded")
+    
     try:
-        from entaera.core.conversation import ConversationManager, Message, MessageRole
-        from entaera.core.logger import LoggerManager
-        from entaera.utils.api_router import SmartAPIRouter, TaskComplexity
-        
-        print("\n✅ ENTAERA framework loaded")
-        
         # Initialize components
         conv_manager = ConversationManager()
         conversation = conv_manager.create_conversation("Azure Test Session")
@@ -283,10 +392,6 @@ async def azure_continuous_test():
         else:
             print(f"❌ {scenario['api'].upper()} API ERROR:")
             print(f"💥 {error}")
-        
-        if i < len(test_scenarios):
-            print(f"\n⏳ Next test in 2 seconds...")
-            await asyncio.sleep(2)
     
     # Final status report
     messages = conversation.get_context_messages()
@@ -330,6 +435,8 @@ async def azure_continuous_test():
         print(f"\n🚀 CONGRATULATIONS! Azure OpenAI + ENTAERA = READY!")
     else:
         print(f"\n⏳ Add Azure credentials and run: python azure_continuous_test.py")
+    
+    await close_session()
 
 if __name__ == "__main__":
     asyncio.run(azure_continuous_test())
\ No newline at end of file
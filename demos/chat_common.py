@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+💬 Shared helpers for the local chat demos
+=========================================
+Input handling, .env loading and prompt formatting used by every chat loop
+"""
+
+import os
+import re
+from pathlib import Path
+
+try:
+    from prompt_toolkit import PromptSession
+    PROMPT_TOOLKIT_AVAILABLE = True
+except ImportError:
+    PROMPT_TOOLKIT_AVAILABLE = False
+    try:
+        import readline  # noqa: F401 - gives input() line editing and history
+    except ImportError:
+        pass
+
+# Banner separators, built once and reused by every print
+TITLE_SEP = "=" * 40
+DASH_SEP = "-" * 40
+
+# Inputs that end the chat
+EXIT_COMMANDS = frozenset({'quit', 'exit', 'bye'})
+
+# KEY=value lines of .env.local_ai (comments skipped), matched in a single scan
+_ENV_RE = re.compile(r'(?m)^(?!#)([^=\s]+)=(.*?)\s*$')
+
+# Streamed tokens are written in batches: once this many bytes are pending or a sentence ends
+STREAM_FLUSH_BYTES = 64
+STREAM_FLUSH_ENDINGS = ('\n', '.', '!', '?')
+
+# Prompt line prefix per message role; other roles are left out of the prompt
+_ROLE_PREFIXES = {"system": "[SYSTEM]: ", "user": "Human: ", "assistant": "Assistant: "}
+
+# Formatted prompt lines keyed by message id, so each message is formatted once
+_FORMATTED = {}
+
+def load_env_file(path='.env.local_ai'):
+    """Copy the KEY=value lines of an env file into os.environ, if the file exists"""
+    env_file = Path(path)
+    if env_file.exists():
+        os.environ.update(_ENV_RE.findall(env_file.read_text()))
+
+def input_reader():
+    """Return the line reader for the chat loop (prompt_toolkit when installed)"""
+    return PromptSession().prompt if PROMPT_TOOLKIT_AVAILABLE else input
+
+def format_message(msg):
+    """Return the prompt line for a message ('' for roles not sent to the model)"""
+    line = _FORMATTED.get(msg.id)
+    if line is None:
+        prefix = _ROLE_PREFIXES.get(msg.role.value)
+        line = _FORMATTED[msg.id] = f"{prefix}{msg.content}" if prefix else ""
+    return line
+
+def prune_formatted(window):
+    """Drop cached lines for messages that have left the context window"""
+    for msg_id in _FORMATTED.keys() - {msg.id for msg in window}:
+        del _FORMATTED[msg_id]
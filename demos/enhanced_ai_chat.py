@@ -96,12 +96,12 @@ def enhanced_ai_chat():
                 
                 # Generate AI response
                 print("🤖 AI: ", end="", flush=True)
-                ai_response = ai_generator.generate_response(user_input, context)
-                
-                # Clean up the response display
-                if ai_response.startswith("✅") or ai_response.startswith("❌"):
-                    print()  # New line if there were status indicators
-                print(ai_response)
+                chunks = []
+                for piece in ai_generator.stream_response(user_input, context):
+                    print(piece, end="", flush=True)
+                    chunks.append(piece)
+                print()
+                ai_response = "".join(chunks).strip()
                 
                 # Add AI response to conversation
                 ai_message = Message(role=MessageRole.ASSISTANT, content=ai_response)
@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 
 import asyncio
+import hashlib
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Import the API functions that we know work
-from azure_continuous_test import test_azure_openai_api, test_gemini_api, test_perplexity_api
+from azure_continuous_test import (
+    test_azure_openai_api, test_gemini_api, test_perplexity_api, close_session, warm_up_connections,
+    stream_azure_openai_api, stream_perplexity_api, PROVIDER_TEMPERATURES
+)
 
 # Context awareness for ENTAERA project
 ENTAERA_CONTEXT = """
@@ -24,33 +32,136 @@ ENTAERA is an AI framework/project created by SAURABH PAREEK that provides:
 - Current user: Saurabh Pareek (the creator)
 """
 
-def detect_context_aware_queries(user_input):
-    """Detect queries that need context awareness"""
-    input_lower = user_input.lower()
+# In-process response cache for repeated prompts: (provider, digest) -> (expires_at, result)
+_RESP_CACHE = OrderedDict()
+_RESP_CACHE_MAX = 512
+_CACHE_TTL = float(os.getenv('CACHE_TTL', '3600'))
+# Perplexity answers are time-sensitive (month recency search), so expire them quickly
+_PROVIDER_TTL = {'perplexity': min(_CACHE_TTL, 600.0)}
+
+def _cache_get(key):
+    """Return a cached (response, error) result, or None if missing or expired"""
+    cached = _RESP_CACHE.get(key)
+    if cached is None:
+        return None
+    expires_at, result = cached
+    if expires_at <= time.monotonic():
+        del _RESP_CACHE[key]
+        return None
+    _RESP_CACHE.move_to_end(key)
+    return result
+
+def _cache_put(key, provider, prompt, response, error, temperature):
+    # Only deterministic (temperature 0) answers repeat for the same prompt; sampled
+    # ones are never cached. Bad answers are skipped so a retry can fetch a better one
+    if temperature == 0 and not error and not detect_bad_response(response, prompt):
+        _RESP_CACHE[key] = (time.monotonic() + _PROVIDER_TTL.get(provider, _CACHE_TTL), (response, None))
+        if len(_RESP_CACHE) > _RESP_CACHE_MAX:
+            _RESP_CACHE.popitem(last=False)
+
+async def cached_call(provider, api_call, prompt):
+    """Call a provider API, serving identical recent prompts from the cache"""
+    key = (provider, hashlib.blake2b(prompt.encode(), digest_size=16).digest())
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     
-    # ENTAERA project questions
-    if any(phrase in input_lower for phrase in ['entaera', 'this project', 'my project', 'our project', 'kata', 'who created', 'developer', 'author', 'who made', 'creator']):
-        return 'project_context'
+    response, error = await api_call(prompt)
+    _cache_put(key, provider, prompt, response, error, PROVIDER_TEMPERATURES.get(provider))
+    return response, error
+
+async def stream_reply(provider, stream_call, prompt):
+    """Print a provider's answer as it streams in and return (response, error)"""
+    key = (provider, hashlib.blake2b(prompt.encode(), digest_size=16).digest())
+    cached = _cache_get(key)
+    if cached is not None:
+        print(f"🤖 AI: {cached[0]}")
+        return cached
     
-    # Local AI switching requests
-    if any(phrase in input_lower for phrase in ['switch to local', 'use local', 'local ai', 'offline mode']):
-        return 'local_switch'
+    chunks = []
+    try:
+        async for chunk in stream_call(prompt):
+            if not chunks:
+                print("🤖 AI: ", end="", flush=True)
+            chunks.append(chunk)
+            print(chunk, end="", flush=True)
+    except Exception as e:
+        if chunks:
+            print()
+        return None, str(e)
     
-    # API/technical questions about the system
-    if any(phrase in input_lower for phrase in ['switch api', 'use azure', 'use gemini', 'use perplexity', 'routing']):
-        return 'api_switch'
+    if not chunks:
+        return None, "No response content"
     
+    print()
+    response = "".join(chunks)
+    _cache_put(key, provider, prompt, response, None, PROVIDER_TEMPERATURES.get(provider))
+    return response, None
+
+# Routing keyword buckets in priority order (highest first)
+_ROUTING_BUCKETS = (
+    # ENTAERA project questions
+    ('project_context', (
+        'entaera', 'this project', 'my project', 'our project', 'kata', 'who created',
+        'developer', 'author', 'who made', 'creator'
+    )),
+    # Local AI switching requests
+    ('local_switch', ('switch to local', 'use local', 'local ai', 'offline mode')),
+    # API/technical questions about the system
+    ('api_switch', ('switch api', 'use azure', 'use gemini', 'use perplexity', 'routing')),
     # Personal greetings/questions
-    if any(phrase in input_lower for phrase in ['who am i', 'my name', 'what is my name', 'introduce me']):
-        return 'personal_context'
+    ('personal_context', ('who am i', 'my name', 'what is my name', 'introduce me')),
+    # Financial/Current data
+    ('current_data', (
+        'research', 'news', 'latest', 'current', 'today', 'recent', 'what are', 'find me', 'search',
+        'net worth', 'networth', 'worth', 'price', 'value', 'cost', 'stock', 'market', 'bitcoin',
+        'elon', 'musk', 'tesla', 'billionaire', 'amazon', 'apple', 'google', 'microsoft',
+        'weather', 'temperature', 'forecast', 'when is', 'what time', 'schedule', 'calendar',
+        'arxiv', 'paper', 'study', 'breakthrough', 'discovery', 'published'
+    )),
+    # Coding/Technical
+    ('code', (
+        'code', 'program', 'function', 'algorithm', 'debug', 'python', 'javascript',
+        'api', 'database', 'sql', 'json', 'html', 'css', 'react', 'node', 'framework',
+        'error', 'bug', 'fix', 'implement', 'create', 'build', 'develop'
+    )),
+    # Complex questions
+    ('complex', (
+        'explain', 'how does', 'why does', 'what happens', 'tell me about', 'describe',
+        'analyze', 'compare', 'difference', 'similar', 'relationship'
+    )),
+)
+_CONTEXT_BUCKETS = ('project_context', 'local_switch', 'api_switch', 'personal_context')
+
+# All buckets fused into one pattern: a zero-width lookahead tries every bucket at
+# each position in priority order, so a single scan records the highest-priority
+# bucket starting at every position - enough to pick the winning bucket overall
+_ROUTING_RE = re.compile("(?=" + "|".join(
+    f"(?P<{bucket}>" + "|".join(re.escape(keyword) for keyword in keywords) + ")"
+    for bucket, keywords in _ROUTING_BUCKETS
+) + ")")
+
+def classify_input(input_lower):
+    """Return the routing buckets matched in the lowercased input (one regex pass)"""
+    return {match.lastgroup for match in _ROUTING_RE.finditer(input_lower)}
+
+def detect_context_aware_queries(user_input, input_lower=None, hits=None):
+    """Detect queries that need context awareness"""
+    if hits is None:
+        hits = classify_input(user_input.lower() if input_lower is None else input_lower)
     
+    for bucket in _CONTEXT_BUCKETS:
+        if bucket in hits:
+            return bucket
     return None
 
 async def smart_route_and_call(user_input):
     """Enhanced smart routing with context awareness"""
+    # One pass over the input classifies it against every keyword bucket
+    hits = classify_input(user_input.lower())
     
     # Check for context-aware queries first
-    context_type = detect_context_aware_queries(user_input)
+    context_type = detect_context_aware_queries(user_input, hits=hits)
     
     if context_type == 'project_context':
         print("🧠 ENTAERA Smart Routing: Project context → Azure OpenAI (understands technical projects)")
@@ -60,7 +171,7 @@ async def smart_route_and_call(user_input):
 User question: {user_input}
 
 Please answer based on the context that ENTAERA is the AI framework project created by Saurabh Pareek, and you are currently talking to Saurabh Pareek (the creator). Be personal and acknowledge him as the creator when relevant."""
-        return await test_azure_openai_api(enhanced_prompt)
+        return await cached_call('azure', test_azure_openai_api, enhanced_prompt)
     
     elif context_type == 'local_switch':
         print("🧠 ENTAERA Smart Routing: Local AI request → Direct explanation")
@@ -75,37 +186,24 @@ Please answer based on the context that ENTAERA is the AI framework project crea
         return ("You are Saurabh Pareek, the creator and developer of the ENTAERA AI framework. You built this advanced multi-API routing system that intelligently handles Azure OpenAI, Gemini, Perplexity, and local AI models.", None)
     
     # Financial/Current data → Perplexity (expanded keywords)
-    if any(word in user_input.lower() for word in [
-        'research', 'news', 'latest', 'current', 'today', 'recent', 'what are', 'find me', 'search', 
-        'net worth', 'networth', 'worth', 'price', 'value', 'cost', 'stock', 'market', 'bitcoin',
-        'elon', 'musk', 'tesla', 'billionaire', 'amazon', 'apple', 'google', 'microsoft',
-        'weather', 'temperature', 'forecast', 'when is', 'what time', 'schedule', 'calendar',
-        'arxiv', 'paper', 'study', 'research', 'breakthrough', 'discovery', 'published'
-    ]):
+    if 'current_data' in hits:
         print("🧠 ENTAERA Smart Routing: Current data needed → Perplexity (real-time web search)")
-        return await test_perplexity_api(user_input)
+        return await cached_call('perplexity', test_perplexity_api, user_input)
     
     # Coding/Technical → Azure OpenAI
-    elif any(word in user_input.lower() for word in [
-        'code', 'program', 'function', 'algorithm', 'debug', 'python', 'javascript', 
-        'api', 'database', 'sql', 'json', 'html', 'css', 'react', 'node', 'framework',
-        'error', 'bug', 'fix', 'implement', 'create', 'build', 'develop'
-    ]):
+    elif 'code' in hits:
         print("🧠 ENTAERA Smart Routing: Technical task → Azure OpenAI (advanced reasoning)")
-        return await test_azure_openai_api(user_input)
+        return await cached_call('azure', test_azure_openai_api, user_input)
     
     # Complex questions → Azure OpenAI
-    elif len(user_input) > 80 or any(phrase in user_input.lower() for phrase in [
-        'explain', 'how does', 'why does', 'what happens', 'tell me about', 'describe',
-        'analyze', 'compare', 'difference', 'similar', 'relationship'
-    ]):
+    elif len(user_input) > 80 or 'complex' in hits:
         print("🧠 ENTAERA Smart Routing: Complex query → Azure OpenAI (detailed analysis)")
-        return await test_azure_openai_api(user_input)
+        return await cached_call('azure', test_azure_openai_api, user_input)
     
     # Simple/Quick questions → Gemini (but avoid anything that might need current data)
     else:
         print("🧠 ENTAERA Smart Routing: Simple task → Gemini (fast response)")
-        return await test_gemini_api(user_input)
+        return await cached_call('gemini', test_gemini_api, user_input)
 
 def detect_bad_response(response, user_input):
     """Detect responses that are outdated, unhelpful, or wrong"""
@@ -137,6 +235,61 @@ def detect_bad_response(response, user_input):
     
     return False
 
+async def race_better_response(user_input, timeout=30):
+    """Query Perplexity and Azure in parallel, returning (label, response) for the first good answer
+    
+    Only used once a response has been flagged by detect_bad_response, so the
+    normal path never pays for two requests. An Azure answer is still accepted
+    as a last resort when neither provider gives a clean one.
+    """
+    tasks = {
+        asyncio.create_task(test_perplexity_api(user_input)): 'corrected',
+        asyncio.create_task(test_azure_openai_api(user_input)): 'Azure',
+    }
+    pending = set(tasks)
+    fallback = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                response, error = task.result()
+                if error or not response:
+                    continue
+                if not detect_bad_response(response, user_input):
+                    return tasks[task], response
+                if tasks[task] == 'Azure':
+                    fallback = ('Azure', response)
+        return fallback
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def ainput(prompt=""):
+    """Read a line from stdin on a daemon thread so the event loop keeps running"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read_line():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            callback = (deliver, future.set_exception, e)
+        else:
+            callback = (deliver, future.set_result, line)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
+
 async def interactive_chat():
     """Enhanced interactive chat with comprehensive edge case handling"""
     
@@ -176,10 +329,13 @@ async def interactive_chat():
     
     message_count = 0
     
+    # Warm provider connections in the background while the user types
+    warm_up_task = asyncio.create_task(warm_up_connections())
+    
     while True:
         try:
             # Get user input
-            user_input = input("👤 You: ").strip()
+            user_input = (await ainput("👤 You: ")).strip()
             
             # Check for exit commands
             if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
@@ -191,21 +347,26 @@ async def interactive_chat():
             message_count += 1
             print()
             
+            # Forced Azure/Perplexity answers are printed while they stream in
+            streamed = False
+            
             # Check for forced API selection
             if user_input.startswith('azure:'):
                 prompt = user_input[6:].strip()
                 print("🔗 Forced Azure OpenAI call...")
-                response, error = await test_azure_openai_api(prompt)
+                response, error = await stream_reply('azure', stream_azure_openai_api, prompt)
+                streamed = True
                 
             elif user_input.startswith('gemini:'):
                 prompt = user_input[7:].strip()
                 print("🔗 Forced Gemini call...")
-                response, error = await test_gemini_api(prompt)
+                response, error = await cached_call('gemini', test_gemini_api, prompt)
                 
             elif user_input.startswith('perplexity:'):
                 prompt = user_input[11:].strip()
                 print("🔗 Forced Perplexity call...")
-                response, error = await test_perplexity_api(prompt)
+                response, error = await stream_reply('perplexity', stream_perplexity_api, prompt)
+                streamed = True
                 
             else:
                 # Use enhanced smart routing
@@ -232,21 +393,20 @@ async def interactive_chat():
             else:
                 # Check if response is bad/outdated
                 if detect_bad_response(response, user_input):
-                    print(f"🤖 AI (detected issues): {response}")
+                    if streamed:
+                        print("🤖 AI (detected issues in the answer above)")
+                    else:
+                        print(f"🤖 AI (detected issues): {response}")
                     print("\n🔄 Getting better response...")
                     
-                    # Try Perplexity for current data
-                    better_response, better_error = await test_perplexity_api(user_input)
-                    if not better_error and better_response and not detect_bad_response(better_response, user_input):
-                        print(f"🤖 AI (corrected): {better_response}")
+                    # Ask Perplexity and Azure at once and keep the first good answer
+                    better = await race_better_response(user_input)
+                    if better:
+                        label, better_response = better
+                        print(f"🤖 AI ({label}): {better_response}")
                     else:
-                        # Try Azure for better understanding
-                        better_response, better_error = await test_azure_openai_api(user_input)
-                        if not better_error and better_response:
-                            print(f"🤖 AI (Azure): {better_response}")
-                        else:
-                            print("🤖 AI: Unable to provide a satisfactory response.")
-                else:
+                        print("🤖 AI: Unable to provide a satisfactory response.")
+                elif not streamed:
                     print(f"🤖 AI: {response}")
             
             print()
@@ -262,6 +422,9 @@ async def interactive_chat():
     print("\n🌟 ENTAERA Enhanced Chat Complete!")
     print(f"📊 Total messages: {message_count}")
     print("🚀 No fluff, only accuracy!")
+    
+    warm_up_task.cancel()
+    await close_session()
 
 if __name__ == "__main__":
     try:
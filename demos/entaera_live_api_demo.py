@@ -8,25 +8,60 @@ REAL API calls with your Gemini and Perplexity keys!
 import os
 import sys
 import asyncio
-import json
-import aiohttp
+import re
+import httpx
 from datetime import datetime
 
 # Add src to path
 sys.path.append('src')
 
-def load_env():
-    """Load environment variables from .env file"""
-    try:
-        with open('.env', 'r') as f:
-            for line in f:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    except FileNotFoundError:
-        print("❌ .env file not found!")
-        return False
-    return True
+# Import ENTAERA framework once at module load
+try:
+    from entaera.core.conversation import ConversationManager, Message, MessageRole
+    from entaera.core.logger import LoggerManager
+    from entaera.utils.api_router import SmartAPIRouter, TaskComplexity
+    _FRAMEWORK_ERROR = None
+except ImportError as e:
+    _FRAMEWORK_ERROR = e
+
+from api_common import (
+    load_env, json_dump_bytes, json_loads,
+    GEMINI_LIMIT, PPLX_LIMIT, GEMINI_SEM, PPLX_SEM
+)
+
+# HTTP/2 needs the optional h2 package; without it httpx speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Shared HTTP client so every API call reuses pooled keep-alive connections and,
+# over HTTP/2, concurrent requests to the same host multiplex on one TLS stream
+_CLIENT: httpx.AsyncClient | None = None
+
+async def get_client():
+    """Return the shared httpx client, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        max_inflight = int(os.getenv('MAX_INFLIGHT', '16'))
+        _CLIENT = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_inflight,
+                max_keepalive_connections=max_inflight,
+                keepalive_expiry=75
+            ),
+            timeout=httpx.Timeout(30.0)
+        )
+    return _CLIENT
+
+async def close_client():
+    """Close the shared httpx client"""
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
 
 async def test_gemini_api(prompt):
     """Test live Gemini API call"""
@@ -45,22 +80,41 @@ async def test_gemini_api(prompt):
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, timeout=30) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'candidates' in data and len(data['candidates']) > 0:
-                        return data['candidates'][0]['content']['parts'][0]['text'], None
-                    else:
-                        return None, "No response content"
-                else:
-                    error_text = await response.text()
-                    return None, f"HTTP {response.status}: {error_text}"
+        client = await get_client()
+        async with GEMINI_SEM, GEMINI_LIMIT:
+            response = await client.post(
+                url, content=json_dump_bytes(payload), headers={"Content-Type": "application/json"}
+            )
+        if response.status_code == 200:
+            data = json_loads(response.content)
+            if 'candidates' in data and len(data['candidates']) > 0:
+                return data['candidates'][0]['content']['parts'][0]['text'], None
+            else:
+                return None, "No response content"
+        else:
+            return None, f"HTTP {response.status_code}: {response.text}"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
-async def test_perplexity_api(prompt):
-    """Test live Perplexity API call"""
+_PPLX_SYSTEM_PROMPT = "You are ENTAERA AI assistant with access to real-time web information."
+_PPLX_BATCH_SYSTEM_PROMPT = (
+    _PPLX_SYSTEM_PROMPT
+    + " Answer each of the following questions separately, prefixing each answer with '### QN:'"
+    " where N is the question number."
+)
+# Only the fields Perplexity needs; the domain filter and penalties add server-side work
+_PPLX_BASE_PAYLOAD = {
+    "model": "sonar",
+    "max_tokens": 384,
+    "temperature": 0.2,
+    "top_p": 0.9,
+    "search_recency_filter": "month",
+    "stream": False
+}
+_BATCH_ANSWER_RE = re.compile(r"^[ \t]*###\s*Q(\d+):", re.MULTILINE)
+
+async def perplexity_request(system_prompt, content, max_tokens=384, recency_filter=True):
+    """Send one chat completion request to Perplexity (recency_filter=False searches without the month limit)"""
     api_key = os.getenv('PERPLEXITY_API_KEY')
     if not api_key or api_key == 'placeholder-for-local-first-mode':
         return None, "No Perplexity API key configured"
@@ -68,29 +122,15 @@ async def test_perplexity_api(prompt):
     url = "https://api.perplexity.ai/chat/completions"
     
     payload = {
-        "model": "sonar",
+        **_PPLX_BASE_PAYLOAD,
+        "max_tokens": max_tokens,
         "messages": [
-            {
-                "role": "system",
-                "content": "You are ENTAERA AI assistant with access to real-time web information."
-            },
-            {
-                "role": "user", 
-                "content": prompt
-            }
-        ],
-        "max_tokens": 512,
-        "temperature": 0.2,
-        "top_p": 0.9,
-        "search_domain_filter": ["perplexity.ai"],
-        "return_images": False,
-        "return_related_questions": False,
-        "search_recency_filter": "month",
-        "top_k": 0,
-        "stream": False,
-        "presence_penalty": 0,
-        "frequency_penalty": 1
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": content}
+        ]
     }
+    if not recency_filter:
+        del payload["search_recency_filter"]
     
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -98,20 +138,124 @@ async def test_perplexity_api(prompt):
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers, timeout=30) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'choices' in data and len(data['choices']) > 0:
-                        return data['choices'][0]['message']['content'], None
-                    else:
-                        return None, "No response content"
-                else:
-                    error_text = await response.text()
-                    return None, f"HTTP {response.status}: {error_text}"
+        client = await get_client()
+        async with PPLX_SEM, PPLX_LIMIT:
+            response = await client.post(url, content=json_dump_bytes(payload), headers=headers)
+        if response.status_code == 200:
+            data = json_loads(response.content)
+            if 'choices' in data and len(data['choices']) > 0:
+                return data['choices'][0]['message']['content'], None
+            else:
+                return None, "No response content"
+        else:
+            return None, f"HTTP {response.status_code}: {response.text}"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
+def split_batched_answers(text, count):
+    """Split a '### QN:' formatted batch answer, or return None if any answer is missing"""
+    parts = _BATCH_ANSWER_RE.split(text)
+    answers = {}
+    for number, answer in zip(parts[1::2], parts[2::2]):
+        answers[int(number)] = answer.strip()
+    if not all(answers.get(n) for n in range(1, count + 1)):
+        return None
+    return [answers[n] for n in range(1, count + 1)]
+
+class PerplexityBatcher:
+    """Coalesce Perplexity prompts submitted within a short window into one request
+    
+    Only for prompts marked as not time-sensitive: batches are searched without
+    the recency filter, and time-sensitive prompts always get their own request.
+    """
+    
+    def __init__(self, max_batch=4, max_wait_ms=25):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+    
+    async def submit(self, prompt):
+        """Queue a prompt and wait for its (response, error) result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((prompt, future))
+        
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Dispatch everything queued so far as one batch"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch):
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if len(prompts) == 1:
+                results = [await perplexity_request(_PPLX_SYSTEM_PROMPT, prompts[0], recency_filter=False)]
+            else:
+                results = await self._ask_batch(prompts)
+        except Exception as e:
+            results = [(None, f"Error: {str(e)}")] * len(prompts)
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _ask_batch(self, prompts):
+        questions = "\n".join(f"Q{n}: {prompt}" for n, prompt in enumerate(prompts, 1))
+        response, error = await perplexity_request(
+            _PPLX_BATCH_SYSTEM_PROMPT, questions,
+            max_tokens=_PPLX_BASE_PAYLOAD['max_tokens'] * len(prompts), recency_filter=False
+        )
+        if error:
+            return [(None, error)] * len(prompts)
+        
+        answers = split_batched_answers(response, len(prompts))
+        if answers is None:
+            # Model ignored the answer format - fall back to one request per prompt
+            return await asyncio.gather(
+                *(perplexity_request(_PPLX_SYSTEM_PROMPT, prompt, recency_filter=False) for prompt in prompts)
+            )
+        return [(answer, None) for answer in answers]
+
+_PPLX_BATCHER = PerplexityBatcher()
+
+async def test_perplexity_api(prompt, time_sensitive=True):
+    """Test live Perplexity API call
+    
+    Time-sensitive prompts (the default) go out alone with the month recency
+    filter; the rest are batched with other prompts sent at the same time.
+    """
+    api_key = os.getenv('PERPLEXITY_API_KEY')
+    if not api_key or api_key == 'placeholder-for-local-first-mode':
+        return None, "No Perplexity API key configured"
+    
+    if time_sensitive:
+        return await perplexity_request(_PPLX_SYSTEM_PROMPT, prompt)
+    return await _PPLX_BATCHER.submit(prompt)
+
+async def call_api(api, prompt, time_sensitive=True):
+    """Dispatch a prompt to the named live API"""
+    if api == 'gemini':
+        return await test_gemini_api(prompt)
+    elif api == 'perplexity':
+        return await test_perplexity_api(prompt, time_sensitive)
+    return None, "Unknown API"
+
 async def live_api_demo():
     """Run live API demonstration"""
     print("🎪 ENTAERA LIVE API DEMO")
@@ -123,14 +267,13 @@ async def live_api_demo():
     if not load_env():
         return
     
-    # Import ENTAERA framework
+    if _FRAMEWORK_ERROR is not None:
+        print(f"❌ Framework error: {_FRAMEWORK_ERROR}")
+        return
+    
+    print("\n✅ ENTAERA framework loaded")
+    
     try:
-        from entaera.core.conversation import ConversationManager, Message, MessageRole
-        from entaera.core.logger import LoggerManager
-        from entaera.utils.api_router import SmartAPIRouter, TaskComplexity
-        
-        print("\n✅ ENTAERA framework loaded")
-        
         # Initialize components
         conv_manager = ConversationManager()
         conversation = conv_manager.create_conversation("Live API Demo")
@@ -166,7 +309,29 @@ async def live_api_demo():
     print(f"\n🚀 Starting Live API Tests...")
     print("=" * 50)
     
-    for i, scenario in enumerate(test_scenarios, 1):
+    # Fire all scenarios at once - they are independent network calls. The
+    # routing decisions are display-only, so compute them while the calls run.
+    print(f"\n🔗 Making {len(test_scenarios)} LIVE API calls concurrently...")
+    api_calls = asyncio.gather(
+        *(
+            call_api(scenario['api'], scenario['prompt'], scenario.get('time_sensitive', True))
+            for scenario in test_scenarios
+        ),
+        return_exceptions=True
+    )
+    routing = asyncio.gather(*(
+        router.route_request(
+            task_type=f"live_test_{i}",
+            content=scenario['prompt'],
+            complexity=TaskComplexity.MODERATE
+        )
+        for i, scenario in enumerate(test_scenarios, 1)
+    ))
+    routing_decisions, results = await asyncio.gather(routing, api_calls)
+    
+    for i, (scenario, routing_decision, result) in enumerate(
+        zip(test_scenarios, routing_decisions, results), 1
+    ):
         print(f"\n📝 Test {i}: {scenario['description']}")
         print("-" * 40)
         print(f"👤 User: {scenario['prompt']}")
@@ -178,30 +343,18 @@ async def live_api_demo():
         )
         conversation.add_message(user_message)
         
-        # Get routing decision
-        routing_decision = await router.route_request(
-            task_type=f"live_test_{i}",
-            content=scenario['prompt'],
-            complexity=TaskComplexity.MODERATE
-        )
-        
         print(f"\n🧠 ENTAERA Routing:")
         print(f"   ├── Recommended: {routing_decision.provider.value}")
         print(f"   ├── Model: {routing_decision.model}")
         print(f"   └── Reasoning: {routing_decision.reasoning}")
         
-        # Make actual API call
-        print(f"\n🔗 Making LIVE {scenario['api'].upper()} API call...")
-        
-        if scenario['api'] == 'gemini':
-            response, error = await test_gemini_api(scenario['prompt'])
-        elif scenario['api'] == 'perplexity':
-            response, error = await test_perplexity_api(scenario['prompt'])
+        if isinstance(result, Exception):
+            response, error = None, f"Error: {str(result)}"
         else:
-            response, error = None, "Unknown API"
+            response, error = result
         
         if response:
-            print(f"✅ {scenario['api'].upper()} API Response:")
+            print(f"\n✅ {scenario['api'].upper()} API Response:")
             print(f"🤖 {response}")
             
             # Add AI response to conversation
@@ -213,12 +366,8 @@ async def live_api_demo():
             
             print(f"📊 Response length: {len(response)} characters")
         else:
-            print(f"❌ {scenario['api'].upper()} API Error:")
+            print(f"\n❌ {scenario['api'].upper()} API Error:")
             print(f"💥 {error}")
-        
-        if i < len(test_scenarios):
-            print(f"\n⏳ Next test in 3 seconds...")
-            await asyncio.sleep(3)
     
     # Final statistics
     messages = conversation.get_context_messages()
@@ -243,6 +392,8 @@ async def live_api_demo():
     print(f"   └── Perplexity: {'✅ Active' if perplexity_key and perplexity_key != 'placeholder-for-local-first-mode' else '❌ Not set'}")
     
     print(f"\n🚀 ENTAERA Live API Integration: OPERATIONAL!")
+    
+    await close_client()
 
 if __name__ == "__main__":
     asyncio.run(live_api_demo())
\ No newline at end of file
@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import the API functions that we know work
-from azure_continuous_test import test_azure_openai_api, test_gemini_api, test_perplexity_api
+from azure_continuous_test import test_azure_openai_api, test_gemini_api, test_perplexity_api, close_session
 
 async def smart_route_and_call(user_input):
     """Smart routing logic to choose the best API"""
@@ -149,6 +149,8 @@ async def interactive_chat():
     print("\n🌟 ENTAERA Multi-API Chat Complete!")
     print(f"📊 Total messages: {message_count}")
     print("🚀 Thanks for testing ENTAERA!")
+    
+    await close_session()
 
 if __name__ == "__main__":
     try:
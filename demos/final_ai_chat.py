@@ -5,53 +5,57 @@
 Complete, honest, and robust AI chat with ENTAERA integration
 """
 
+import logging
 import sys
 import os
-sys.path.append('src')
+from collections import deque
+
+from chat_common import (
+    DASH_SEP, EXIT_COMMANDS, STREAM_FLUSH_BYTES, STREAM_FLUSH_ENDINGS, TITLE_SEP,
+    format_message, input_reader, load_env_file, prune_formatted
+)
+from model_singleton import cpu_forced, get_model, release_model
 
 def final_ai_chat():
     """Final production-ready AI chat"""
     print("🏆 FINAL VERTEXAUTOGPT AI CHAT")
-    print("=" * 40)
+    print(TITLE_SEP)
     print("🎯 Production ready with complete code generation")
     
-    # Fix CUDA path issue
-    original_cuda_path = os.environ.get('CUDA_PATH')
+    # Hide CUDA from llama.cpp only when CPU inference is forced
+    original_cuda_path = os.environ.get('CUDA_PATH') if cpu_forced() else None
     if original_cuda_path:
         os.environ.pop('CUDA_PATH', None)
-        print("   ✅ CUDA optimized")
+        print("   ✅ CPU inference forced")
     
     try:
         # Load environment
-        if os.path.exists('.env.local_ai'):
-            with open('.env.local_ai') as f:
-                for line in f:
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
+        load_env_file('.env.local_ai')
         
         # Import framework components
-        from llama_cpp import Llama
         from entaera.core.conversation import ConversationManager, Message, MessageRole
         from entaera.core.logger import LoggerManager
         
         # Initialize framework
         conv_manager = ConversationManager()
         conversation = conv_manager.create_conversation("Final AI Chat")
+        # Probe the conversation API once rather than on every turn
+        count_messages = (lambda c=conversation: len(c.messages)) if hasattr(conversation, 'messages') else None
         logger_manager = LoggerManager()
+        # Queue-backed file logging keeps disk writes off the token streaming loop
+        logger_manager.configure(
+            format_type="simple",
+            log_file="final_chat.log",
+            console_output=False,
+            use_queue=True,
+            file_buffer=1024,
+        )
         logger = logger_manager.get_logger("final_chat")
         
         print("   ✅ ENTAERA framework active")
         
         # Load model with optimal settings
-        model_path = os.environ.get('LLAMA_MODEL_PATH', './models/llama-3.1-8b-instruct.Q4_K_M.gguf')
-        model = Llama(
-            model_path=model_path,
-            n_ctx=4096,
-            n_threads=8,  # Optimized for better performance
-            verbose=False,
-            n_gpu_layers=0,
-        )
+        model = get_model()
         
         print("   ✅ Llama 3.1 8B optimized and ready")
         
@@ -82,20 +86,24 @@ You're running locally on Saurabh Pareek's machine with complete privacy."""
         system_message = Message(role=MessageRole.SYSTEM, content=system_prompt)
         conversation.add_message(system_message)
         
+        # Rolling prompt window, updated alongside the conversation each turn
+        context_window = deque([system_message], maxlen=8)
+        
         print("🚀 Final AI Chat Ready!")
         print("💬 Complete code generation • Honest responses • Framework integration")
-        print("-" * 40)
+        print(DASH_SEP)
         
         message_counter = 0
+        read_input = input_reader()
         
         while True:
             try:
-                user_input = input("\nYou: ").strip()
+                user_input = read_input("\nYou: ").strip()
             except EOFError:
                 print("\n[Input ended]")
                 break
             
-            if user_input.lower() in ['quit', 'exit', 'bye']:
+            if user_input.lower() in EXIT_COMMANDS:
                 break
             
             if not user_input:
@@ -106,27 +114,20 @@ You're running locally on Saurabh Pareek's machine with complete privacy."""
             # Add user message to framework
             user_message = Message(role=MessageRole.USER, content=user_input)
             conversation.add_message(user_message)
-            logger.info(f"User #{message_counter}: {user_input}")
+            context_window.append(user_message)
+            logger.info("User #%d: %s", message_counter, user_input)
             
             # Build optimized conversation context
-            context_messages = conversation.get_context_messages()
-            prompt_parts = []
-            
-            # Smart context selection
-            for msg in context_messages[-8:]:  # Last 4 exchanges
-                if msg.role == MessageRole.SYSTEM:
-                    prompt_parts.append(f"[SYSTEM]: {msg.content}")
-                elif msg.role == MessageRole.USER:
-                    prompt_parts.append(f"Human: {msg.content}")
-                elif msg.role == MessageRole.ASSISTANT:
-                    prompt_parts.append(f"Assistant: {msg.content}")
+            # Smart context selection (last 4 exchanges)
+            prompt_parts = [line for line in map(format_message, context_window) if line]
+            prune_formatted(context_window)
             
-            full_prompt = "\n".join(prompt_parts) + "\nAssistant:"
+            full_prompt = "\n".join(prompt_parts + ["Assistant:"])
             
             # Generate optimized response
             print("🤖 AI: ", end="", flush=True)
             
-            response_text = ""
+            chunks = []
             response_stream = model(
                 full_prompt,
                 max_tokens=500,  # Generous for complete code
@@ -138,12 +139,22 @@ You're running locally on Saurabh Pareek's machine with complete privacy."""
             )
             
             # Stream response efficiently
+            out = sys.stdout.buffer
+            encoding = sys.stdout.encoding or "utf-8"
+            buf = bytearray()
             for token in response_stream:
                 if 'choices' in token and len(token['choices']) > 0:
                     text = token['choices'][0].get('text', '')
                     if text:
-                        print(text, end="", flush=True)
-                        response_text += text
+                        buf += text.encode(encoding, "replace")
+                        if len(buf) >= STREAM_FLUSH_BYTES or text.endswith(STREAM_FLUSH_ENDINGS):
+                            out.write(buf)
+                            out.flush()
+                            buf.clear()
+                        chunks.append(text)
+            out.write(buf)
+            out.flush()
+            response_text = "".join(chunks)
             
             print()  # New line after response
             
@@ -154,10 +165,11 @@ You're running locally on Saurabh Pareek's machine with complete privacy."""
             # Add AI response to framework
             ai_message = Message(role=MessageRole.ASSISTANT, content=response_text.strip())
             conversation.add_message(ai_message)
-            logger.info(f"AI #{message_counter}: Generated {len(response_text)} chars")
+            context_window.append(ai_message)
+            logger.info("AI #%d: Generated %d chars", message_counter, len(response_text))
             
             # Show framework status
-            total_messages = len(conversation.messages) if hasattr(conversation, 'messages') else message_counter * 2 + 1
+            total_messages = count_messages() if count_messages else message_counter * 2 + 1
             print(f"   [ENTAERA: {total_messages} messages • Framework active • Logs updated]")
         
         print("\n🏆 Final AI Chat Complete!")
@@ -165,12 +177,14 @@ You're running locally on Saurabh Pareek's machine with complete privacy."""
         
         # Cleanup
         del model
+        release_model()
         print("🗑️ Resources cleaned up")
         
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # The chat loggers only write to the log file, so say something on stderr too
+        print(f"❌ Error: {type(e).__name__}: {e} (traceback in the chat log)", file=sys.stderr)
+        # Same logger the chat uses, so the traceback goes through its handlers
+        logging.getLogger("final_chat").exception("Error in final_ai_chat")
     
     finally:
         # Restore environment
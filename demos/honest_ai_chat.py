@@ -5,53 +5,57 @@
 AI that only claims what it actually knows about ENTAERA
 """
 
+import logging
 import sys
 import os
-sys.path.append('src')
+from collections import deque
+
+from chat_common import (
+    DASH_SEP, EXIT_COMMANDS, STREAM_FLUSH_BYTES, STREAM_FLUSH_ENDINGS, TITLE_SEP,
+    format_message, input_reader, load_env_file, prune_formatted
+)
+from model_singleton import cpu_forced, get_model, release_model
 
 def honest_ai_chat():
     """Honest AI chat that doesn't hallucinate ENTAERA features"""
     print("🎯 HONEST VERTEXAUTOGPT AI CHAT")
-    print("=" * 40)
+    print(TITLE_SEP)
     print("🛡️ No hallucination - only truth about capabilities")
     
-    # Fix CUDA path issue
-    original_cuda_path = os.environ.get('CUDA_PATH')
+    # Hide CUDA from llama.cpp only when CPU inference is forced
+    original_cuda_path = os.environ.get('CUDA_PATH') if cpu_forced() else None
     if original_cuda_path:
         os.environ.pop('CUDA_PATH', None)
-        print("   ✅ CUDA path fixed")
+        print("   ✅ CPU inference forced")
     
     try:
         # Load environment
-        if os.path.exists('.env.local_ai'):
-            with open('.env.local_ai') as f:
-                for line in f:
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
+        load_env_file('.env.local_ai')
         
         # Import framework components
-        from llama_cpp import Llama
         from entaera.core.conversation import ConversationManager, Message, MessageRole
         from entaera.core.logger import LoggerManager
         
         # Initialize framework
         conv_manager = ConversationManager()
         conversation = conv_manager.create_conversation("Honest AI Chat")
+        # Probe the conversation API once rather than on every turn
+        count_messages = (lambda c=conversation: len(c.messages)) if hasattr(conversation, 'messages') else None
         logger_manager = LoggerManager()
+        # Queue-backed file logging keeps disk writes off the token streaming loop
+        logger_manager.configure(
+            format_type="simple",
+            log_file="honest_chat.log",
+            console_output=False,
+            use_queue=True,
+            file_buffer=1024,
+        )
         logger = logger_manager.get_logger("honest_chat")
         
         print("   ✅ ENTAERA framework initialized")
         
         # Load model
-        model_path = os.environ.get('LLAMA_MODEL_PATH', './models/llama-3.1-8b-instruct.Q4_K_M.gguf')
-        model = Llama(
-            model_path=model_path,
-            n_ctx=4096,
-            n_threads=6,
-            verbose=False,
-            n_gpu_layers=0,
-        )
+        model = get_model()
         
         print("   ✅ Llama 3.1 8B model loaded")
         
@@ -92,16 +96,20 @@ Be conversational but never lie or invent features."""
         system_message = Message(role=MessageRole.SYSTEM, content=system_prompt)
         conversation.add_message(system_message)
         
+        # Rolling prompt window, updated alongside the conversation each turn
+        context_window = deque([system_message], maxlen=9)
+        
         print("🚀 Honest AI Chat Ready!")
         print("💬 Guaranteed truthful responses about ENTAERA")
-        print("-" * 40)
+        print(DASH_SEP)
         
         message_counter = 0
+        read_input = input_reader()
         
         while True:
-            user_input = input("\nYou: ").strip()
+            user_input = read_input("\nYou: ").strip()
             
-            if user_input.lower() in ['quit', 'exit', 'bye']:
+            if user_input.lower() in EXIT_COMMANDS:
                 break
             
             if not user_input:
@@ -112,27 +120,20 @@ Be conversational but never lie or invent features."""
             # Add user message to framework
             user_message = Message(role=MessageRole.USER, content=user_input)
             conversation.add_message(user_message)
-            logger.info(f"User message {message_counter}: {user_input}")
+            context_window.append(user_message)
+            logger.info("User message %d: %s", message_counter, user_input)
             
             # Build conversation context
-            context_messages = conversation.get_context_messages()
-            prompt_parts = []
-            
             # Include system message and recent context
-            for msg in context_messages[-9:]:
-                if msg.role == MessageRole.SYSTEM:
-                    prompt_parts.append(f"[SYSTEM]: {msg.content}")
-                elif msg.role == MessageRole.USER:
-                    prompt_parts.append(f"Human: {msg.content}")
-                elif msg.role == MessageRole.ASSISTANT:
-                    prompt_parts.append(f"Assistant: {msg.content}")
+            prompt_parts = [line for line in map(format_message, context_window) if line]
+            prune_formatted(context_window)
             
-            full_prompt = "\n".join(prompt_parts) + "\nAssistant:"
+            full_prompt = "\n".join(prompt_parts + ["Assistant:"])
             
             # Generate response with better parameters for code generation
             print("🤖 AI: ", end="", flush=True)
             
-            response_text = ""
+            chunks = []
             response_stream = model(
                 full_prompt,
                 max_tokens=400,  # Increased for code generation
@@ -143,12 +144,22 @@ Be conversational but never lie or invent features."""
             )
             
             # Stream response
+            out = sys.stdout.buffer
+            encoding = sys.stdout.encoding or "utf-8"
+            buf = bytearray()
             for token in response_stream:
                 if 'choices' in token and len(token['choices']) > 0:
                     text = token['choices'][0].get('text', '')
                     if text:
-                        print(text, end="", flush=True)
-                        response_text += text
+                        buf += text.encode(encoding, "replace")
+                        if len(buf) >= STREAM_FLUSH_BYTES or text.endswith(STREAM_FLUSH_ENDINGS):
+                            out.write(buf)
+                            out.flush()
+                            buf.clear()
+                        chunks.append(text)
+            out.write(buf)
+            out.flush()
+            response_text = "".join(chunks)
             
             print()  # New line after response
             
@@ -159,10 +170,11 @@ Be conversational but never lie or invent features."""
             # Add AI response to framework
             ai_message = Message(role=MessageRole.ASSISTANT, content=response_text.strip())
             conversation.add_message(ai_message)
-            logger.info(f"AI response {message_counter}: {response_text.strip()}")
+            context_window.append(ai_message)
+            logger.info("AI response %d: %s", message_counter, response_text.strip())
             
             # Show framework activity
-            total_messages = len(conversation.messages) if hasattr(conversation, 'messages') else message_counter * 2 + 1
+            total_messages = count_messages() if count_messages else message_counter * 2 + 1
             print(f"   [ENTAERA: {total_messages} messages tracked, honest responses only]")
         
         print("\n🎯 Honest AI Chat Complete!")
@@ -170,12 +182,14 @@ Be conversational but never lie or invent features."""
         
         # Cleanup
         del model
+        release_model()
         print("🗑️ Model unloaded")
         
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # The chat loggers only write to the log file, so say something on stderr too
+        print(f"❌ Error: {type(e).__name__}: {e} (traceback in the chat log)", file=sys.stderr)
+        # Same logger the chat uses, so the traceback goes through its handlers
+        logging.getLogger("honest_chat").exception("Error in honest_ai_chat")
     
     finally:
         # Restore CUDA path
@@ -6,27 +6,26 @@ This script demonstrates the core capabilities of your setup.
 """
 
 import asyncio
-import logging
-import sys
+import os
 from pathlib import Path
 
-# Add src to path for importing
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from entaera.core.config import ApplicationSettings
-from entaera.core.logger import LoggerManager
+from entaera.core.logger import get_logger_manager, setup_default
 from entaera.utils.text_processor import normalize_text, remove_emojis
 from entaera.utils.files import ensure_directory, save_json
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Fixed-width mask so secrets are never echoed, whatever their length
+_SECRET_MASK = "*" * 8
+
+# Section separators, built once and reused by every print
+_SEP = "=" * 60
+_SEP_BREAK = "\n" + _SEP
 
 async def demo_configuration():
     """Demo 1: Configuration System"""
-    print("\n" + "="*60)
+    print(_SEP_BREAK)
     print("🔧 DEMO 1: Configuration System")
-    print("="*60)
+    print(_SEP)
     
     # Load configuration
     config = ApplicationSettings()
@@ -35,19 +34,20 @@ async def demo_configuration():
     print(f"✅ Environment: {config.environment}")
     print(f"✅ Debug Mode: {config.debug}")
     print(f"✅ Log Level: {config.log_level}")
-    print(f"✅ Secret Key: {'*' * len(config.secret_key)} ({len(config.secret_key)} chars)")
+    print(f"✅ Secret Key: {_SECRET_MASK} ({len(config.secret_key)} chars)")
     
     return config
 
 async def demo_logging():
     """Demo 2: Advanced Logging"""
-    print("\n" + "="*60)
+    print(_SEP_BREAK)
     print("📝 DEMO 2: Advanced Logging System")
-    print("="*60)
+    print(_SEP)
     
-    # Initialize logger manager
-    logger_manager = LoggerManager()
-    demo_logger = logger_manager.get_logger("demo", request_id="demo-session-123")
+    # Use the process-wide logger manager configured in main()
+    logger_manager = get_logger_manager()
+    logger_manager.set_request_id("demo-session-123")
+    demo_logger = logger_manager.get_logger("demo")
     
     print("Testing different log levels:")
     demo_logger.info("This is an info message with request tracking")
@@ -58,9 +58,9 @@ async def demo_logging():
 
 async def demo_text_processing():
     """Demo 3: Text Processing Utilities"""
-    print("\n" + "="*60)
+    print(_SEP_BREAK)
     print("📚 DEMO 3: Text Processing")
-    print("="*60)
+    print(_SEP)
     
     sample_texts = [
         "Hello, World! 🌍 This is ENTAERA-Kata! 🤖",
@@ -79,9 +79,9 @@ async def demo_text_processing():
 
 async def demo_file_operations():
     """Demo 4: File Operations"""
-    print("\n" + "="*60)
+    print(_SEP_BREAK)
     print("📁 DEMO 4: File Operations")
-    print("="*60)
+    print(_SEP)
     
     # Create a demo directory
     demo_dir = Path("demo_output")
@@ -108,20 +108,22 @@ async def demo_file_operations():
 
 async def demo_models_info():
     """Demo 5: Check Available Models"""
-    print("\n" + "="*60)
+    print(_SEP_BREAK)
     print("🤖 DEMO 5: Your AI Models")
-    print("="*60)
+    print(_SEP)
     
     models_dir = Path("models")
     if models_dir.exists():
-        model_files = list(models_dir.glob("*.gguf"))
+        # One directory read; DirEntry.stat() reuses the entry instead of re-resolving paths
+        with os.scandir(models_dir) as it:
+            model_files = [(entry.name, entry.stat().st_size) for entry in it if entry.name.endswith(".gguf")]
         
         print(f"📁 Models directory: {models_dir}")
         print(f"🔍 Found {len(model_files)} model files:")
         
-        for model_file in model_files:
-            size_gb = model_file.stat().st_size / (1024**3)
-            print(f"  📦 {model_file.name} ({size_gb:.1f} GB)")
+        for name, size in model_files:
+            size_gb = size / (1024**3)
+            print(f"  📦 {name} ({size_gb:.1f} GB)")
         
         print("\n🎯 Model Capabilities:")
         print("  • Llama 3.1 8B: General chat, reasoning, research")
@@ -132,9 +134,9 @@ async def demo_models_info():
 
 async def demo_next_steps():
     """Show what user can try next"""
-    print("\n" + "="*60)
+    print(_SEP_BREAK)
     print("🚀 WHAT YOU CAN TRY NEXT")
-    print("="*60)
+    print(_SEP)
     
     next_actions = [
         ("📖 Read Documentation", "Get-Content README.md"),
@@ -153,13 +155,14 @@ async def demo_next_steps():
 
 async def main():
     """Main demo function"""
+    logger = setup_default(level="INFO", name=__name__)
     print("🎯 ENTAERA-Kata Interactive Demo")
-    print("=" * 60)
+    print(_SEP)
     print("This demo shows you what your setup can do!")
     print()
     
     try:
-        # Run all demos
+        # Run all demos; none of them await anything, so gathering them would add nothing
         config = await demo_configuration()
         await demo_logging()
         await demo_text_processing()
@@ -167,9 +170,9 @@ async def main():
         await demo_models_info()
         await demo_next_steps()
         
-        print("\n" + "="*60)
+        print(_SEP_BREAK)
         print("🎉 DEMO COMPLETED SUCCESSFULLY!")
-        print("="*60)
+        print(_SEP)
         print("✅ All core components are working")
         print("✅ Your local AI models are ready")
         print("✅ File operations completed")
@@ -177,9 +180,7 @@ async def main():
         print("\n🎓 You're ready to start the kata learning journey!")
         
     except Exception as e:
-        logger.error(f"Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Demo failed: %s", e)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
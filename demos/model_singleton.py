@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+🦙 Shared Llama model for the local chat demos
+==============================================
+Loads the GGUF model once per process and keeps its KV cache warm between turns
+"""
+
+import os
+from functools import lru_cache
+
+DEFAULT_MODEL_PATH = './models/llama-3.1-8b-instruct.Q4_K_M.gguf'
+
+# One thread count for every demo, so they all share the same cached model
+N_THREADS = int(os.environ.get('LLAMA_N_THREADS', '8'))
+
+# KV cache element types selectable via LLAMA_KV_QUANT, as llama_cpp ggml type constant names
+KV_CACHE_TYPES = {'f16': 'GGML_TYPE_F16', 'q4_0': 'GGML_TYPE_Q4_0', 'q8_0': 'GGML_TYPE_Q8_0'}
+
+def cpu_forced():
+    """True when ENTAERA_FORCE_CPU=1 asks for CPU-only inference"""
+    return os.environ.get('ENTAERA_FORCE_CPU') == '1'
+
+def gpu_layers():
+    """Offload every layer when this llama.cpp build can use a GPU, else none"""
+    if cpu_forced():
+        return 0
+    try:
+        from llama_cpp import llama_supports_gpu_offload
+    except ImportError:
+        return 0
+    return -1 if llama_supports_gpu_offload() else 0
+
+def kv_cache_options(llama_cpp):
+    """Llama kwargs for the LLAMA_KV_QUANT cache type (q8_0 unless set)
+
+    Quantized types halve or quarter KV cache bandwidth on CPU and need flash
+    attention for the V cache. As in tools/local_model_loader.py, builds too old
+    to expose the ggml type constants keep the default f16 cache.
+    """
+    kv_quant = os.environ.get('LLAMA_KV_QUANT', 'q8_0').lower()
+    kv_type = getattr(llama_cpp, KV_CACHE_TYPES.get(kv_quant, KV_CACHE_TYPES['q8_0']), None)
+    if kv_type is None or kv_quant == 'f16':
+        return {}
+    return {"type_k": kv_type, "type_v": kv_type, "flash_attn": True}
+
+def get_model(model_path=None):
+    """Return the shared Llama instance for this model path.
+
+    llama.cpp reuses the evaluated tokens that prefix the next prompt, and the
+    RAM cache restores saved states for earlier prompts, so each turn only
+    prefills the newly appended messages.
+    """
+    return _load_model(model_path or os.environ.get('LLAMA_MODEL_PATH', DEFAULT_MODEL_PATH))
+
+@lru_cache(maxsize=None)
+def _load_model(model_path):
+    """Load the model once per resolved path"""
+    import llama_cpp
+
+    model = llama_cpp.Llama(
+        model_path=model_path,
+        n_ctx=4096,
+        n_threads=N_THREADS,
+        verbose=False,
+        n_gpu_layers=gpu_layers(),
+        **kv_cache_options(llama_cpp),
+    )
+    model.set_cache(llama_cpp.LlamaRAMCache())
+    return model
+
+def release_model():
+    """Drop the shared model so its memory can be reclaimed"""
+    _load_model.cache_clear()
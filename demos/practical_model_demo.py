@@ -9,10 +9,25 @@ import sys
 import os
 sys.path.append('src')
 
+# Model-related environment variables reported by the demo
+_MODEL_ENV_VARS = ('LOCAL_AI_ENABLED', 'CODE_MODEL_PATH', 'CHAT_MODEL_PATH', 'EMBEDDING_MODEL', 'CUDA_ENABLED')
+
+# Embedding provider shared across demo runs so the model loads only once
+_PROVIDER = None
+
+def get_provider():
+    """Return the shared sentence-transformer provider"""
+    global _PROVIDER
+    if _PROVIDER is None:
+        from entaera.core.semantic_search import SentenceTransformerProvider
+        _PROVIDER = SentenceTransformerProvider(batch_size=64, normalize_embeddings=True)
+    return _PROVIDER
+
 def demo_model_usage():
     """Demonstrate practical model usage"""
     
-    import os
+    # Snapshot the environment once for every lookup below
+    getenv = os.environ.copy().get
     print("🤖 PRACTICAL AI MODEL USAGE DEMO")
     print("=" * 50)
     
@@ -24,11 +39,11 @@ def demo_model_usage():
     print("-" * 40)
     
     try:
-        from entaera.core.semantic_search import SemanticSearchEngine, SentenceTransformerProvider
+        import asyncio
+        from entaera.core.semantic_search import SearchFilter, SemanticSearchEngine
         
         print("✅ Loading sentence-transformer embedding model...")
-        provider = SentenceTransformerProvider()
-        search_engine = SemanticSearchEngine(provider)
+        search_engine = SemanticSearchEngine(get_provider())
         
         # Add some sample content
         documents = [
@@ -38,17 +53,23 @@ def demo_model_usage():
             "Database management with SQL"
         ]
         
-        print(f"📝 Adding {len(documents)} documents to search index...")
-        for i, doc in enumerate(documents):
-            search_engine.add_content(f"doc-{i}", doc, {"type": "sample"})
-        
-        # Perform search
         query = "programming languages"
+        
+        async def index_and_search():
+            # One encode call for the whole corpus, then one query embedding
+            await search_engine.add_content_batch(
+                [f"doc-{i}" for i in range(len(documents))],
+                documents,
+                [{"type": "sample"}] * len(documents)
+            )
+            return await search_engine.search(query, SearchFilter(max_results=3))
+        
+        print(f"📝 Adding {len(documents)} documents to search index...")
         print(f"\n🔍 Searching for: '{query}'")
-        results = search_engine.search(query, top_k=3)
+        results = asyncio.run(index_and_search())
         
         for i, result in enumerate(results, 1):
-            print(f"   {i}. Score: {result.similarity_score:.3f} | {result.content_id}")
+            print(f"   {i}. Score: {result.similarity_score:.3f} | {result.source_id}")
             
         print("✅ Embedding model working perfectly!")
         
@@ -66,35 +87,26 @@ def demo_model_usage():
         print("📋 Current model configuration:")
         
         # Check environment variables
-        import os
-        model_vars = {
-            'LOCAL_AI_ENABLED': os.getenv('LOCAL_AI_ENABLED', 'Not set'),
-            'CODE_MODEL_PATH': os.getenv('CODE_MODEL_PATH', 'Not set'),
-            'CHAT_MODEL_PATH': os.getenv('CHAT_MODEL_PATH', 'Not set'),
-            'EMBEDDING_MODEL': os.getenv('EMBEDDING_MODEL', 'Not set'),
-            'CUDA_ENABLED': os.getenv('CUDA_ENABLED', 'Not set'),
-        }
-        
-        for var, value in model_vars.items():
-            print(f"   {var}: {value}")
+        for var in _MODEL_ENV_VARS:
+            print(f"   {var}: {getenv(var, 'Not set')}")
             
         # Check if model files exist
-        from pathlib import Path
         print(f"\n📁 Model file status:")
         
         model_paths = [
-            os.getenv('CODE_MODEL_PATH', ''),
-            os.getenv('CHAT_MODEL_PATH', '')
+            getenv('CODE_MODEL_PATH', ''),
+            getenv('CHAT_MODEL_PATH', '')
         ]
         
         for path in model_paths:
             if path:
-                file_path = Path(path)
-                if file_path.exists():
-                    size_gb = file_path.stat().st_size / (1024**3)
-                    print(f"   ✅ {file_path.name}: {size_gb:.1f}GB")
-                else:
+                # One stat call answers both "exists?" and "how big?"
+                try:
+                    size_gb = os.stat(path).st_size / (1024**3)
+                except OSError:
                     print(f"   ❌ {path}: Not found")
+                else:
+                    print(f"   ✅ {os.path.basename(path)}: {size_gb:.1f}GB")
         
     except Exception as e:
         print(f"❌ Configuration error: {e}")
@@ -5,6 +5,7 @@ Reality Check: What Actually Works
 Let's be honest about what's implemented vs what's just import errors
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -18,21 +19,26 @@ def reality_check():
     working_imports = []
     failing_imports = []
     
+    # Only locate the modules (no import), so heavy packages like torch are not initialised
     basic_tests = [
-        ("Python Standard Library", "import json, os, sys, pathlib"),
-        ("Basic Config", "from src.entaera.core.config import ApplicationSettings"),
-        ("Basic Logger", "from src.entaera.core.logger import LoggerManager"),
-        ("Environment Loading", "from dotenv import load_dotenv"),
-        ("PyTorch", "import torch"),
-        ("Sentence Transformers", "import sentence_transformers"),
+        ("Python Standard Library", ("json", "os", "sys", "pathlib")),
+        ("Basic Config", ("src.entaera.core.config",)),
+        ("Basic Logger", ("src.entaera.core.logger",)),
+        ("Environment Loading", ("dotenv",)),
+        ("PyTorch", ("torch",)),
+        ("Sentence Transformers", ("sentence_transformers",)),
     ]
     
-    for name, import_statement in basic_tests:
+    for name, modules in basic_tests:
         try:
-            exec(import_statement)
-            working_imports.append(f"✅ {name}")
+            missing = [module for module in modules if importlib.util.find_spec(module) is None]
         except Exception as e:
             failing_imports.append(f"❌ {name}: {str(e)[:50]}...")
+            continue
+        if missing:
+            failing_imports.append(f"❌ {name}: No module named '{missing[0]}'")
+        else:
+            working_imports.append(f"✅ {name}")
     
     # Show what works
     if working_imports:
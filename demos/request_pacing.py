@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+⏱️ Shared request pacing for the live API demos
+===============================================
+Per-provider limiters read from *_RPM environment variables
+"""
+
+import asyncio
+import os
+
+try:
+    from entaera.utils.rate_limiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+class _IntervalLimiter:
+    """Fallback when entaera is not importable: space requests evenly over the period"""
+
+    def __init__(self, max_rate, time_period=60.0):
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        now = asyncio.get_running_loop().time()
+        wait = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+def rpm_limiter(env_name, default_rpm):
+    """Return a limiter allowing the requests per minute set in env_name (default_rpm if unset)"""
+    raw = os.getenv(env_name, str(default_rpm))
+    try:
+        rpm = int(raw)
+    except ValueError:
+        rpm = 0
+    if rpm <= 0:
+        raise ValueError(f"{env_name} must be a positive integer, got {raw!r}")
+    limiter_cls = AsyncLimiter or _IntervalLimiter
+    return limiter_cls(rpm, 60)
@@ -16,6 +16,9 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from entaera.core.config import ApplicationSettings
 from entaera.core.logger import LoggerManager
 
+# Fixed-width mask so secrets are never echoed, whatever their length
+_SECRET_MASK = "*" * 8
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,7 +36,7 @@ async def main():
     print(f"✅ App Name: {config.app_name}")
     print(f"✅ Environment: {config.environment}")
     print(f"✅ Debug Mode: {config.debug}")
-    print(f"✅ Secret Key: {'*' * len(config.secret_key)} ({len(config.secret_key)} chars)")
+    print(f"✅ Secret Key: {_SECRET_MASK} ({len(config.secret_key)} chars)")
     print()
     
     # Demo 2: Logging
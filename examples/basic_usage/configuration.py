@@ -34,7 +34,7 @@ async def main():
         try:
             config = ApplicationSettings()
         except Exception as config_error:
-            logger.warning(f"⚠️  Environment configuration not found: {config_error}")
+            logger.warning("⚠️  Environment configuration not found: %s", config_error)
             logger.info("🔧 Creating demo configuration...")
             # Create demo config
             config = ApplicationSettings(
@@ -44,10 +44,10 @@ async def main():
             )
         
         # Display basic configuration
-        logger.info(f"Application Name: {config.app_name}")
-        logger.info(f"Environment: {config.environment}")
-        logger.info(f"Debug Mode: {config.debug}")
-        logger.info(f"Log Level: {config.log_level}")
+        logger.info("Application Name: %s", config.app_name)
+        logger.info("Environment: %s", config.environment)
+        logger.info("Debug Mode: %s", config.debug)
+        logger.info("Log Level: %s", config.log_level)
         
         # Step 2: Validate configuration
         logger.info("\n✅ Step 2: Configuration Validation")
@@ -55,9 +55,9 @@ async def main():
         
         # Show how Pydantic validation works
         logger.info("Configuration validation results:")
-        logger.info(f"  ✓ Secret key length: {len(config.secret_key)} characters")
-        logger.info(f"  ✓ Environment is valid: {config.environment}")
-        logger.info(f"  ✓ All required fields present")
+        logger.info("  ✓ Secret key length: %s characters", len(config.secret_key))
+        logger.info("  ✓ Environment is valid: %s", config.environment)
+        logger.info("  ✓ All required fields present")
         
         # Step 3: Demonstrate environment-specific settings
         logger.info("\n🌍 Step 3: Environment-Specific Settings")
@@ -83,9 +83,10 @@ async def main():
         # Export configuration (without sensitive data)
         config_dict = config.dict(exclude={'secret_key'})
         logger.info("Configuration exported (sensitive data excluded):")
-        for key, value in config_dict.items():
-            if not key.endswith('_key') and not key.endswith('_password'):
-                logger.info(f"  {key}: {value}")
+        if logger.isEnabledFor(logging.INFO):
+            for key, value in config_dict.items():
+                if not key.endswith('_key') and not key.endswith('_password'):
+                    logger.info("  %s: %s", key, value)
         
         # Step 5: Dynamic configuration updates
         logger.info("\n🔄 Step 5: Dynamic Configuration Updates")
@@ -101,9 +102,9 @@ async def main():
         )
         
         logger.info("Created test configuration:")
-        logger.info(f"  App Name: {test_config.app_name}")
-        logger.info(f"  Environment: {test_config.environment}")
-        logger.info(f"  Debug: {test_config.debug}")
+        logger.info("  App Name: %s", test_config.app_name)
+        logger.info("  Environment: %s", test_config.environment)
+        logger.info("  Debug: %s", test_config.debug)
         
         # Step 6: Configuration best practices
         logger.info("\n🎯 Step 6: Configuration Best Practices")
@@ -120,7 +121,7 @@ async def main():
         ]
         
         for practice in best_practices:
-            logger.info(f"  {practice}")
+            logger.info("  %s", practice)
         
         # Step 7: Environment file examples
         logger.info("\n📝 Step 7: Environment File Examples")
@@ -141,10 +142,11 @@ async def main():
             }
         }
         
-        for env_name, env_vars in env_examples.items():
-            logger.info(f"\n{env_name} environment (.env.{env_name.lower()}):")
-            for key, value in env_vars.items():
-                logger.info(f"  {key}={value}")
+        if logger.isEnabledFor(logging.INFO):
+            for env_name, env_vars in env_examples.items():
+                logger.info("\n%s environment (.env.%s):", env_name, env_name.lower())
+                for key, value in env_vars.items():
+                    logger.info("  %s=%s", key, value)
         
         # Step 8: Configuration validation errors
         logger.info("\n⚠️  Step 8: Common Configuration Issues")
@@ -159,7 +161,7 @@ async def main():
         ]
         
         for issue in common_issues:
-            logger.info(f"  {issue}")
+            logger.info("  %s", issue)
         
         logger.info("\n🛠️  How to fix configuration issues:")
         fixes = [
@@ -171,13 +173,13 @@ async def main():
         ]
         
         for fix in fixes:
-            logger.info(f"  {fix}")
+            logger.info("  %s", fix)
         
         # Success message
         logger.info("\n🎉 Configuration management example completed!")
         
     except Exception as e:
-        logger.error(f"❌ Configuration example failed: {e}")
+        logger.error("❌ Configuration example failed: %s", e)
         logger.exception("Full error details:")
         return 1
     
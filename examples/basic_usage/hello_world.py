@@ -8,23 +8,20 @@ Time: 5 minutes
 """
 
 import asyncio
-import logging
 import sys
 from pathlib import Path
 
-# Add src to path for importing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from entaera.core.config import ApplicationSettings
-from entaera.core.logger import LoggerManager
+from entaera.core.logger import get_logger_manager, setup_default
 
-# Setup logging for the example
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Section separators, built once and reused by every print
+_SEP = "=" * 60
+_SEP_BREAK = "\n" + _SEP
 
 
 async def main():
     """Demonstrate basic ENTAERA-Kata functionality."""
+    logger = setup_default(level="INFO", name=__name__)
     logger.info("🚀 Starting ENTAERA-Kata Hello World Example")
     
     try:
@@ -47,12 +44,13 @@ async def main():
         
         # Step 2: Initialize logging system
         logger.info("🔧 Setting up logging system...")
-        log_manager = LoggerManager()
+        log_manager = get_logger_manager()
         log_manager.configure(
             format_type="simple",
             level="INFO",
             console_output=True,
-            use_colors=True
+            use_colors=True,
+            use_queue=True
         )
         app_logger = log_manager.get_logger("hello_world")
         app_logger.info("✅ Logging system initialized")
@@ -99,14 +97,14 @@ async def main():
         app_logger.info("🎓 You're ready to explore more advanced features!")
         
         # Provide next steps
-        print("\n" + "="*60)
+        print(_SEP_BREAK)
         print("🎯 NEXT STEPS")
-        print("="*60)
+        print(_SEP)
         print("1. 📖 Explore configuration options in examples/basic_usage/configuration.py")
         print("2. 🤖 Try AI provider examples in examples/ai_providers/")
         print("3. 🔬 Learn about research automation in examples/research/")
         print("4. 📚 Read the full documentation at docs/")
-        print("="*60)
+        print(_SEP)
         
     except Exception as e:
         logger.error(f"❌ Error in Hello World example: {e}")
@@ -9,21 +9,26 @@ This script demonstrates the combined functionality of:
 Run this script to see the kata implementations in action.
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
 import tempfile
 import uuid
 
-# Add the parent directory to sys.path to allow imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Prefer an installed package (`pip install -e .`); fall back to the src/ tree when run from a checkout
+if __package__ is None and "entaera" not in sys.modules:
+    try:
+        import entaera
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 try:
     from entaera.core.config import (
         ApplicationSettings,
-        APIProviderSettings,
         ServerSettings,
-        load_settings,
+        compile_env_to_module,
+        import_env_module,
         kata_practice_config
     )
     from entaera.core.logger import (
@@ -43,240 +48,251 @@ except ImportError as e:
     sys.exit(1)
 
 
-def run_config_kata_demo():
-    """Run the configuration kata demonstration."""
-    print("\n🔧 Configuration Kata Demo")
-    print("=" * 40)
-    
-    # Create a temporary .env file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-        f.write("""
+def load_compiled_settings(dotenv_path, cache_dir):
+    """Load settings through the compiled .env module instead of re-parsing the file."""
+    module = import_env_module(compile_env_to_module(dotenv_path, cache_dir=cache_dir))
+    return ApplicationSettings.from_compiled(module)
+
+
+# Keep the throwaway .env and log file on tmpfs where available
+_TEMP_ROOT = "/dev/shm" if sys.platform == "linux" and os.path.isdir("/dev/shm") else None
+
+# Section separators
+_SEP40 = "=" * 40
+_SEP60 = "=" * 60
+
+# ApplicationSettings variables read by the config and integration demos
+DEMO_ENV = """
 # ENTAERA Configuration
-VERTEX_AUTO_GPT_APP_NAME=Kata Demo App
-VERTEX_AUTO_GPT_VERSION=1.0.0
-VERTEX_AUTO_GPT_ENVIRONMENT=development
+APP_NAME=Kata Demo App
+APP_VERSION=1.0.0
+ENVIRONMENT=development
+DEBUG=true
 
-# API Provider Settings
-VERTEX_AUTO_GPT_OPENAI_API_KEY=sk-demo123456789
-VERTEX_AUTO_GPT_DEFAULT_PROVIDER=openai
-VERTEX_AUTO_GPT_MAX_TOKENS=2048
-VERTEX_AUTO_GPT_TEMPERATURE=0.7
+# Security Settings (demo value only)
+SECRET_KEY=kata-demo-secret-key-not-for-production-use
 
-# Server Settings
-VERTEX_AUTO_GPT_SERVER_PORT=9000
-VERTEX_AUTO_GPT_SERVER_DEBUG=true
-""")
-        dotenv_path = f.name
+# Logging Settings
+LOG_LEVEL=DEBUG
+LOG_FORMAT=structured
+"""
+
+
+def _flush(lines):
+    """Write the collected output lines to stdout in one call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def run_config_kata_demo(settings):
+    """Run the configuration kata demonstration."""
+    out = ["\n🔧 Configuration Kata Demo", _SEP40]
     
     try:
-        print("1. Loading settings from .env file...")
-        settings = load_settings(dotenv_path=dotenv_path)
-        
-        print(f"✅ App Name: {settings.app_name}")
-        print(f"✅ Environment: {settings.environment}")
-        print(f"✅ API Provider: {settings.api.default_provider}")
-        print(f"✅ API Key: {settings.api.openai_api_key[:5]}...")
-        print(f"✅ Server Port: {settings.server.port}")
-        print(f"✅ Debug Mode: {settings.server.debug}")
+        out.append("1. Loading settings from .env file...")
+        out.append(f"✅ App Name: {settings.app_name}")
+        out.append(f"✅ Environment: {settings.environment}")
+        out.append(f"✅ Version: {settings.app_version}")
+        out.append(f"✅ Secret Key: {settings.secret_key[:5]}...")
+        out.append(f"✅ Allowed Hosts: {', '.join(settings.allowed_hosts)}")
+        out.append(f"✅ Debug Mode: {settings.debug}")
         
-        print("\n2. Creating custom settings...")
-        custom_settings = ApplicationSettings(
+        out.append("\n2. Creating custom settings...")
+        # Static fixture values: model_construct skips validation and the .env lookup
+        custom_settings = ApplicationSettings.model_construct(
             app_name="Custom Demo",
-            version="2.0.0",
+            app_version="2.0.0",
             environment="testing",
-            api=APIProviderSettings(
-                openai_api_key="sk-custom12345",
-                temperature=0.5,
-                max_tokens=4096
-            ),
-            server=ServerSettings(
-                port=8080,
-                workers=4
-            )
+            debug=False
+        )
+        custom_server = ServerSettings.model_construct(
+            api_port=8080,
+            api_workers=4
         )
         
-        print(f"✅ Custom App Name: {custom_settings.app_name}")
-        print(f"✅ Custom Environment: {custom_settings.environment}")
-        print(f"✅ Custom Temperature: {custom_settings.api.temperature}")
-        print(f"✅ Custom Workers: {custom_settings.server.workers}")
+        out.append(f"✅ Custom App Name: {custom_settings.app_name}")
+        out.append(f"✅ Custom Environment: {custom_settings.environment}")
+        out.append(f"✅ Custom Port: {custom_server.api_port}")
+        out.append(f"✅ Custom Workers: {custom_server.api_workers}")
         
-        print("\n3. Running config kata practice function...")
+        out.append("\n3. Running config kata practice function...")
         practice_results = kata_practice_config()
         
-        print(f"✅ Settings Created: {practice_results['settings_created']}")
-        print(f"✅ Validation Passed: {practice_results['validation_passed']}")
-        print(f"✅ Learning notes: {len(practice_results['learning_notes'])} items")
+        if practice_results["configuration_loaded"]:
+            out.append(f"✅ Configuration valid: {practice_results['is_valid']}")
+            out.append(f"✅ Environment: {practice_results['environment']}")
+        else:
+            # The practice loads the full settings tree, which needs real provider keys
+            out.append(f"⚠️ Practice configuration not loaded: {str(practice_results.get('error')).splitlines()[0]}")
+        out.append(f"✅ Learning notes: {len(practice_results['learning_notes'])} items")
         
         return True
         
     except Exception as e:
-        print(f"❌ Error in config demo: {e}")
+        out.append(f"❌ Error in config demo: {e}")
         return False
     finally:
-        os.unlink(dotenv_path)
+        _flush(out)
 
 
-def run_logging_kata_demo():
+def run_logging_kata_demo(logger, log_path, practice_results):
     """Run the logging kata demonstration."""
-    print("\n📝 Logging Kata Demo")
-    print("=" * 40)
+    out = ["\n📝 Logging Kata Demo", _SEP40]
     
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = "kata_demo.log"
-            
-            print("1. Configuring logging system...")
-            configure_logging(
-                level="DEBUG",
-                format_type="simple",
-                log_file=log_file,
-                log_dir=temp_dir,
-                max_size="1MB",
-                backup_count=3,
-                console_output=True,
-                use_colors=True
-            )
-            
-            logger = get_logger("demo.kata")
-            print("✅ Logging configured")
-            
-            print("\n2. Using different log levels...")
-            logger.debug("This is a debug message with technical details")
-            logger.info("This is an info message about normal operation")
-            logger.warning("This is a warning - something might need attention")
-            logger.error("This is an error - something went wrong")
-            
-            print("\n3. Using request ID for context tracking...")
-            request_id = str(uuid.uuid4())
-            print(f"Request ID: {request_id}")
-            
-            set_request_id(request_id)
-            logger.info("Processing user request", user_id="demo_user", action="login")
-            logger.info("User authenticated", method="password")
-            
-            clear_request_id()
-            print("✅ Request context demonstrated")
-            
-            print("\n4. Handling exceptions...")
-            try:
-                # Simulate an error
-                result = 1 / 0
-            except Exception:
-                logger.exception("Division by zero error occurred")
-                print("✅ Exception logged properly")
-            
-            print("\n5. Using convenience functions...")
-            log_debug("Debug from convenience function")
-            log_info("Info from convenience function", component="demo")
-            log_warning("Warning from convenience function")
-            log_error("Error from convenience function")
-            
-            print("\n6. Running logging kata practice function...")
-            practice_results = kata_practice_logging()
-            
-            if practice_results["logging_configured"]:
-                print(f"✅ Log entries: {practice_results['log_entries']}")
-                print(f"✅ Log levels tested: {', '.join(practice_results['log_levels_tested'])}")
-                print(f"✅ Exception logged: {practice_results['exception_logged']}")
-                print(f"✅ Learning notes: {len(practice_results['learning_notes'])} items")
-            else:
-                print(f"❌ Logging practice error: {practice_results.get('error')}")
-            
-            # Check log file
-            log_path = Path(temp_dir) / log_file
-            if log_path.exists():
-                file_size = log_path.stat().st_size
-                print(f"\n✅ Log file created: {log_file} ({file_size} bytes)")
-            
-            return True
+        out.append("1. Using the shared logging configuration...")
+        out.append("✅ Logging configured")
+        
+        out.append("\n2. Using different log levels...")
+        _flush(out)
+        logger.debug("This is a debug message with technical details")
+        logger.info("This is an info message about normal operation")
+        logger.warning("This is a warning - something might need attention")
+        logger.error("This is an error - something went wrong")
+        
+        out.append("\n3. Using request ID for context tracking...")
+        request_id = uuid.uuid4().hex
+        out.append(f"Request ID: {request_id}")
+        
+        _flush(out)
+        set_request_id(request_id)
+        logger.info("Processing user request", extra={"user_id": "demo_user", "action": "login"})
+        logger.info("User authenticated", extra={"method": "password"})
+        
+        clear_request_id()
+        out.append("✅ Request context demonstrated")
+        
+        out.append("\n4. Handling exceptions...")
+        _flush(out)
+        try:
+            # Simulate an error
+            result = 1 / 0
+        except Exception:
+            logger.exception("Division by zero error occurred")
+            out.append("✅ Exception logged properly")
+        
+        out.append("\n5. Using convenience functions...")
+        _flush(out)
+        log_debug("Debug from convenience function")
+        log_info("Info from convenience function", component="demo")
+        log_warning("Warning from convenience function")
+        log_error("Error from convenience function")
+        
+        out.append("\n6. Logging kata practice results (run before the shared configuration)...")
+        
+        if practice_results["logging_configured"]:
+            out.append(f"✅ Log entries: {practice_results['log_entries']}")
+            out.append(f"✅ Log levels tested: {', '.join(practice_results['log_levels_tested'])}")
+            out.append(f"✅ Exception logged: {practice_results['exception_logged']}")
+            out.append(f"✅ Learning notes: {len(practice_results['learning_notes'])} items")
+        else:
+            out.append(f"❌ Logging practice error: {practice_results.get('error')}")
+        
+        # Check log file
+        if log_path.exists():
+            file_size = log_path.stat().st_size
+            out.append(f"\n✅ Log file created: {log_path.name} ({file_size} bytes)")
+        
+        return True
     
     except Exception as e:
-        print(f"❌ Error in logging demo: {e}")
+        out.append(f"❌ Error in logging demo: {e}")
         return False
+    finally:
+        _flush(out)
 
 
-def run_integration_demo():
+def run_integration_demo(settings, logger, log_path):
     """Run an integration demo with both config and logging."""
-    print("\n🔄 Integration Demo")
-    print("=" * 40)
+    out = ["\n🔄 Integration Demo", _SEP40]
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-            f.write("""
-# ENTAERA Configuration
-VERTEX_AUTO_GPT_APP_NAME=Integration Demo
-VERTEX_AUTO_GPT_VERSION=1.0.0
-VERTEX_AUTO_GPT_ENVIRONMENT=demo
-
-# Logging Settings
-VERTEX_AUTO_GPT_LOG_LEVEL=DEBUG
-VERTEX_AUTO_GPT_LOG_FORMAT=structured
-""")
-            dotenv_path = f.name
+        out.append(f"✅ Loaded settings for: {settings.app_name}")
+        out.append(f"✅ Log settings: level={settings.log_level}, format={settings.log_format}")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Load settings from .env
-            settings = load_settings(dotenv_path=dotenv_path)
-            print(f"✅ Loaded settings for: {settings.app_name}")
-            
-            # Configure logging based on settings
-            log_level = getattr(settings, "log_level", "INFO")
-            log_format = getattr(settings, "log_format", "simple")
-            
-            configure_logging(
-                level=log_level,
-                format_type=log_format,
-                log_file="integration.log",
-                log_dir=temp_dir,
-                console_output=True
-            )
-            
-            logger = get_logger("integration.demo")
-            logger.info(f"Application started: {settings.app_name}", 
-                       version=settings.version,
-                       env=settings.environment)
-            
-            # Simulate API request with tracking
-            req_id = str(uuid.uuid4())[:8]
-            set_request_id(req_id)
-            
-            logger.info("Processing API request", 
-                       provider=settings.api.default_provider,
-                       max_tokens=settings.api.max_tokens)
-            
-            # Simulate response handling
-            logger.info("API response received", 
-                       tokens_used=1024,
-                       completion_time_ms=350)
-            
-            # Clear context
-            clear_request_id()
-            
-            print(f"✅ Integration demo completed")
-            print(f"✅ Log file: {Path(temp_dir) / 'integration.log'}")
-            
-            return True
+        _flush(out)
+        logger.info(f"Application started: {settings.app_name}", 
+                   extra={"version": settings.app_version,
+                          "env": settings.environment})
+        
+        # Simulate API request with tracking
+        req_id = uuid.uuid4().hex[:8]
+        set_request_id(req_id)
+        
+        logger.info("Processing API request", 
+                   extra={"provider": "gemini",
+                          "max_tokens": 2048})
+        
+        # Simulate response handling
+        logger.info("API response received", 
+                   extra={"tokens_used": 1024,
+                          "completion_time_ms": 350})
+        
+        # Clear context
+        clear_request_id()
+        
+        out.append("✅ Integration demo completed")
+        out.append(f"✅ Log file: {log_path}")
+        
+        return True
             
     except Exception as e:
-        print(f"❌ Error in integration demo: {e}")
+        out.append(f"❌ Error in integration demo: {e}")
         return False
     finally:
-        os.unlink(dotenv_path)
+        _flush(out)
 
 
 if __name__ == "__main__":
     print("\n🥋 Day 2 Kata Demonstration: Configuration & Logging 🥋")
-    print("=" * 60)
+    print(_SEP60)
     
-    config_success = run_config_kata_demo()
-    logging_success = run_logging_kata_demo()
-    integration_success = run_integration_demo()
+    # The logging kata practice reconfigures global logging, so run it before the shared setup
+    logging_practice = kata_practice_logging()
+    
+    # Configure logging and load settings once; every demo runs against this shared state.
+    # One temporary root holds the .env and the log file and is removed in one step.
+    with tempfile.TemporaryDirectory(dir=_TEMP_ROOT) as temp_dir:
+        root = Path(temp_dir)
+        dotenv_path = root / "config.env"
+        dotenv_path.write_text(DEMO_ENV)
+        
+        log_file = "kata_demo.log"
+        configure_logging(
+            level="DEBUG",
+            format_type="simple",
+            log_file=log_file,
+            log_dir=root,
+            max_size="1MB",
+            backup_count=3,
+            console_output=True,
+            use_colors=True,
+            use_queue=True,
+            file_buffer=256
+        )
+        logger = get_logger("demo.kata")
+        log_path = root / log_file
+        
+        try:
+            settings = load_compiled_settings(dotenv_path, cache_dir=root / "env_cache")
+        except Exception as e:
+            print(f"❌ Error loading settings: {e}")
+            settings = None
+        
+        # Run the demos one after another so each demo's output stays in one block
+        config_success = run_config_kata_demo(settings) if settings is not None else False
+        logging_success = run_logging_kata_demo(logger, log_path, logging_practice)
+        integration_success = run_integration_demo(settings, logger, log_path) if settings is not None else False
+        
+        # Release the log file before the temporary directory is removed
+        logging.shutdown()
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP60)
     print("Day 2 Kata Results:")
     print(f"✅ Configuration: {'Success' if config_success else 'Failed'}")
     print(f"✅ Logging: {'Success' if logging_success else 'Failed'}")
     print(f"✅ Integration: {'Success' if integration_success else 'Failed'}")
     
-    overall = all([config_success, logging_success, integration_success])
-    print(f"\n{'🎉 Day 2 Kata Completed Successfully!' if overall else '❌ Some demonstrations failed.'}")
\ No newline at end of file
+    overall = all((config_success, logging_success, integration_success))
+    print(f"\n{'🎉 Day 2 Kata Completed Successfully!' if overall else '❌ Some demonstrations failed.'}")
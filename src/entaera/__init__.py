@@ -13,24 +13,29 @@ __url__ = "https://github.com/yourusername/ENTAERA-Kata"
 __license__ = "MIT"
 
 # Version info
-__version_info__ = tuple(map(int, __version__.split(".")))
+__version_info__ = (0, 1, 0)  # keep in sync with __version__
 
 # Public API exports
-# Import core functionality if available
+# Core helpers are imported on first access (PEP 562) so `import entaera`
+# does not pull in pydantic, dotenv and the logging setup
 __all__ = [
     "__version__",
     "__version_info__",
+    "get_settings",
+    "get_logger",
 ]
 
-# Conditionally import core modules
-try:
-    from entaera.core.config import get_settings
-    __all__.append("get_settings")
-except ImportError:
-    pass
+_LAZY_EXPORTS = {
+    "get_settings": "entaera.core.config",
+    "get_logger": "entaera.core.logger",
+}
 
-try:
-    from entaera.core.logger import get_logger
-    __all__.append("get_logger")
-except ImportError:
-    pass
+
+def __getattr__(name):
+    """Import core helpers lazily on first attribute access."""
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,17 +17,20 @@ Features:
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import re
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 from uuid import UUID, uuid4
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic_core import to_jsonable_python
 import numpy as np
 
 from .conversation import (
@@ -40,6 +43,23 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Offset from time.monotonic() to the epoch, for turning monotonic stamps into datetimes
+_MONOTONIC_EPOCH_OFFSET = time.time() - time.monotonic()
+
+
+def _monotonic_to_datetime(stamp: float) -> datetime:
+    """Convert a time.monotonic() stamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(_MONOTONIC_EPOCH_OFFSET + stamp, timezone.utc)
+
+
+def _dump_with_wall_clock(obj: Any, mode: str, wall_clock_fields: Dict[str, str]) -> Dict[str, Any]:
+    """model_dump-style dict of a dataclass, filling unset datetimes from their monotonic stamps."""
+    data = {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith("_")}
+    for name, mono_name in wall_clock_fields.items():
+        if data[name] is None and data[mono_name] is not None:
+            data[name] = _monotonic_to_datetime(data[mono_name])
+    return to_jsonable_python(data) if mode == "json" else data
+
 
 class AgentType(str, Enum):
     """Types of AI agents in the orchestration system."""
@@ -81,41 +101,84 @@ class AgentStatus(str, Enum):
     ERROR = "error"
 
 
-class AgentCapability(BaseModel):
+# Column order of the orchestrator's agent capability matrix
+TASK_TYPE_INDEX: Dict[TaskType, int] = {task_type: i for i, task_type in enumerate(TaskType)}
+
+
+@dataclass(slots=True, kw_only=True)
+class AgentCapability:
     """Represents a capability of an AI agent."""
     capability_type: TaskType
-    proficiency_level: float = Field(ge=0.0, le=1.0)  # 0.0 to 1.0
-    max_concurrent_tasks: int = Field(ge=1, default=1)
+    proficiency_level: float  # 0.0 to 1.0
+    max_concurrent_tasks: int = 1
     average_completion_time: float = 0.0  # seconds
-    success_rate: float = Field(ge=0.0, le=1.0, default=1.0)
+    success_rate: float = 1.0
     cost_per_task: float = 0.0
-    specialization_tags: List[str] = Field(default_factory=list)
+    specialization_tags: List[str] = field(default_factory=list)
+    
+    def __post_init__(self):
+        self.capability_type = TaskType(self.capability_type)
+        if not 0.0 <= self.proficiency_level <= 1.0:
+            raise ValueError(f"proficiency_level must be between 0.0 and 1.0, got {self.proficiency_level}")
+        if self.max_concurrent_tasks < 1:
+            raise ValueError(f"max_concurrent_tasks must be at least 1, got {self.max_concurrent_tasks}")
+        if not 0.0 <= self.success_rate <= 1.0:
+            raise ValueError(f"success_rate must be between 0.0 and 1.0, got {self.success_rate}")
+    
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        """Dictionary form, compatible with the former pydantic model."""
+        return _dump_with_wall_clock(self, mode, {})
 
 
-class WorkflowTask(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class WorkflowTask:
     """Represents a task in a workflow."""
-    task_id: str = Field(default_factory=lambda: str(uuid4()))
+    task_id: str = field(default_factory=lambda: str(uuid4()))
     task_type: TaskType
     description: str
-    priority: int = Field(ge=1, le=10, default=5)  # 1 = highest, 10 = lowest
-    requirements: Dict[str, Any] = Field(default_factory=dict)
-    dependencies: List[str] = Field(default_factory=list)  # Task IDs
+    priority: int = 5  # 1 = highest, 10 = lowest
+    requirements: Dict[str, Any] = field(default_factory=dict)
+    dependencies: List[str] = field(default_factory=list)  # Task IDs
+    children: List[str] = field(default_factory=list)  # Dependent task IDs, filled in by the workflow
     estimated_duration: float = 0.0  # seconds
     max_retries: int = 3
     timeout: float = 300.0  # 5 minutes default
-    context: Dict[str, Any] = Field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
     
     # Execution state
     status: TaskStatus = TaskStatus.PENDING
     assigned_agent_id: Optional[str] = None
     start_time: Optional[datetime] = None
     completion_time: Optional[datetime] = None
+    start_time_mono: Optional[float] = None  # time.monotonic() stamps; datetimes are filled on dump
+    completion_time_mono: Optional[float] = None
     result: Optional[Any] = None
     error_message: Optional[str] = None
     retry_count: int = 0
+    _tokens: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.task_type = TaskType(self.task_type)
+        self.status = TaskStatus(self.status)
+        if not 1 <= self.priority <= 10:
+            raise ValueError(f"priority must be between 1 and 10, got {self.priority}")
+    
+    @property
+    def tokens(self) -> frozenset:
+        """Lower-cased words of the description, for agent keyword matching."""
+        if self._tokens is None:
+            self._tokens = frozenset(re.findall(r"\w+", self.description.lower()))
+        return self._tokens
+    
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        """Dictionary form, compatible with the former pydantic model."""
+        return _dump_with_wall_clock(
+            self, mode, {"start_time": "start_time_mono", "completion_time": "completion_time_mono"}
+        )
 
 
-class AgentPerformanceMetrics(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentPerformanceMetrics:
     """Performance metrics for an AI agent."""
     total_tasks_completed: int = 0
     total_tasks_failed: int = 0
@@ -123,7 +186,12 @@ class AgentPerformanceMetrics(BaseModel):
     success_rate: float = 1.0
     current_load: int = 0
     last_activity: Optional[datetime] = None
+    last_activity_mono: Optional[float] = None  # time.monotonic() stamp; last_activity is filled on dump
     availability_score: float = 1.0  # 0.0 = unavailable, 1.0 = fully available
+    
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        """Dictionary form, compatible with the former pydantic model."""
+        return _dump_with_wall_clock(self, mode, {"last_activity": "last_activity_mono"})
 
 
 class AIAgent(ABC):
@@ -140,9 +208,14 @@ class AIAgent(ABC):
         self.agent_type = agent_type
         self.name = name
         self.capabilities = {cap.capability_type: cap for cap in capabilities}
+        # Capabilities are fixed after construction, so their capacity is too
+        self._total_capacity = sum(cap.max_concurrent_tasks for cap in self.capabilities.values())
         self.metrics = AgentPerformanceMetrics()
         self.is_active = True
-        self.current_tasks: Set[str] = set()
+        self.active_task_count = 0  # Only the count of in-flight tasks is ever needed
+        # Durations collected while a completion batch is open (see begin_completion_batch)
+        self._pending_durations: Optional[List[float]] = None
+        self._completion_batch_depth = 0
         
     @abstractmethod
     async def execute_task(self, task: WorkflowTask) -> Any:
@@ -162,16 +235,10 @@ class AIAgent(ABC):
     
     def get_availability_score(self) -> float:
         """Calculate current availability based on load and capabilities."""
-        if not self.is_active:
+        if not self.is_active or not self._total_capacity:
             return 0.0
         
-        total_capacity = sum(cap.max_concurrent_tasks for cap in self.capabilities.values())
-        current_load = len(self.current_tasks)
-        
-        if total_capacity == 0:
-            return 0.0
-        
-        load_ratio = current_load / total_capacity
+        load_ratio = self.active_task_count / self._total_capacity
         availability = max(0.0, 1.0 - load_ratio)
         
         # Factor in success rate
@@ -181,32 +248,53 @@ class AIAgent(ABC):
     
     async def start_task(self, task: WorkflowTask) -> None:
         """Mark a task as started."""
-        self.current_tasks.add(task.task_id)
+        self.active_task_count += 1
         task.assigned_agent_id = self.agent_id
         task.status = TaskStatus.IN_PROGRESS
-        task.start_time = datetime.now(timezone.utc)
-        self.metrics.last_activity = task.start_time
+        task.start_time_mono = time.monotonic()
+        task.start_time = None
+        self.metrics.last_activity_mono = task.start_time_mono
+        self.metrics.last_activity = None
     
     async def complete_task(self, task: WorkflowTask, result: Any) -> None:
         """Mark a task as completed with result."""
-        self.current_tasks.discard(task.task_id)
+        self.active_task_count = max(0, self.active_task_count - 1)
         task.status = TaskStatus.COMPLETED
-        task.completion_time = datetime.now(timezone.utc)
+        task.completion_time_mono = time.monotonic()
+        task.completion_time = None
         task.result = result
         
         # Update metrics
         self.metrics.total_tasks_completed += 1
-        if task.start_time and task.completion_time:
-            duration = (task.completion_time - task.start_time).total_seconds()
-            self._update_average_completion_time(duration)
+        if task.start_time_mono is not None:
+            duration = task.completion_time_mono - task.start_time_mono
+            if self._pending_durations is not None:
+                self._pending_durations.append(duration)
+            else:
+                self._update_average_completion_time(duration)
         
         self._update_success_rate()
     
+    def begin_completion_batch(self) -> None:
+        """Defer average-completion-time updates until end_completion_batch()."""
+        self._completion_batch_depth += 1
+        if self._pending_durations is None:
+            self._pending_durations = []
+    
+    def end_completion_batch(self) -> None:
+        """Fold the durations deferred since begin_completion_batch() into the average at once."""
+        self._completion_batch_depth = max(0, self._completion_batch_depth - 1)
+        if self._completion_batch_depth == 0 and self._pending_durations is not None:
+            durations, self._pending_durations = self._pending_durations, None
+            if durations:
+                self._update_average_completion_time_batch(np.asarray(durations, dtype=np.float64))
+    
     async def fail_task(self, task: WorkflowTask, error: str) -> None:
         """Mark a task as failed with error."""
-        self.current_tasks.discard(task.task_id)
+        self.active_task_count = max(0, self.active_task_count - 1)
         task.status = TaskStatus.FAILED
-        task.completion_time = datetime.now(timezone.utc)
+        task.completion_time_mono = time.monotonic()
+        task.completion_time = None
         task.error_message = error
         
         # Update metrics
@@ -224,6 +312,15 @@ class AIAgent(ABC):
                 (current_avg * (total_completed - 1) + new_duration) / total_completed
             )
     
+    def _update_average_completion_time_batch(self, durations: np.ndarray) -> None:
+        """Merge a batch of durations into the running average with one sum."""
+        total_completed = self.metrics.total_tasks_completed
+        previous_count = max(0, total_completed - len(durations))
+        current_avg = self.metrics.average_completion_time
+        self.metrics.average_completion_time = float(
+            (current_avg * previous_count + durations.sum()) / max(total_completed, len(durations))
+        )
+    
     def _update_success_rate(self) -> None:
         """Update the success rate based on completed vs failed tasks."""
         total_tasks = self.metrics.total_tasks_completed + self.metrics.total_tasks_failed
@@ -234,6 +331,8 @@ class AIAgent(ABC):
 class ConversationalAgent(AIAgent):
     """Agent specialized in conversation and dialogue tasks."""
     
+    _KEYWORDS = frozenset({"conversation", "chat"})
+    
     def __init__(
         self,
         agent_id: str,
@@ -286,7 +385,7 @@ class ConversationalAgent(AIAgent):
         
         # Bonus for conversation-related context
         context_bonus = 0.0
-        if "conversation" in task.description.lower() or "chat" in task.description.lower():
+        if self._KEYWORDS & task.tokens:
             context_bonus = 0.1
         
         return min(1.0, base_score * availability + context_bonus)
@@ -351,6 +450,8 @@ class ConversationalAgent(AIAgent):
 class AnalyticalAgent(AIAgent):
     """Agent specialized in analysis and research tasks."""
     
+    _KEYWORDS = frozenset({"analyze", "research", "investigate", "study", "examine"})
+    
     def __init__(
         self,
         agent_id: str,
@@ -401,8 +502,7 @@ class AnalyticalAgent(AIAgent):
         
         # Bonus for analytical keywords
         analysis_bonus = 0.0
-        analysis_keywords = ["analyze", "research", "investigate", "study", "examine"]
-        if any(keyword in task.description.lower() for keyword in analysis_keywords):
+        if self._KEYWORDS & task.tokens:
             analysis_bonus = 0.15
         
         return min(1.0, base_score * availability + analysis_bonus)
@@ -466,6 +566,77 @@ class AnalyticalAgent(AIAgent):
 class CreativeAgent(AIAgent):
     """Agent specialized in creative content generation and ideation."""
     
+    _KEYWORDS = frozenset({"create", "generate", "write", "design", "brainstorm", "ideate"})
+    
+    # Static content templates, filled with str.format per task
+    _STORY_ELEMENTS = {
+        "adventure": "brave hero embarked on a perilous journey",
+        "mystery": "detective discovered a puzzling case",
+        "romance": "two hearts found each other against all odds",
+        "sci-fi": "explorer ventured into uncharted space",
+        "fantasy": "magical being awakened from ancient slumber"
+    }
+    
+    _STORY_TEMPLATE = """In a world inspired by {inspiration_context}, a {element}. 
+        
+The {style} narrative unfolded with unexpected twists, revealing deeper truths about {theme}. 
+As the story progressed, themes of courage, discovery, and transformation emerged, 
+creating a compelling tale that resonated with universal human experiences.
+
+Through creative storytelling, the narrative explored the essence of {theme}, 
+weaving together elements of {style} style with imaginative scenarios 
+that captured the reader's imagination and left them pondering the possibilities."""
+    
+    _ARTICLE_TEMPLATE = """# Exploring {theme_title}: A {style_title} Perspective
+
+## Introduction
+
+The fascinating world of {theme} offers countless opportunities for exploration and understanding. 
+Drawing from diverse sources of inspiration, this article delves into the key aspects that make 
+{theme} such a compelling subject.
+
+## Key Insights
+
+Through careful analysis and creative thinking, several important insights emerge:
+
+1. **Innovation Factor**: {theme} represents a unique opportunity for breakthrough thinking
+2. **Practical Applications**: Real-world applications demonstrate the value of {theme}
+3. **Future Potential**: The trajectory of {theme} suggests exciting developments ahead
+
+## Creative Synthesis
+
+By combining traditional approaches with innovative methodologies, we can unlock new 
+perspectives on {theme}. This synthesis approach reveals hidden connections and 
+unexpected possibilities.
+
+## Conclusion
+
+The exploration of {theme} through a {style} lens demonstrates the power of creative 
+thinking in generating fresh insights and practical solutions."""
+    
+    _IDEA_TEMPLATES: Tuple[str, ...] = (
+        "💡 Interactive {theme} experience that engages users through immersive storytelling",
+        "🎨 Creative {theme} workshop combining traditional methods with digital innovation",
+        "🔗 Community-driven {theme} platform fostering collaboration and knowledge sharing",
+        "🚀 Gamified {theme} learning system with progressive challenges and rewards",
+        "🌐 Virtual {theme} environment enabling global participation and cultural exchange"
+    )
+    
+    _GENERAL_TEMPLATE = """Creative exploration of {theme} reveals fascinating possibilities. 
+        
+Through {style} examination, we discover innovative approaches that challenge 
+conventional thinking. The integration of diverse perspectives creates a rich 
+tapestry of ideas that inspire further exploration.
+
+Key creative elements include:
+- Imaginative problem-solving approaches
+- Innovative synthesis of existing concepts  
+- Fresh perspectives on familiar challenges
+- Unexpected connections between disparate ideas
+
+This creative journey demonstrates the power of open-minded exploration 
+and the value of embracing unconventional thinking patterns."""
+    
     def __init__(
         self,
         agent_id: str,
@@ -522,8 +693,7 @@ class CreativeAgent(AIAgent):
         
         # Bonus for creative keywords
         creative_bonus = 0.0
-        creative_keywords = ["create", "generate", "write", "design", "brainstorm", "ideate"]
-        if any(keyword in task.description.lower() for keyword in creative_keywords):
+        if self._KEYWORDS & task.tokens:
             creative_bonus = 0.2
         
         return min(1.0, base_score * availability + creative_bonus)
@@ -595,86 +765,25 @@ class CreativeAgent(AIAgent):
     def _generate_story(self, theme: str, style: str, inspiration: List[str]) -> str:
         """Generate a creative story."""
         inspiration_context = " ".join(inspiration[:2]) if inspiration else "a mysterious world"
+        element = self._STORY_ELEMENTS.get(theme, "character faced an unexpected challenge")
         
-        story_elements = {
-            "adventure": "brave hero embarked on a perilous journey",
-            "mystery": "detective discovered a puzzling case",
-            "romance": "two hearts found each other against all odds",
-            "sci-fi": "explorer ventured into uncharted space",
-            "fantasy": "magical being awakened from ancient slumber"
-        }
-        
-        element = story_elements.get(theme, "character faced an unexpected challenge")
-        
-        story = f"""In a world inspired by {inspiration_context}, a {element}. 
-        
-The {style} narrative unfolded with unexpected twists, revealing deeper truths about {theme}. 
-As the story progressed, themes of courage, discovery, and transformation emerged, 
-creating a compelling tale that resonated with universal human experiences.
-
-Through creative storytelling, the narrative explored the essence of {theme}, 
-weaving together elements of {style} style with imaginative scenarios 
-that captured the reader's imagination and left them pondering the possibilities."""
-        
-        return story
+        return self._STORY_TEMPLATE.format(
+            inspiration_context=inspiration_context, element=element, style=style, theme=theme
+        )
     
     def _generate_article(self, theme: str, style: str, inspiration: List[str]) -> str:
         """Generate an informative article."""
-        return f"""# Exploring {theme.title()}: A {style.title()} Perspective
-
-## Introduction
-
-The fascinating world of {theme} offers countless opportunities for exploration and understanding. 
-Drawing from diverse sources of inspiration, this article delves into the key aspects that make 
-{theme} such a compelling subject.
-
-## Key Insights
-
-Through careful analysis and creative thinking, several important insights emerge:
-
-1. **Innovation Factor**: {theme} represents a unique opportunity for breakthrough thinking
-2. **Practical Applications**: Real-world applications demonstrate the value of {theme}
-3. **Future Potential**: The trajectory of {theme} suggests exciting developments ahead
-
-## Creative Synthesis
-
-By combining traditional approaches with innovative methodologies, we can unlock new 
-perspectives on {theme}. This synthesis approach reveals hidden connections and 
-unexpected possibilities.
-
-## Conclusion
-
-The exploration of {theme} through a {style} lens demonstrates the power of creative 
-thinking in generating fresh insights and practical solutions."""
+        return self._ARTICLE_TEMPLATE.format(
+            theme=theme, style=style, theme_title=theme.title(), style_title=style.title()
+        )
     
     def _generate_ideas(self, theme: str, inspiration: List[str]) -> str:
         """Generate creative ideas."""
-        ideas = [
-            f"💡 Interactive {theme} experience that engages users through immersive storytelling",
-            f"🎨 Creative {theme} workshop combining traditional methods with digital innovation",
-            f"🔗 Community-driven {theme} platform fostering collaboration and knowledge sharing",
-            f"🚀 Gamified {theme} learning system with progressive challenges and rewards",
-            f"🌐 Virtual {theme} environment enabling global participation and cultural exchange"
-        ]
-        
-        return "\n".join(ideas)
+        return "\n".join(template.format(theme=theme) for template in self._IDEA_TEMPLATES)
     
     def _generate_general_content(self, theme: str, style: str, inspiration: List[str]) -> str:
         """Generate general creative content."""
-        return f"""Creative exploration of {theme} reveals fascinating possibilities. 
-        
-Through {style} examination, we discover innovative approaches that challenge 
-conventional thinking. The integration of diverse perspectives creates a rich 
-tapestry of ideas that inspire further exploration.
-
-Key creative elements include:
-- Imaginative problem-solving approaches
-- Innovative synthesis of existing concepts  
-- Fresh perspectives on familiar challenges
-- Unexpected connections between disparate ideas
-
-This creative journey demonstrates the power of open-minded exploration 
-and the value of embracing unconventional thinking patterns."""
+        return self._GENERAL_TEMPLATE.format(theme=theme, style=style)
     
     def _brainstorm_solutions(self, problem: str, constraints: List[str]) -> List[Dict[str, str]]:
         """Generate brainstormed solutions."""
@@ -774,6 +883,8 @@ and the value of embracing unconventional thinking patterns."""
 class TaskExecutorAgent(AIAgent):
     """Agent specialized in executing concrete tasks and actions."""
     
+    _KEYWORDS = frozenset({"execute", "run", "process", "calculate", "generate", "automate"})
+    
     def __init__(
         self,
         agent_id: str,
@@ -832,8 +943,7 @@ class TaskExecutorAgent(AIAgent):
         
         # Bonus for action-oriented keywords
         execution_bonus = 0.0
-        execution_keywords = ["execute", "run", "process", "calculate", "generate", "automate"]
-        if any(keyword in task.description.lower() for keyword in execution_keywords):
+        if self._KEYWORDS & task.tokens:
             execution_bonus = 0.15
         
         return min(1.0, base_score * availability + capability_match + execution_bonus)
@@ -1123,6 +1233,8 @@ main();"""
 class CoordinatorAgent(AIAgent):
     """Agent specialized in workflow coordination and orchestration."""
     
+    _KEYWORDS = frozenset({"coordinate", "manage", "orchestrate", "delegate", "organize"})
+    
     def __init__(
         self,
         agent_id: str,
@@ -1174,8 +1286,7 @@ class CoordinatorAgent(AIAgent):
         
         # High bonus for coordination keywords
         coordination_bonus = 0.0
-        coordination_keywords = ["coordinate", "manage", "orchestrate", "delegate", "organize"]
-        if any(keyword in task.description.lower() for keyword in coordination_keywords):
+        if self._KEYWORDS & task.tokens:
             coordination_bonus = 0.25
         
         return min(1.0, base_score * availability + coordination_bonus)
@@ -1397,6 +1508,11 @@ class CoordinatorAgent(AIAgent):
 class WorkflowOrchestrator:
     """Main orchestrator for managing multi-agent workflows."""
     
+    # Weight of queue depth vs. expected wait in the dispatch load function
+    LOAD_ALPHA = 0.5
+    # Agents scoring at or below this for a task are not assigned it
+    MIN_ASSIGNMENT_SCORE = 0.5
+    
     def __init__(self):
         self.agents = {}
         self.workflows = {}
@@ -1404,6 +1520,11 @@ class WorkflowOrchestrator:
         self.completed_tasks = []
         self.performance_metrics = {}
         self.logger = logging.getLogger(__name__)
+        
+        # Agent rows for vectorized dispatch, rebuilt when agents come and go
+        self._agent_order: List[AIAgent] = []
+        self._capability_matrix = np.zeros((0, len(TASK_TYPE_INDEX)), dtype=np.float32)
+        self._agent_capacity = np.zeros(0, dtype=np.float64)
     
     def register_agent(self, agent: AIAgent) -> None:
         """Register an agent with the orchestrator."""
@@ -1414,6 +1535,7 @@ class WorkflowOrchestrator:
             "total_execution_time": 0.0,
             "average_execution_time": 0.0
         }
+        self._rebuild_agent_arrays()
         self.logger.info(f"Registered agent: {agent.name} ({agent.agent_id})")
     
     def unregister_agent(self, agent_id: str) -> None:
@@ -1422,8 +1544,59 @@ class WorkflowOrchestrator:
             agent = self.agents[agent_id]
             del self.agents[agent_id]
             del self.performance_metrics[agent_id]
+            self._rebuild_agent_arrays()
             self.logger.info(f"Unregistered agent: {agent.name} ({agent_id})")
     
+    def _rebuild_agent_arrays(self) -> None:
+        """Rebuild the agent x task-type proficiency matrix and capacity vector."""
+        self._agent_order = list(self.agents.values())
+        matrix = np.zeros((len(self._agent_order), len(TASK_TYPE_INDEX)), dtype=np.float32)
+        for row, agent in enumerate(self._agent_order):
+            for task_type, capability in agent.capabilities.items():
+                matrix[row, TASK_TYPE_INDEX[task_type]] = capability.proficiency_level
+        self._capability_matrix = matrix
+        self._agent_capacity = np.array([a._total_capacity for a in self._agent_order], dtype=np.float64)
+    
+    def _select_agent_by_load(self, task: WorkflowTask) -> Optional[AIAgent]:
+        """Pick the best capable agent with one vectorized argmin.
+        
+        Each agent's base score is proficiency * availability, the same product
+        can_handle_task starts from; agents at or below MIN_ASSIGNMENT_SCORE are
+        masked out. Among the rest the cost is L(i) + (1 - score(i)), where
+        L(i) = alpha * (Q_i / max Q) + (1 - alpha) * (D_i / max D), Q is the agent's
+        queue depth and D its expected wait from the average completion time.
+        """
+        if not self._agent_order:
+            return None
+        
+        agents = self._agent_order
+        queue_depth = np.fromiter((a.active_task_count for a in agents), dtype=np.float64, count=len(agents))
+        avg_time = np.fromiter(
+            (a.metrics.average_completion_time for a in agents), dtype=np.float64, count=len(agents)
+        )
+        success_rate = np.fromiter((a.metrics.success_rate for a in agents), dtype=np.float64, count=len(agents))
+        active = np.fromiter((a.is_active for a in agents), dtype=bool, count=len(agents))
+        
+        capacity = self._agent_capacity
+        availability = np.where(
+            active & (capacity > 0),
+            np.clip(1.0 - queue_depth / np.maximum(capacity, 1.0), 0.0, None) * success_rate,
+            0.0
+        )
+        scores = self._capability_matrix[:, TASK_TYPE_INDEX[task.task_type]] * availability
+        eligible = scores > self.MIN_ASSIGNMENT_SCORE
+        if not eligible.any():
+            return None
+        
+        max_wait = (queue_depth + 1.0) * avg_time
+        alpha = self.LOAD_ALPHA
+        loads = (
+            alpha * queue_depth / (queue_depth.max() or 1.0)
+            + (1.0 - alpha) * max_wait / (max_wait.max() or 1.0)
+        )
+        
+        return agents[int(np.argmin(np.where(eligible, loads + (1.0 - scores), np.inf)))]
+    
     async def create_workflow(
         self,
         workflow_id: str,
@@ -1438,11 +1611,19 @@ class WorkflowOrchestrator:
     
     async def assign_task(self, task: WorkflowTask) -> Optional[AIAgent]:
         """Assign a task to the most suitable agent."""
+        agent = self._select_agent_by_load(task)
+        if agent:
+            task.assigned_agent_id = agent.agent_id
+            task.status = TaskStatus.ASSIGNED
+            self.logger.info(f"Assigned task {task.task_id} to agent {agent.agent_id} (load dispatch)")
+            return agent
+        
+        # Fall back to asking each agent, whose keyword bonuses can lift it over the threshold
         best_agent = None
         best_score = 0.0
         
         for agent in self.agents.values():
-            if agent.status == AgentStatus.AVAILABLE:
+            if agent.is_active:
                 try:
                     score = await agent.can_handle_task(task)
                     if score > best_score:
@@ -1451,7 +1632,9 @@ class WorkflowOrchestrator:
                 except Exception as e:
                     self.logger.warning(f"Error evaluating agent {agent.agent_id} for task: {e}")
         
-        if best_agent and best_score > 0.5:  # Minimum score threshold
+        if best_agent and best_score > self.MIN_ASSIGNMENT_SCORE:
+            task.assigned_agent_id = best_agent.agent_id
+            task.status = TaskStatus.ASSIGNED
             self.logger.info(f"Assigned task {task.task_id} to agent {best_agent.agent_id} (score: {best_score:.2f})")
             return best_agent
         
@@ -1483,7 +1666,7 @@ class WorkflowOrchestrator:
                 "name": agent.name,
                 "type": agent.agent_type.value,
                 "status": agent.status.value,
-                "current_tasks": len(agent.current_tasks),
+                "current_tasks": agent.active_task_count,
                 "availability_score": agent.get_availability_score(),
                 "success_rate": self._calculate_success_rate(agent_id),
                 "average_execution_time": metrics["average_execution_time"]
@@ -1496,7 +1679,7 @@ class WorkflowOrchestrator:
             return {"error": f"Workflow {workflow_id} not found"}
         
         workflow = self.workflows[workflow_id]
-        return workflow.get_status()
+        return workflow.get_workflow_summary()
     
     def _calculate_success_rate(self, agent_id: str) -> float:
         """Calculate success rate for an agent."""
@@ -1527,383 +1710,75 @@ class Workflow:
         self,
         workflow_id: str,
         tasks: List[WorkflowTask],
-        execution_strategy: str = "sequential",
-        orchestrator = None
+        workflow_type: str = "parallel",
+        orchestrator: WorkflowOrchestrator = None
     ):
         self.workflow_id = workflow_id
         self.tasks = tasks
-        self.execution_strategy = execution_strategy
+        self.workflow_type = workflow_type  # "parallel", "sequential", "conditional"
         self.orchestrator = orchestrator
-        self.status = TaskStatus.PENDING
-        self.start_time = None
-        self.end_time = None
-        self.results = {}
-        self.logger = logging.getLogger(__name__)
-    
-    async def execute(self) -> Dict[str, Any]:
-        """Execute the workflow according to the specified strategy."""
-        self.status = TaskStatus.IN_PROGRESS
-        self.start_time = datetime.now(timezone.utc)
-        self.logger.info(f"Starting workflow {self.workflow_id} with {self.execution_strategy} execution")
+        self.start_time: Optional[datetime] = None
+        self.completion_time: Optional[datetime] = None
+        self.is_completed = False
+        self.results: Dict[str, Any] = {}
         
-        try:
-            if self.execution_strategy == "sequential":
-                results = await self._execute_sequential()
-            elif self.execution_strategy == "parallel":
-                results = await self._execute_parallel()
-            elif self.execution_strategy == "conditional":
-                results = await self._execute_conditional()
-            else:
-                raise ValueError(f"Unknown execution strategy: {self.execution_strategy}")
-            
-            self.status = TaskStatus.COMPLETED
-            self.end_time = datetime.now(timezone.utc)
-            self.results = results
-            
-            return {
-                "workflow_id": self.workflow_id,
-                "status": self.status.value,
-                "execution_time": (self.end_time - self.start_time).total_seconds(),
-                "results": results
-            }
-            
-        except Exception as e:
-            self.status = TaskStatus.FAILED
-            self.end_time = datetime.now(timezone.utc)
-            self.logger.error(f"Workflow {self.workflow_id} failed: {e}")
-            raise
+        # Ready queue keyed by (-(topL + bottomL), priority, task_id) so critical-path tasks run first
+        self._tasks_by_id: Dict[str, WorkflowTask] = {task.task_id: task for task in tasks}
+        self._parent_counts: Dict[str, int] = {}
+        self._ready_heap: List[Tuple[int, int, str]] = []
+        self._dag_levels: Dict[str, int] = {}
+        self._build_dependency_graph()
     
-    async def _execute_sequential(self) -> Dict[str, Any]:
-        """Execute tasks sequentially."""
-        results = {}
-        
+    def _build_dependency_graph(self) -> None:
+        """Link children to their dependencies and compute each task's top+bottom level."""
         for task in self.tasks:
-            self.logger.info(f"Executing task {task.task_id} sequentially")
-            
-            # Assign and execute task
-            agent = await self.orchestrator.assign_task(task)
-            if agent:
-                try:
-                    start_time = datetime.now(timezone.utc)
-                    result = await agent.execute_task(task)
-                    end_time = datetime.now(timezone.utc)
-                    
-                    execution_time = (end_time - start_time).total_seconds()
-                    self.orchestrator._update_agent_metrics(agent.agent_id, execution_time, True)
-                    
-                    results[task.task_id] = result
-                    self.logger.info(f"Task {task.task_id} completed successfully")
-                    
-                except Exception as e:
-                    execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                    self.orchestrator._update_agent_metrics(agent.agent_id, execution_time, False)
-                    
-                    self.logger.error(f"Task {task.task_id} failed: {e}")
-                    results[task.task_id] = {"error": str(e)}
-            else:
-                self.logger.error(f"No agent available for task {task.task_id}")
-                results[task.task_id] = {"error": "No suitable agent found"}
-        
-        return results
-    
-    async def _execute_parallel(self) -> Dict[str, Any]:
-        """Execute tasks in parallel."""
-        async def execute_single_task(task: WorkflowTask) -> tuple:
-            self.logger.info(f"Executing task {task.task_id} in parallel")
-            
-            agent = await self.orchestrator.assign_task(task)
-            if agent:
-                try:
-                    start_time = datetime.now(timezone.utc)
-                    result = await agent.execute_task(task)
-                    end_time = datetime.now(timezone.utc)
-                    
-                    execution_time = (end_time - start_time).total_seconds()
-                    self.orchestrator._update_agent_metrics(agent.agent_id, execution_time, True)
-                    
-                    return task.task_id, result
-                    
-                except Exception as e:
-                    execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                    self.orchestrator._update_agent_metrics(agent.agent_id, execution_time, False)
-                    
-                    self.logger.error(f"Task {task.task_id} failed: {e}")
-                    return task.task_id, {"error": str(e)}
-            else:
-                self.logger.error(f"No agent available for task {task.task_id}")
-                return task.task_id, {"error": "No suitable agent found"}
-        
-        # Execute all tasks concurrently
-        task_coroutines = [execute_single_task(task) for task in self.tasks]
-        task_results = await asyncio.gather(*task_coroutines, return_exceptions=True)
-        
-        # Organize results
-        results = {}
-        for result in task_results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Task execution failed with exception: {result}")
-                results["unknown"] = {"error": str(result)}
-            else:
-                task_id, task_result = result
-                results[task_id] = task_result
-        
-        return results
-    
-    async def _execute_conditional(self) -> Dict[str, Any]:
-        """Execute tasks based on conditional logic."""
-        results = {}
-        
+            task.children = []
         for task in self.tasks:
-            # Check if task should be executed based on conditions
-            should_execute = self._evaluate_task_conditions(task, results)
-            
-            if should_execute:
-                self.logger.info(f"Executing conditional task {task.task_id}")
-                
-                agent = await self.orchestrator.assign_task(task)
-                if agent:
-                    try:
-                        start_time = datetime.now(timezone.utc)
-                        result = await agent.execute_task(task)
-                        end_time = datetime.now(timezone.utc)
-                        
-                        execution_time = (end_time - start_time).total_seconds()
-                        self.orchestrator._update_agent_metrics(agent.agent_id, execution_time, True)
-                        
-                        results[task.task_id] = result
-                        self.logger.info(f"Conditional task {task.task_id} completed")
-                        
-                    except Exception as e:
-                        execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
-                        self.orchestrator._update_agent_metrics(agent.agent_id, execution_time, False)
-                        
-                        self.logger.error(f"Conditional task {task.task_id} failed: {e}")
-                        results[task.task_id] = {"error": str(e)}
-                else:
-                    self.logger.error(f"No agent available for conditional task {task.task_id}")
-                    results[task.task_id] = {"error": "No suitable agent found"}
-            else:
-                self.logger.info(f"Skipping conditional task {task.task_id} (conditions not met)")
-                results[task.task_id] = {"status": "skipped", "reason": "conditions not met"}
-        
-        return results
-    
-    def _evaluate_task_conditions(self, task: WorkflowTask, previous_results: Dict[str, Any]) -> bool:
-        """Evaluate whether a task should be executed based on conditions."""
-        conditions = task.requirements.get("conditions", [])
-        
-        if not conditions:
-            return True  # No conditions means always execute
-        
-        for condition in conditions:
-            condition_type = condition.get("type", "")
-            
-            if condition_type == "task_success":
-                required_task = condition.get("task_id", "")
-                if required_task in previous_results:
-                    result = previous_results[required_task]
-                    if "error" in result:
-                        return False
-                else:
-                    return False
-            
-            elif condition_type == "task_result":
-                required_task = condition.get("task_id", "")
-                expected_value = condition.get("value", "")
-                result_path = condition.get("path", "")
-                
-                if required_task in previous_results:
-                    result = previous_results[required_task]
-                    if result_path:
-                        # Navigate to specific path in result
-                        value = result
-                        for key in result_path.split("."):
-                            if isinstance(value, dict) and key in value:
-                                value = value[key]
-                            else:
-                                return False
-                        
-                        if value != expected_value:
-                            return False
-                    else:
-                        return False
-                else:
-                    return False
-        
-        return True
-    
-    def get_status(self) -> Dict[str, Any]:
-        """Get current status of the workflow."""
-        return {
-            "workflow_id": self.workflow_id,
-            "status": self.status.value,
-            "execution_strategy": self.execution_strategy,
-            "total_tasks": len(self.tasks),
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "execution_time": (
-                (self.end_time - self.start_time).total_seconds() 
-                if self.start_time and self.end_time 
-                else None
-            )
+            self._parent_counts[task.task_id] = len(task.dependencies)
+            for dep_task_id in task.dependencies:
+                parent = self._tasks_by_id.get(dep_task_id)
+                if parent is not None:
+                    parent.children.append(task.task_id)
+        
+        # Kahn's algorithm; tasks on a cycle never get a level and never become ready
+        remaining = {
+            task.task_id: sum(1 for dep in task.dependencies if dep in self._tasks_by_id)
+            for task in self.tasks
         }
-    """Main orchestrator for managing multi-agent workflows."""
-    
-    def __init__(self):
-        self.agents: Dict[str, AIAgent] = {}
-        self.workflows: Dict[str, 'Workflow'] = {}
-        self.task_queue: List[WorkflowTask] = []
-        self.completed_tasks: List[WorkflowTask] = []
-        self.orchestration_stats = {
-            "total_workflows": 0,
-            "completed_workflows": 0,
-            "total_tasks": 0,
-            "completed_tasks": 0,
-            "average_workflow_time": 0.0
-        }
-        
-        logger.info("Initialized WorkflowOrchestrator")
-    
-    def register_agent(self, agent: AIAgent) -> None:
-        """Register an agent with the orchestrator."""
-        self.agents[agent.agent_id] = agent
-        logger.info(f"Registered agent: {agent.name} ({agent.agent_type.value})")
-    
-    def unregister_agent(self, agent_id: str) -> None:
-        """Unregister an agent from the orchestrator."""
-        if agent_id in self.agents:
-            agent = self.agents[agent_id]
-            del self.agents[agent_id]
-            logger.info(f"Unregistered agent: {agent.name}")
-    
-    async def create_workflow(
-        self,
-        workflow_id: str,
-        tasks: List[WorkflowTask],
-        workflow_type: str = "parallel"
-    ) -> 'Workflow':
-        """Create a new workflow with the given tasks."""
-        workflow = Workflow(
-            workflow_id=workflow_id,
-            tasks=tasks,
-            workflow_type=workflow_type,
-            orchestrator=self
-        )
-        
-        self.workflows[workflow_id] = workflow
-        self.orchestration_stats["total_workflows"] += 1
-        self.orchestration_stats["total_tasks"] += len(tasks)
-        
-        logger.info(f"Created workflow: {workflow_id} with {len(tasks)} tasks")
-        return workflow
-    
-    async def execute_workflow(self, workflow_id: str) -> Dict[str, Any]:
-        """Execute a workflow and return results."""
-        if workflow_id not in self.workflows:
-            raise ValueError(f"Workflow {workflow_id} not found")
+        order = [task_id for task_id, count in remaining.items() if count == 0]
+        for task_id in order:
+            for child_id in self._tasks_by_id[task_id].children:
+                remaining[child_id] -= 1
+                if remaining[child_id] == 0:
+                    order.append(child_id)
+        
+        top_level: Dict[str, int] = {}
+        for task_id in order:
+            task = self._tasks_by_id[task_id]
+            top_level[task_id] = max(
+                (top_level[dep] + 1 for dep in task.dependencies if dep in top_level),
+                default=0
+            )
         
-        workflow = self.workflows[workflow_id]
-        start_time = datetime.now(timezone.utc)
+        bottom_level: Dict[str, int] = {}
+        for task_id in reversed(order):
+            children = self._tasks_by_id[task_id].children
+            bottom_level[task_id] = 1 + max((bottom_level[child] for child in children), default=0)
         
-        try:
-            results = await workflow.execute()
-            
-            # Update statistics
-            completion_time = datetime.now(timezone.utc)
-            duration = (completion_time - start_time).total_seconds()
-            
-            self.orchestration_stats["completed_workflows"] += 1
-            self.orchestration_stats["completed_tasks"] += len([t for t in workflow.tasks if t.status == TaskStatus.COMPLETED])
-            
-            # Update average workflow time
-            total_completed = self.orchestration_stats["completed_workflows"]
-            if total_completed == 1:
-                self.orchestration_stats["average_workflow_time"] = duration
-            else:
-                current_avg = self.orchestration_stats["average_workflow_time"]
-                self.orchestration_stats["average_workflow_time"] = (
-                    (current_avg * (total_completed - 1) + duration) / total_completed
-                )
-            
-            logger.info(f"Completed workflow: {workflow_id} in {duration:.2f} seconds")
-            return results
-            
-        except Exception as e:
-            logger.error(f"Workflow {workflow_id} failed: {e}")
-            raise
+        self._dag_levels = {task_id: top_level[task_id] + bottom_level[task_id] for task_id in order}
     
-    async def assign_task_to_best_agent(self, task: WorkflowTask) -> Optional[AIAgent]:
-        """Find and assign the best available agent for a task."""
-        best_agent = None
-        best_score = 0.0
-        
-        for agent in self.agents.values():
-            if not agent.is_active:
-                continue
-            
-            try:
-                score = await agent.can_handle_task(task)
-                if score > best_score:
-                    best_score = score
-                    best_agent = agent
-            except Exception as e:
-                logger.warning(f"Error evaluating agent {agent.name} for task: {e}")
-        
-        if best_agent and best_score > 0.5:  # Minimum threshold
-            task.assigned_agent_id = best_agent.agent_id
-            task.status = TaskStatus.ASSIGNED
-            logger.info(f"Assigned task {task.task_id} to agent {best_agent.name} (score: {best_score:.3f})")
-            return best_agent
-        
-        logger.warning(f"No suitable agent found for task {task.task_id}")
-        return None
+    def _push_ready(self, task: WorkflowTask) -> None:
+        """Queue a task whose dependencies have all completed."""
+        # Priority 1 is the highest, so it sorts first as-is
+        key = (-self._dag_levels.get(task.task_id, 0), task.priority, task.task_id)
+        heapq.heappush(self._ready_heap, key)
     
-    def get_agent_status(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all registered agents."""
-        status = {}
-        for agent_id, agent in self.agents.items():
-            status[agent_id] = {
-                "name": agent.name,
-                "type": agent.agent_type.value,
-                "active": agent.is_active,
-                "current_tasks": len(agent.current_tasks),
-                "availability_score": agent.get_availability_score(),
-                "success_rate": agent.metrics.success_rate,
-                "total_completed": agent.metrics.total_tasks_completed,
-                "total_failed": agent.metrics.total_tasks_failed,
-                "average_completion_time": agent.metrics.average_completion_time
-            }
-        return status
-    
-    def get_orchestration_stats(self) -> Dict[str, Any]:
-        """Get overall orchestration statistics."""
-        return {
-            **self.orchestration_stats,
-            "active_agents": len([a for a in self.agents.values() if a.is_active]),
-            "total_agents": len(self.agents),
-            "active_workflows": len([w for w in self.workflows.values() if not w.is_completed]),
-            "total_workflows": len(self.workflows)
-        }
-
-
-class Workflow:
-    """Represents a workflow consisting of multiple tasks."""
-    
-    def __init__(
-        self,
-        workflow_id: str,
-        tasks: List[WorkflowTask],
-        workflow_type: str = "parallel",
-        orchestrator: WorkflowOrchestrator = None
-    ):
-        self.workflow_id = workflow_id
-        self.tasks = tasks
-        self.workflow_type = workflow_type  # "parallel", "sequential", "conditional"
-        self.orchestrator = orchestrator
-        self.start_time: Optional[datetime] = None
-        self.completion_time: Optional[datetime] = None
-        self.is_completed = False
-        self.results: Dict[str, Any] = {}
+    def _release_children(self, task: WorkflowTask) -> None:
+        """Decrement the parent count of each child and queue those that became ready."""
+        for child_id in task.children:
+            self._parent_counts[child_id] -= 1
+            if self._parent_counts[child_id] == 0:
+                self._push_ready(self._tasks_by_id[child_id])
     
     async def execute(self) -> Dict[str, Any]:
         """Execute the workflow based on its type."""
@@ -1934,7 +1809,7 @@ class Workflow:
         # Assign tasks to agents
         task_agent_pairs = []
         for task in self.tasks:
-            agent = await self.orchestrator.assign_task_to_best_agent(task)
+            agent = await self.orchestrator.assign_task(task)
             if agent:
                 task_agent_pairs.append((task, agent))
             else:
@@ -1949,11 +1824,18 @@ class Workflow:
                 logger.error(f"Task {task.task_id} failed: {e}")
                 return None
         
-        # Run all tasks concurrently
-        task_results = await asyncio.gather(
-            *[execute_task_with_agent(task, agent) for task, agent in task_agent_pairs],
-            return_exceptions=True
-        )
+        # Run all tasks concurrently, merging each agent's completion times once they have all joined
+        batch_agents = {agent.agent_id: agent for _, agent in task_agent_pairs}.values()
+        for agent in batch_agents:
+            agent.begin_completion_batch()
+        try:
+            task_results = await asyncio.gather(
+                *[execute_task_with_agent(task, agent) for task, agent in task_agent_pairs],
+                return_exceptions=True
+            )
+        finally:
+            for agent in batch_agents:
+                agent.end_completion_batch()
         
         # Collect results
         results = {}
@@ -1973,15 +1855,17 @@ class Workflow:
         """Execute tasks in sequence."""
         results = {}
         
+        self._ready_heap = []
         for task in self.tasks:
-            # Check dependencies
-            if not self._dependencies_satisfied(task, results):
-                task.status = TaskStatus.WAITING_DEPENDENCIES
-                logger.warning(f"Task {task.task_id} waiting for dependencies")
-                continue
+            if self._parent_counts[task.task_id] == 0:
+                self._push_ready(task)
+        
+        while self._ready_heap:
+            _, _, task_id = heapq.heappop(self._ready_heap)
+            task = self._tasks_by_id[task_id]
             
             # Assign and execute task
-            agent = await self.orchestrator.assign_task_to_best_agent(task)
+            agent = await self.orchestrator.assign_task(task)
             if agent:
                 try:
                     result = await agent.execute_task(task)
@@ -2000,6 +1884,9 @@ class Workflow:
                         "agent": agent.name,
                         "error": str(e)
                     }
+                
+                if task.status == TaskStatus.COMPLETED:
+                    self._release_children(task)
             else:
                 task.status = TaskStatus.FAILED
                 task.error_message = "No suitable agent available"
@@ -2011,6 +1898,12 @@ class Workflow:
                     "error": "No suitable agent available"
                 }
         
+        # Anything never released had a failed, missing or cyclic dependency
+        for task in self.tasks:
+            if task.task_id not in results:
+                task.status = TaskStatus.WAITING_DEPENDENCIES
+                logger.warning(f"Task {task.task_id} waiting for dependencies")
+        
         return results
     
     async def _execute_conditional(self) -> Dict[str, Any]:
@@ -2018,18 +1911,6 @@ class Workflow:
         # For now, implement as sequential with dependency checking
         return await self._execute_sequential()
     
-    def _dependencies_satisfied(self, task: WorkflowTask, completed_results: Dict[str, Any]) -> bool:
-        """Check if all dependencies for a task are satisfied."""
-        for dep_task_id in task.dependencies:
-            if dep_task_id not in completed_results:
-                return False
-            
-            dep_result = completed_results[dep_task_id]
-            if dep_result["status"] != TaskStatus.COMPLETED.value:
-                return False
-        
-        return True
-    
     def get_workflow_summary(self) -> Dict[str, Any]:
         """Get a summary of the workflow execution."""
         total_tasks = len(self.tasks)
@@ -12,8 +12,13 @@ Learning Objectives:
 This module implements robust configuration management for the ENTAERA system.
 """
 
+import copy
+import hashlib
+import importlib.util
 import os
-from typing import Optional, List, Literal
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional, List, Literal, Union
 from pathlib import Path
 
 try:
@@ -31,7 +36,7 @@ try:
 except ImportError:
     validator = field_validator
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
 
 class APIProviderSettings(BaseModel):
@@ -72,6 +77,7 @@ class ApplicationSettings(BaseSettings):
     environment: Literal["development", "testing", "production"] = Field(default="development")
     debug: bool = Field(default=True, description="Enable debug mode")
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(default="INFO")
+    log_format: Literal["structured", "simple"] = Field(default="simple")
     
     # Security Settings
     secret_key: str = Field(..., description="Secret key for encryption")
@@ -102,6 +108,20 @@ class ApplicationSettings(BaseSettings):
         
         super().__init__(**kwargs)
     
+    @classmethod
+    def from_compiled(cls, module: ModuleType) -> "ApplicationSettings":
+        """
+        Build settings from a module written by compile_env_to_module.
+        
+        Args:
+            module: Imported env module exposing a SETTINGS dict
+            
+        Returns:
+            ApplicationSettings instance
+        """
+        fields = cls.model_fields
+        return cls(**{key: value for key, value in module.SETTINGS.items() if key in fields})
+    
     class Config:
         env_prefix = ""
 
@@ -354,9 +374,122 @@ def reload_settings() -> Settings:
     """
     global _settings
     _settings = None
+    _load_settings_file.cache_clear()
+    _config_practice_results.cache_clear()
     return get_settings()
 
 
+@lru_cache(maxsize=8)
+def _load_settings_file(
+    dotenv_path: str,
+    mtime_ns: int,
+    environ: tuple
+) -> ApplicationSettings:
+    """Parse and validate one .env file; mtime_ns and environ key the cache to its inputs."""
+    return ApplicationSettings(_env_file=dotenv_path)
+
+
+def _settings_environ() -> tuple:
+    """Environment variables that override ApplicationSettings fields, as a hashable key."""
+    fields = ApplicationSettings.model_fields
+    return tuple(sorted((key, value) for key, value in os.environ.items() if key.lower() in fields))
+
+
+def load_settings(dotenv_path: Optional[Union[str, Path]] = None) -> ApplicationSettings:
+    """
+    Load application settings, optionally from a specific .env file.
+    
+    Settings loaded from a file are validated once per resolved path,
+    modification time and overriding environment variables; each call gets its
+    own deep copy of the cached instance, so callers can't affect each other.
+    Without a file the settings are validated from the environment on every call.
+    
+    Args:
+        dotenv_path: Path to a .env file to read
+        
+    Returns:
+        ApplicationSettings instance
+    """
+    if dotenv_path is None:
+        return ApplicationSettings()
+    
+    path = Path(dotenv_path).resolve()
+    cached = _load_settings_file(str(path), os.stat(path).st_mtime_ns, _settings_environ())
+    return cached.model_copy(deep=True)
+
+
+def compile_env_to_module(
+    dotenv_path: Union[str, Path],
+    cache_dir: Optional[Path] = None
+) -> Path:
+    """
+    Write the values of a .env file out as a Python module of literals.
+    
+    The module is named after a hash of the file contents, so it is only
+    regenerated when the file changes, and importing it again is served from
+    CPython's bytecode cache instead of re-running the dotenv parser.
+    
+    The module holds the same secrets as the .env file, so the cache directory
+    is created owner-only (0o700), the module is written 0o600, and modules
+    generated from earlier versions of the file are removed.
+    
+    Args:
+        dotenv_path: Path to the .env file
+        cache_dir: Directory for generated modules (default .env_cache next to the .env file)
+        
+    Returns:
+        Path to the generated module
+    """
+    dotenv_path = Path(dotenv_path)
+    source = dotenv_path.read_bytes()
+    if cache_dir is None:
+        cache_dir = dotenv_path.resolve().parent / ".env_cache"
+    cache_dir = Path(cache_dir)
+    
+    module_path = cache_dir / f"_env_cache_{hashlib.sha256(source).hexdigest()[:16]}.py"
+    if not module_path.exists():
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        values = {
+            key.lower(): value
+            for key, value in dotenv_values(dotenv_path).items()
+            if value is not None
+        }
+        tmp_path = module_path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(
+                f'"""Generated from {dotenv_path.name}; do not edit."""\n\nSETTINGS = {values!r}\n'
+            )
+        os.replace(tmp_path, module_path)
+        
+        # Drop modules (and their bytecode) left by earlier versions of the file
+        for stale in cache_dir.glob("_env_cache_*.py"):
+            if stale != module_path:
+                stale.unlink(missing_ok=True)
+        for stale in cache_dir.glob("__pycache__/_env_cache_*.pyc"):
+            if not stale.name.startswith(module_path.stem + "."):
+                stale.unlink(missing_ok=True)
+    
+    return module_path
+
+
+def import_env_module(module_path: Union[str, Path]) -> ModuleType:
+    """
+    Import a module generated by compile_env_to_module.
+    
+    Args:
+        module_path: Path returned by compile_env_to_module
+        
+    Returns:
+        The imported module
+    """
+    module_path = Path(module_path)
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def validate_configuration() -> tuple[bool, List[str]]:
     """
     Validate the current configuration.
@@ -399,46 +532,54 @@ def validate_configuration() -> tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+@lru_cache(maxsize=None)
+def _config_practice_results() -> dict:
+    """Analyse the current settings once; failures raise and are not cached."""
+    settings = get_settings()
+    is_valid, errors = validate_configuration()
+    
+    return {
+        "configuration_loaded": True,
+        "is_valid": is_valid,
+        "errors": errors,
+        "environment": settings.application.environment,
+        "debug_mode": settings.application.debug,
+        "providers_configured": {
+            "gemini": settings.api_providers.gemini_api_key != "your_gemini_api_key_here",
+            "perplexity": settings.api_providers.perplexity_api_key != "your_perplexity_api_key_here",
+        },
+        "security": {
+            "secret_key_configured": settings.application.secret_key != "your_secret_key_here",
+            "allowed_hosts": len(settings.application.allowed_hosts),
+            "cors_origins": len(settings.application.cors_origins),
+        },
+        "directories": {
+            "data_dir": settings.database.data_dir,
+            "cache_dir": settings.database.cache_dir,
+            "logs_dir": settings.database.logs_dir,
+        },
+        "learning_notes": [
+            "Configuration uses Pydantic for validation",
+            "Environment variables override defaults",
+            "Settings are validated on startup",
+            "Production mode enforces stricter rules"
+        ]
+    }
+
+
 # Kata practice function
 def kata_practice_config() -> dict:
     """
     Practice function for configuration management kata.
     
+    Successful results are memoized until reload_settings() is called; each
+    call gets its own copy.
+    
     Returns:
         Dictionary with configuration analysis for learning
     """
     try:
-        settings = get_settings()
-        is_valid, errors = validate_configuration()
-        
-        return {
-            "configuration_loaded": True,
-            "is_valid": is_valid,
-            "errors": errors,
-            "environment": settings.application.environment,
-            "debug_mode": settings.application.debug,
-            "providers_configured": {
-                "gemini": settings.api_providers.gemini_api_key != "your_gemini_api_key_here",
-                "perplexity": settings.api_providers.perplexity_api_key != "your_perplexity_api_key_here",
-            },
-            "security": {
-                "secret_key_configured": settings.application.secret_key != "your_secret_key_here",
-                "allowed_hosts": len(settings.application.allowed_hosts),
-                "cors_origins": len(settings.application.cors_origins),
-            },
-            "directories": {
-                "data_dir": settings.database.data_dir,
-                "cache_dir": settings.database.cache_dir,
-                "logs_dir": settings.database.logs_dir,
-            },
-            "learning_notes": [
-                "Configuration uses Pydantic for validation",
-                "Environment variables override defaults",
-                "Settings are validated on startup",
-                "Production mode enforces stricter rules"
-            ]
-        }
-    
+        return copy.deepcopy(_config_practice_results())
     except Exception as e:
         return {
             "configuration_loaded": False,
@@ -12,8 +12,10 @@ Learning Objectives:
 This module implements comprehensive logging infrastructure for the ENTAERA system.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 import json
 from datetime import datetime
@@ -21,6 +23,12 @@ from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from contextvars import ContextVar
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import structlog
     STRUCTLOG_AVAILABLE = True
@@ -31,6 +39,26 @@ except ImportError:
 request_id: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 
 
+def _record_request_id(record: logging.LogRecord) -> Optional[str]:
+    """Request ID stamped on the record, falling back to the current context."""
+    return getattr(record, "request_id", None) or request_id.get()
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Stamp the caller's request ID onto each record.
+    
+    Context variables are not visible from a QueueListener thread, so the ID
+    has to travel with the record when logging goes through a queue.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        req_id = request_id.get()
+        if req_id and getattr(record, "request_id", None) is None:
+            record.request_id = req_id
+        return True
+
+
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
@@ -39,6 +67,14 @@ class JSONFormatter(logging.Formatter):
     in production environments.
     """
     
+    # Standard LogRecord attributes that are not copied as extra fields
+    RESERVED_ATTRS = frozenset({
+        'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+        'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+        'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+        'thread', 'threadName', 'processName', 'process', 'getMessage'
+    })
+    
     def __init__(self, include_extra: bool = True):
         super().__init__()
         self.include_extra = include_extra
@@ -56,7 +92,7 @@ class JSONFormatter(logging.Formatter):
         }
         
         # Add request ID if available
-        req_id = request_id.get()
+        req_id = _record_request_id(record)
         if req_id:
             log_entry["request_id"] = req_id
         
@@ -65,20 +101,29 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
         
         # Add extra fields if enabled
+        extra = {}
         if self.include_extra:
-            for key, value in record.__dict__.items():
-                if key not in {
-                    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-                    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                    'thread', 'threadName', 'processName', 'process', 'getMessage'
-                }:
-                    try:
-                        # Only include JSON-serializable values
-                        json.dumps(value)
-                        log_entry[key] = value
-                    except (TypeError, ValueError):
-                        log_entry[key] = str(value)
+            extra = {
+                key: value for key, value in record.__dict__.items()
+                if key not in self.RESERVED_ATTRS
+            }
+        
+        if ORJSON_AVAILABLE:
+            # orjson serialises in C; unsupported values are stringified via default=str
+            try:
+                return orjson.dumps(
+                    {**log_entry, **extra}, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass
+        
+        for key, value in extra.items():
+            try:
+                # Only include JSON-serializable values
+                json.dumps(value)
+                log_entry[key] = value
+            except (TypeError, ValueError):
+                log_entry[key] = str(value)
         
         return json.dumps(log_entry)
 
@@ -100,39 +145,78 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    # %-style template compiled once per level instead of an f-string per record
+    FORMAT = (
+        "%(asctime)s {color}%(levelname)-8s{reset} "
+        "%(name)s%(request_tag)s %(module)s:%(funcName)s:%(lineno)d - %(message)s"
+    )
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    
     def __init__(self, use_colors: bool = True):
         super().__init__()
         self.use_colors = use_colors
+        
+        colored = use_colors and sys.stdout.isatty()
+        self._plain = self._build(color='', reset='')
+        self._formatters = {
+            level: self._build(color=color, reset=self.RESET) if colored else self._plain
+            for level, color in self.COLORS.items()
+        }
+    
+    def _build(self, color: str, reset: str) -> logging.Formatter:
+        """Create the precompiled formatter for one color."""
+        return logging.Formatter(
+            self.FORMAT.format(color=color, reset=reset),
+            datefmt=self.DATE_FORMAT,
+            defaults={"request_tag": ""}
+        )
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        # Base format
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
-        
-        message = record.getMessage()
-        location = f"{record.module}:{record.funcName}:{record.lineno}"
+        req_id = _record_request_id(record)
+        formatter = self._formatters.get(record.levelname, self._plain)
+        if not req_id:
+            return formatter.format(record)
         
-        # Add request ID if available
-        req_id = request_id.get()
-        req_id_str = f" [{req_id}]" if req_id else ""
-        
-        if self.use_colors and sys.stdout.isatty():
-            color = self.COLORS.get(record.levelname, '')
-            formatted = (
-                f"{timestamp} {color}{record.levelname:8}{self.RESET} "
-                f"{record.name}{req_id_str} {location} - {message}"
-            )
-        else:
-            formatted = (
-                f"{timestamp} {record.levelname:8} "
-                f"{record.name}{req_id_str} {location} - {message}"
-            )
-        
-        # Add exception information if present
-        if record.exc_info:
-            formatted += '\n' + self.formatException(record.exc_info)
-        
-        return formatted
+        record.request_tag = f" [{req_id}]"
+        try:
+            return formatter.format(record)
+        finally:
+            del record.request_tag
+
+
+class BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    Buffer records and append each batch to a rotating log file in one write.
+    
+    MemoryHandler alone replays buffered records through the target one at a
+    time, so every record still costs a write and a flush. This formats the
+    whole buffer and hands it to the file as a single write.
+    """
+    
+    def flush(self) -> None:
+        """Write all buffered records to the target file at once."""
+        with self.lock:
+            target = self.target
+            if target is None or not self.buffer:
+                return
+            
+            records = [record for record in self.buffer if target.filter(record)]
+            self.buffer.clear()
+            if not records:
+                return
+            
+            try:
+                text = "".join(target.format(record) + target.terminator for record in records)
+                with target.lock:
+                    if target.stream is None:
+                        target.stream = target._open()
+                    if target.maxBytes > 0 and target.stream.tell() + len(text) >= target.maxBytes:
+                        target.doRollover()
+                    target.stream.write(text)
+                    target.stream.flush()
+            except Exception:
+                target.handleError(records[-1])
 
 
 class LoggerManager:
@@ -146,6 +230,7 @@ class LoggerManager:
     def __init__(self):
         self._loggers: Dict[str, logging.Logger] = {}
         self._configured = False
+        self._listener: Optional[logging.handlers.QueueListener] = None
     
     def configure(
         self,
@@ -156,7 +241,9 @@ class LoggerManager:
         max_size: str = "10MB",
         backup_count: int = 5,
         console_output: bool = True,
-        use_colors: bool = True
+        use_colors: bool = True,
+        use_queue: bool = False,
+        file_buffer: int = 0
     ) -> None:
         """
         Configure logging system.
@@ -170,6 +257,10 @@ class LoggerManager:
             backup_count: Number of backup files to keep
             console_output: Whether to output to console
             use_colors: Whether to use colors in console output
+            use_queue: Whether to hand records to a background thread that
+                writes them, so logging calls never block on I/O
+            file_buffer: Records held in memory before the log file is
+                written; ERROR and above flush immediately (0 disables)
         """
         # Ensure log directory exists
         log_path = Path(log_dir)
@@ -182,6 +273,9 @@ class LoggerManager:
         # Clear existing handlers
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+        self._stop_listener()
+        
+        handlers = []
         
         # Console handler
         if console_output:
@@ -193,7 +287,7 @@ class LoggerManager:
                 console_handler.setFormatter(ColoredFormatter(use_colors=use_colors))
             
             console_handler.setLevel(getattr(logging, level.upper()))
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # File handler
         if log_file:
@@ -215,7 +309,34 @@ class LoggerManager:
                 file_handler.setFormatter(ColoredFormatter(use_colors=False))
             
             file_handler.setLevel(getattr(logging, level.upper()))
-            root_logger.addHandler(file_handler)
+            
+            if file_buffer > 0:
+                # Coalesce writes; the buffer is also flushed when logging shuts down
+                buffered_handler = BufferedFileHandler(
+                    capacity=file_buffer,
+                    flushLevel=logging.ERROR,
+                    target=file_handler,
+                    flushOnClose=True
+                )
+                buffered_handler.setLevel(file_handler.level)
+                handlers.append(buffered_handler)
+            else:
+                handlers.append(file_handler)
+        
+        if use_queue and handlers:
+            # Records are enqueued by the caller and written by the listener thread
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.addFilter(RequestIdFilter())
+            root_logger.addHandler(queue_handler)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self._stop_listener)
+        else:
+            for handler in handlers:
+                root_logger.addHandler(handler)
         
         # Configure structlog if available
         if STRUCTLOG_AVAILABLE and format_type == "structured":
@@ -254,6 +375,15 @@ class LoggerManager:
         
         return self._loggers[name]
     
+    def _stop_listener(self) -> None:
+        """Flush and stop the background queue listener, if one is running."""
+        if self._listener is not None:
+            self._listener.stop()
+            # The listener owns its handlers, so flush buffered file writes here
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+    
     def set_request_id(self, req_id: str) -> None:
         """Set request ID for context-aware logging."""
         request_id.set(req_id)
@@ -318,7 +448,9 @@ def configure_logging(
     max_size: str = "10MB",
     backup_count: int = 5,
     console_output: bool = True,
-    use_colors: bool = True
+    use_colors: bool = True,
+    use_queue: bool = False,
+    file_buffer: int = 0
 ) -> None:
     """
     Configure the global logging system.
@@ -332,6 +464,8 @@ def configure_logging(
         backup_count: Number of backup files
         console_output: Enable console output
         use_colors: Use colors in console
+        use_queue: Write records from a background listener thread
+        file_buffer: Records buffered before each log file write
     """
     manager = get_logger_manager()
     manager.configure(
@@ -342,10 +476,37 @@ def configure_logging(
         max_size=max_size,
         backup_count=backup_count,
         console_output=console_output,
-        use_colors=use_colors
+        use_colors=use_colors,
+        use_queue=use_queue,
+        file_buffer=file_buffer
     )
 
 
+def setup_default(
+    level: str = "INFO",
+    queue: bool = True,
+    name: Optional[str] = None
+) -> logging.Logger:
+    """
+    Configure the process-wide logging pipeline once and return a logger.
+    
+    Later calls reuse the existing configuration, so every example and demo
+    in the process shares a single handler stack.
+    
+    Args:
+        level: Log level used on first configuration
+        queue: Route records through a QueueHandler/QueueListener
+        name: Logger name (defaults to the root logger)
+        
+    Returns:
+        Logger instance
+    """
+    manager = get_logger_manager()
+    if not manager._configured:
+        configure_logging(level=level, format_type="simple", use_queue=queue)
+    return manager.get_logger(name) if name else logging.getLogger()
+
+
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get a logger instance.
@@ -442,7 +603,7 @@ def kata_practice_logging() -> dict:
             logger = get_logger("kata_test")
             
             # Set request ID for context
-            test_request_id = str(uuid.uuid4())[:8]
+            test_request_id = uuid.uuid4().hex[:8]
             set_request_id(test_request_id)
             
             # Test different log levels
@@ -20,6 +20,7 @@ Features:
 
 import asyncio
 import hashlib
+import importlib.util
 import json
 import os
 import pickle
@@ -32,17 +33,19 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
-# Optional imports for local AI
+# Optional imports for local AI. torch and google-generativeai take seconds to
+# import, so only check they are installed and import them where they are used.
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+
 try:
-    import torch
-    TORCH_AVAILABLE = True
+    import faiss
+    FAISS_AVAILABLE = True
 except ImportError:
-    TORCH_AVAILABLE = False
+    FAISS_AVAILABLE = False
 
 try:
-    import google.generativeai as genai
-    GOOGLE_AI_AVAILABLE = True
-except ImportError:
+    GOOGLE_AI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
+except ModuleNotFoundError:
     GOOGLE_AI_AVAILABLE = False
 
 import numpy as np
@@ -183,8 +186,15 @@ class EmbeddingProvider_Interface(ABC):
 class SentenceTransformerProvider(EmbeddingProvider_Interface):
     """Sentence Transformers embedding provider."""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int = 64,
+        normalize_embeddings: bool = False
+    ):
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.normalize_embeddings = normalize_embeddings
         self._model = None
         self._dimensions = None
     
@@ -203,16 +213,21 @@ class SentenceTransformerProvider(EmbeddingProvider_Interface):
                     "Install with: pip install sentence-transformers"
                 )
     
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode a batch of texts into an (N, dimensions) float32 matrix."""
+        self._load_model()
+        return self._model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=self.normalize_embeddings,
+            convert_to_numpy=True
+        )
+    
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text."""
-        self._load_model()
         # Run in thread pool for async compatibility
         loop = asyncio.get_event_loop()
-        embedding = await loop.run_in_executor(
-            None, 
-            self._model.encode, 
-            [text]
-        )
+        embedding = await loop.run_in_executor(None, self.encode, [text])
         return embedding[0].tolist()
     
     def get_model_info(self) -> Dict[str, Any]:
@@ -231,13 +246,19 @@ class SentenceTransformerProvider(EmbeddingProvider_Interface):
         return self._dimensions
 
 
+def _cuda_available() -> bool:
+    """Import torch on first use and report whether a CUDA device is present."""
+    import torch
+    return torch.cuda.is_available()
+
+
 class LocalAIProvider(EmbeddingProvider_Interface):
     """Local AI embedding provider using sentence-transformers optimized for RTX 4050."""
     
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: str = "cuda"):
         """Initialize with local model optimized for your hardware."""
         self.model_name = model_name
-        self.device = device if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
+        self.device = device if TORCH_AVAILABLE and _cuda_available() else "cpu"
         self.model = None
         self._dimensions = None
         
@@ -341,7 +362,8 @@ class GeminiProvider(EmbeddingProvider_Interface):
         try:
             if not GOOGLE_AI_AVAILABLE:
                 raise ImportError("google-generativeai not installed. Install with: pip install google-generativeai")
-                
+            
+            import google.generativeai as genai
             genai.configure(api_key=self.api_key)
             
             # Get embedding
@@ -433,13 +455,26 @@ class HybridEmbeddingProvider(EmbeddingProvider_Interface):
         return self.primary_provider.dimensions
 
 
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalise each row so inner product equals cosine similarity."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.ascontiguousarray(vectors / np.where(norms == 0, 1, norms), dtype=np.float32)
+
+
 class VectorIndex:
     """In-memory vector index for fast similarity search."""
     
+    # Corpus size above which cosine search switches to a trained IVF-PQ index
+    IVFPQ_MIN_VECTORS = 100_000
+    IVFPQ_NLIST = 256
+    IVFPQ_SUBQUANTIZERS = 48
+    
     def __init__(self):
         self.embeddings: Dict[str, VectorEmbedding] = {}
         self.vectors: Optional[np.ndarray] = None
+        self.unit_vectors: Optional[np.ndarray] = None
         self.ids: List[str] = []
+        self._faiss_index = None
         self._dirty = True
     
     def add_embedding(self, embedding: VectorEmbedding) -> None:
@@ -447,6 +482,25 @@ class VectorIndex:
         self.embeddings[embedding.id] = embedding
         self._dirty = True
     
+    def add_embeddings(self, embeddings: List[VectorEmbedding], vectors: np.ndarray) -> None:
+        """Add a batch of embeddings whose vectors are the rows of ``vectors``."""
+        replaces = any(embedding.id in self.embeddings for embedding in embeddings)
+        for embedding in embeddings:
+            self.embeddings[embedding.id] = embedding
+        
+        if self._dirty or replaces or self.vectors is None:
+            self._dirty = True
+            return
+        
+        # Append the rows to the existing matrices instead of restacking every vector
+        vectors = np.asarray(vectors, dtype=np.float32)
+        unit = _unit_rows(vectors)
+        self.vectors = np.ascontiguousarray(np.concatenate([self.vectors, vectors]))
+        self.unit_vectors = np.ascontiguousarray(np.concatenate([self.unit_vectors, unit]))
+        self.ids.extend(embedding.id for embedding in embeddings)
+        if self._faiss_index is not None:
+            self._faiss_index.add(unit)
+    
     def remove_embedding(self, embedding_id: str) -> bool:
         """Remove embedding from index."""
         if embedding_id in self.embeddings:
@@ -461,10 +515,34 @@ class VectorIndex:
             return
         
         self.ids = list(self.embeddings.keys())
-        vectors = [self.embeddings[id_].to_numpy() for id_ in self.ids]
-        self.vectors = np.stack(vectors) if vectors else None
+        # One contiguous float32 matrix so a search is a single matrix-vector product
+        self.vectors = np.array(
+            [self.embeddings[id_].vector for id_ in self.ids], dtype=np.float32
+        )
+        self.unit_vectors = _unit_rows(self.vectors)
+        self._faiss_index = None
         self._dirty = False
     
+    def _cosine_index(self):
+        """Build the FAISS inner-product index over the normalised vectors."""
+        if self._faiss_index is None:
+            count, dimensions = self.unit_vectors.shape
+            if (count >= self.IVFPQ_MIN_VECTORS
+                    and dimensions % self.IVFPQ_SUBQUANTIZERS == 0):
+                # 8-bit product quantisation: one byte per sub-quantizer per vector
+                quantizer = faiss.IndexFlatIP(dimensions)
+                index = faiss.IndexIVFPQ(
+                    quantizer, dimensions, self.IVFPQ_NLIST,
+                    self.IVFPQ_SUBQUANTIZERS, 8, faiss.METRIC_INNER_PRODUCT
+                )
+                index.train(self.unit_vectors)
+                index.nprobe = 16
+            else:
+                index = faiss.IndexFlatIP(dimensions)
+            index.add(self.unit_vectors)
+            self._faiss_index = index
+        return self._faiss_index
+    
     def search(
         self, 
         query_vector: np.ndarray, 
@@ -479,10 +557,15 @@ class VectorIndex:
         
         # Calculate similarities
         if algorithm == SimilarityAlgorithm.COSINE:
-            # Normalize vectors
-            query_norm = query_vector / np.linalg.norm(query_vector)
-            vectors_norm = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
-            similarities = np.dot(vectors_norm, query_norm)
+            query_norm = _unit_rows(np.asarray(query_vector, dtype=np.float32).reshape(1, -1))
+            if FAISS_AVAILABLE:
+                scores, indices = self._cosine_index().search(query_norm, min(k, len(self.ids)))
+                return [
+                    (self.ids[idx], float(score))
+                    for score, idx in zip(scores[0], indices[0])
+                    if idx != -1 and score > 0
+                ]
+            similarities = np.dot(self.unit_vectors, query_norm[0])
         elif algorithm == SimilarityAlgorithm.DOT_PRODUCT:
             similarities = np.dot(self.vectors, query_vector)
         elif algorithm == SimilarityAlgorithm.EUCLIDEAN:
@@ -635,6 +718,55 @@ class SemanticSearchEngine:
         logger.debug(f"Added embedding for content: {content[:50]}...")
         return embedding
     
+    async def add_content_batch(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metas: Optional[List[Dict[str, Any]]] = None
+    ) -> List[VectorEmbedding]:
+        """Add many documents to the search index with a single encode call."""
+        metas = metas or [{}] * len(texts)
+        hashes = [VectorEmbedding.create_content_hash(text) for text in texts]
+        
+        embeddings: List[Optional[VectorEmbedding]] = [await self.cache.get(h) for h in hashes]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            pending = [texts[i] for i in missing]
+            if hasattr(self.provider, "encode"):
+                loop = asyncio.get_event_loop()
+                matrix = await loop.run_in_executor(None, self.provider.encode, pending)
+            else:
+                matrix = await asyncio.gather(
+                    *(self.provider.generate_embedding(text) for text in pending)
+                )
+            matrix = np.asarray(matrix, dtype=np.float32)
+            model_info = self.provider.get_model_info()
+            
+            for i, vector in zip(missing, matrix):
+                metadata = EmbeddingMetadata(
+                    model_name=model_info["model_name"],
+                    provider=model_info["provider"],
+                    dimensions=len(vector),
+                    content_hash=hashes[i],
+                    content_length=len(texts[i]),
+                    source_id=ids[i],
+                    source_type=metas[i].get("type")
+                )
+                embeddings[i] = VectorEmbedding(
+                    vector=vector.tolist(),
+                    content=texts[i],
+                    metadata=metadata,
+                    tags=list(metas[i].get("tags", []))
+                )
+                await self.cache.set(embeddings[i])
+        
+        vectors = np.array([embedding.vector for embedding in embeddings], dtype=np.float32)
+        self.index.add_embeddings(embeddings, vectors)
+        
+        logger.debug(f"Added {len(embeddings)} embeddings in one batch ({len(missing)} encoded)")
+        return embeddings
+    
     async def search(
         self, 
         query: str, 
@@ -29,7 +29,7 @@ class APIProvider(Enum):
     GEMINI = "gemini"
     PERPLEXITY = "perplexity"
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     """Result of routing decision."""
     provider: APIProvider
@@ -26,6 +26,12 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Iterator, Tuple, Set, TypeVar
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set up logging
 import logging
 logger = logging.getLogger(__name__)
@@ -574,6 +580,35 @@ def write_json_file(file_path: Union[str, Path], data: Any) -> None:
     data_file.write_json(data)
 
 
+def save_json(file_path: Union[str, Path], data: Any) -> Path:
+    """
+    Serialize data to a JSON file with 2-space indentation.
+    
+    Uses orjson when installed, which encodes straight to UTF-8 bytes,
+    and falls back to the standard library otherwise.
+    
+    Args:
+        file_path: Path to JSON file
+        data: Data to write
+        
+    Returns:
+        Path object to the written file
+    """
+    path = Path(file_path)
+    try:
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    except TypeError as e:
+        logger.error(f"Data is not JSON serializable: {str(e)}")
+        raise FileFormatError(f"Data is not JSON serializable: {str(e)}")
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return path
+
+
 def read_yaml_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Read YAML file.
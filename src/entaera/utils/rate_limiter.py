@@ -244,6 +244,53 @@ class SmartRateLimiter:
             elif daily_pct >= 90:
                 print(f"   🚨 Alert: {daily_pct:.1f}% of daily quota used!")
 
+class AsyncLimiter:
+    """Leaky-bucket limiter pacing callers to ``max_rate`` requests per ``time_period`` seconds.
+    
+    Unlike ``SmartRateLimiter.acquire`` this never rejects a request; it waits
+    just long enough for capacity to drain, so bursts are smoothed instead of
+    turning into 429 responses and retries.
+    
+    Usage:
+        limiter = AsyncLimiter(60, 60)
+        async with limiter:
+            await make_request()
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+    
+    def _leak(self):
+        """Drain the bucket according to the time elapsed since the last check."""
+        now = time.monotonic()
+        if self._level > 0:
+            elapsed = now - self._last_check
+            self._level = max(self._level - elapsed * self._rate_per_sec, 0.0)
+        self._last_check = now
+    
+    def has_capacity(self, amount: float = 1.0) -> bool:
+        """Check whether ``amount`` can be acquired without waiting."""
+        self._leak()
+        return self._level + amount <= self.max_rate
+    
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` fits in the bucket, then take it."""
+        while not self.has_capacity(amount):
+            await asyncio.sleep((self._level + amount - self.max_rate) / self._rate_per_sec)
+        self._level += amount
+    
+    async def __aenter__(self) -> None:
+        await self.acquire()
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
 # Global rate limiter instance
 rate_limiter = SmartRateLimiter()
 
@@ -17,9 +17,28 @@ Kata Learning Objectives:
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Optional
 
 
+# Pre-compiled regex patterns for performance
+# Unicode ranges for emoji characters, including ZWJ sequences
+_EMOJI_RANGES = (
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"  # enclosed characters
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
+    "\U0000200D"             # zero-width joiner
+)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_EMOJI_PATTERN = re.compile(f"[{_EMOJI_RANGES}]+", flags=re.UNICODE)
+_EMOJI_CHAR_PATTERN = re.compile(f"[{_EMOJI_RANGES}]", flags=re.UNICODE)
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text by:
@@ -53,10 +72,17 @@ def normalize_text(text: str) -> str:
         - Optimized for large texts
         - Memory efficient with regex compilation
         - Handles Unicode properly
+        - Results are memoized, so repeated inputs cost a dict lookup
     """
     if not isinstance(text, str):
         raise TypeError(f"Expected str, got {type(text).__name__}")
     
+    return _normalize_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Memoized body of normalize_text; callers have already checked the type."""
     # Handle empty or whitespace-only strings
     if not text or text.isspace():
         return ""
@@ -106,24 +132,7 @@ def contains_emoji(text: str) -> bool:
     if not isinstance(text, str):
         return False
     
-    # Unicode ranges for emoji characters
-    # This pattern covers most emoji ranges in Unicode including ZWJ sequences
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002702-\U000027B0"  # dingbats
-        "\U000024C2-\U0001F251"  # enclosed characters
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
-        "\U0000200D"             # zero-width joiner
-        "]+", 
-        flags=re.UNICODE
-    )
-    
-    return bool(emoji_pattern.search(text))
+    return bool(_EMOJI_PATTERN.search(text))
 
 
 def remove_emojis(text: str) -> str:
@@ -146,25 +155,15 @@ def remove_emojis(text: str) -> str:
     if not isinstance(text, str):
         raise TypeError(f"Expected str, got {type(text).__name__}")
     
-    # Use the same emoji pattern as contains_emoji (including ZWJ)
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002702-\U000027B0"  # dingbats
-        "\U000024C2-\U0001F251"  # enclosed characters
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
-        "\U0000200D"             # zero-width joiner
-        "]+", 
-        flags=re.UNICODE
-    )
-    
+    return _remove_emojis(text)
+
+
+@lru_cache(maxsize=4096)
+def _remove_emojis(text: str) -> str:
+    """Memoized body of remove_emojis; callers have already checked the type."""
     # Remove emojis and clean up extra spaces
-    result = emoji_pattern.sub('', text)
-    return re.sub(r'\s+', ' ', result).strip()
+    result = _EMOJI_PATTERN.sub('', text)
+    return _WHITESPACE_PATTERN.sub(' ', result).strip()
 
 
 def extract_emojis(text: str) -> list[str]:
@@ -187,22 +186,7 @@ def extract_emojis(text: str) -> list[str]:
     if not isinstance(text, str):
         return []
     
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002702-\U000027B0"  # dingbats
-        "\U000024C2-\U0001F251"  # enclosed characters
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
-        "\U0000200D"             # zero-width joiner
-        "]", 
-        flags=re.UNICODE
-    )
-    
-    return emoji_pattern.findall(text)
+    return _EMOJI_CHAR_PATTERN.findall(text)
 
 
 def normalize_text_advanced(
@@ -270,24 +254,6 @@ def normalize_text_advanced(
     return result
 
 
-# Pre-compiled regex patterns for performance
-_WHITESPACE_PATTERN = re.compile(r'\s+')
-_EMOJI_PATTERN = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # emoticons
-    "\U0001F300-\U0001F5FF"  # symbols & pictographs
-    "\U0001F680-\U0001F6FF"  # transport & map symbols
-    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-    "\U00002702-\U000027B0"  # dingbats
-    "\U000024C2-\U0001F251"  # enclosed characters
-    "\U0001F900-\U0001F9FF"  # supplemental symbols
-    "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
-    "\U0000200D"             # zero-width joiner
-    "]+", 
-    flags=re.UNICODE
-)
-
-
 def normalize_text_fast(text: str) -> str:
     """
     High-performance version of normalize_text using pre-compiled patterns.
@@ -0,0 +1,257 @@
+"""
+Agent Orchestration Tests
+=========================
+
+Test cases for the multi-agent orchestration module:
+- Load-based task dispatch and the minimum score threshold
+- Dependency-ordered workflow execution
+- Task and agent record validation and serialization
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.entaera.core.agent_orchestration import (
+    AgentCapability,
+    AgentPerformanceMetrics,
+    ConversationalAgent,
+    CreativeAgent,
+    TaskStatus,
+    TaskType,
+    WorkflowOrchestrator,
+    WorkflowTask,
+)
+
+
+class TestLoadDispatch:
+    """Test vectorized agent selection in WorkflowOrchestrator.assign_task."""
+
+    def test_prefers_higher_scoring_idle_agent(self):
+        """Registration order must not decide between idle agents."""
+        orchestrator = WorkflowOrchestrator()
+        conversational = ConversationalAgent("conv", "Conversational", conversation_manager=None)
+        creative = CreativeAgent("creative", "Creative")
+        orchestrator.register_agent(conversational)
+        orchestrator.register_agent(creative)
+
+        task = WorkflowTask(task_type=TaskType.CONTENT_GENERATION, description="summary")
+
+        assert asyncio.run(conversational.can_handle_task(task)) < asyncio.run(creative.can_handle_task(task))
+        assert asyncio.run(orchestrator.assign_task(task)) is creative
+
+    def test_saturated_agent_below_threshold_is_not_assigned(self):
+        """An agent scoring at or below the minimum score gets no task."""
+        orchestrator = WorkflowOrchestrator()
+        creative = CreativeAgent("creative", "Creative")
+        creative.active_task_count = creative._total_capacity
+        orchestrator.register_agent(creative)
+
+        task = WorkflowTask(task_type=TaskType.CONTENT_GENERATION, description="summary")
+
+        assert asyncio.run(creative.can_handle_task(task)) <= WorkflowOrchestrator.MIN_ASSIGNMENT_SCORE
+        assert asyncio.run(orchestrator.assign_task(task)) is None
+
+    def test_workflow_tasks_dispatched_by_orchestrator(self):
+        """Workflows created by the orchestrator run their tasks through assign_task."""
+        orchestrator = WorkflowOrchestrator()
+        creative = CreativeAgent("creative", "Creative")
+        orchestrator.register_agent(creative)
+        task = WorkflowTask(task_type=TaskType.CONTENT_GENERATION, description="summary")
+
+        async def run():
+            await orchestrator.create_workflow("dispatch", [task])
+            return await orchestrator.execute_workflow("dispatch")
+
+        results = asyncio.run(run())
+
+        assert results[task.task_id]["agent"] == "Creative"
+        assert task.assigned_agent_id == "creative"
+        assert task.status == TaskStatus.COMPLETED
+
+
+def _run_workflow(agent, workflow_id, tasks, workflow_type):
+    """Register agent with a fresh orchestrator and run tasks as one workflow."""
+    orchestrator = WorkflowOrchestrator()
+    orchestrator.register_agent(agent)
+
+    async def run():
+        await orchestrator.create_workflow(workflow_id, tasks, workflow_type)
+        return await orchestrator.execute_workflow(workflow_id)
+
+    return asyncio.run(run())
+
+
+class TestDependencyOrder:
+    """Test dependency-ordered execution of sequential workflows."""
+
+    def test_dependent_listed_before_parent_runs(self):
+        """A task listed ahead of its dependency still runs, after the dependency."""
+        agent = CreativeAgent("creative", "Creative")
+        parent = WorkflowTask(task_id="parent", task_type=TaskType.CONTENT_GENERATION, description="outline")
+        child = WorkflowTask(
+            task_id="child",
+            task_type=TaskType.CONTENT_GENERATION,
+            description="draft",
+            dependencies=["parent"],
+        )
+        results = _run_workflow(agent, "ordered", [child, parent], "sequential")
+
+        assert list(results) == ["parent", "child"]
+        assert child.status == TaskStatus.COMPLETED
+        assert parent.completion_time_mono <= child.start_time_mono
+
+
+class TestCompletionTimeBatching:
+    """Test batched merging of agent completion times."""
+
+    def test_batch_average_matches_scalar_path(self):
+        """Merging durations in one batch gives the same mean as one at a time."""
+        durations = [0.5, 1.25, 2.0, 0.75, 3.5]
+        scalar = CreativeAgent("scalar", "Scalar")
+        batched = CreativeAgent("batched", "Batched")
+
+        for duration in durations:
+            scalar.metrics.total_tasks_completed += 1
+            scalar._update_average_completion_time(duration)
+
+        for duration in durations[:2]:
+            batched.metrics.total_tasks_completed += 1
+            batched._update_average_completion_time(duration)
+        batched.metrics.total_tasks_completed = len(durations)
+        batched._update_average_completion_time_batch(np.asarray(durations[2:]))
+
+        assert batched.metrics.average_completion_time == pytest.approx(scalar.metrics.average_completion_time)
+        assert batched.metrics.average_completion_time == pytest.approx(sum(durations) / len(durations))
+
+    def test_parallel_workflow_merges_completion_times(self):
+        """A parallel workflow folds each agent's durations in once all tasks join."""
+        agent = CreativeAgent("creative", "Creative")
+        tasks = [
+            WorkflowTask(task_type=TaskType.CONTENT_GENERATION, description=f"story {i}")
+            for i in range(3)
+        ]
+        _run_workflow(agent, "parallel", tasks, "parallel")
+
+        expected = sum(t.completion_time_mono - t.start_time_mono for t in tasks) / len(tasks)
+        assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+        assert agent.metrics.total_tasks_completed == 3
+        assert agent.metrics.average_completion_time == pytest.approx(expected)
+        assert agent._pending_durations is None
+
+
+class TestRecordValidation:
+    """Test the range checks and enum coercion done in __post_init__."""
+
+    @pytest.mark.parametrize("priority", [0, 11])
+    def test_task_priority_out_of_range(self, priority):
+        with pytest.raises(ValueError, match="priority"):
+            WorkflowTask(task_type=TaskType.ANALYSIS, description="x", priority=priority)
+
+    @pytest.mark.parametrize(
+        "overrides, field_name",
+        [
+            ({"proficiency_level": -0.1}, "proficiency_level"),
+            ({"proficiency_level": 1.5}, "proficiency_level"),
+            ({"max_concurrent_tasks": 0}, "max_concurrent_tasks"),
+            ({"success_rate": 1.01}, "success_rate"),
+        ],
+    )
+    def test_capability_out_of_range(self, overrides, field_name):
+        kwargs = {"capability_type": TaskType.ANALYSIS, "proficiency_level": 0.5, **overrides}
+        with pytest.raises(ValueError, match=field_name):
+            AgentCapability(**kwargs)
+
+    def test_string_values_coerced_to_enums(self):
+        """Plain strings are accepted and stored as enum members, as pydantic did."""
+        task = WorkflowTask(task_type="analysis", description="x", status="in_progress")
+        capability = AgentCapability(capability_type="analysis", proficiency_level=0.5)
+
+        assert task.task_type is TaskType.ANALYSIS
+        assert task.status is TaskStatus.IN_PROGRESS
+        assert capability.capability_type is TaskType.ANALYSIS
+
+    def test_unknown_enum_value_rejected(self):
+        with pytest.raises(ValueError):
+            WorkflowTask(task_type="not-a-task-type", description="x")
+
+
+class TestRecordSerialization:
+    """Test that model_dump keeps the output of the former pydantic models."""
+
+    def test_task_json_dump_matches_pydantic_output(self):
+        """JSON mode gives enum values and ISO datetimes, without private slots."""
+        started = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        task = WorkflowTask(
+            task_id="t1",
+            task_type=TaskType.ANALYSIS,
+            description="Analyze data",
+            dependencies=["t0"],
+            status=TaskStatus.COMPLETED,
+            start_time=started,
+            start_time_mono=1.0,
+            result={"rows": 3},
+        )
+        task.tokens  # populate the private token cache
+
+        assert task.model_dump(mode="json") == {
+            "task_id": "t1",
+            "task_type": "analysis",
+            "description": "Analyze data",
+            "priority": 5,
+            "requirements": {},
+            "dependencies": ["t0"],
+            "children": [],
+            "estimated_duration": 0.0,
+            "max_retries": 3,
+            "timeout": 300.0,
+            "context": {},
+            "status": "completed",
+            "assigned_agent_id": None,
+            "start_time": "2024-05-01T12:00:00Z",
+            "completion_time": None,
+            "start_time_mono": 1.0,
+            "completion_time_mono": None,
+            "result": {"rows": 3},
+            "error_message": None,
+            "retry_count": 0,
+        }
+
+    def test_python_dump_keeps_enums_and_datetimes(self):
+        started = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        data = WorkflowTask(task_type=TaskType.ANALYSIS, description="x", start_time=started).model_dump()
+
+        assert data["task_type"] is TaskType.ANALYSIS
+        assert data["start_time"] == started
+        assert "_tokens" not in data
+
+    def test_monotonic_stamps_fill_in_datetimes(self):
+        """Unset datetimes are derived from their monotonic stamps on dump."""
+        before = datetime.now(timezone.utc)
+        task = WorkflowTask(task_type=TaskType.ANALYSIS, description="x", start_time_mono=time.monotonic())
+        metrics = AgentPerformanceMetrics(last_activity_mono=time.monotonic())
+        after = datetime.now(timezone.utc)
+
+        start_time = task.model_dump()["start_time"]
+        last_activity = datetime.fromisoformat(metrics.model_dump(mode="json")["last_activity"])
+
+        assert task.start_time is None
+        assert task.model_dump()["completion_time"] is None
+        assert abs((start_time - before).total_seconds()) < 1
+        assert abs((last_activity - after).total_seconds()) < 1
+
+    def test_capability_dump(self):
+        capability = AgentCapability(capability_type=TaskType.ANALYSIS, proficiency_level=0.9)
+
+        assert capability.model_dump(mode="json") == {
+            "capability_type": "analysis",
+            "proficiency_level": 0.9,
+            "max_concurrent_tasks": 1,
+            "average_completion_time": 0.0,
+            "success_rate": 1.0,
+            "cost_per_task": 0.0,
+            "specialization_tags": [],
+        }
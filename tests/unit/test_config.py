@@ -0,0 +1,127 @@
+"""
+Configuration Tests
+===================
+
+Test cases for configuration loading helpers:
+- Cached loading of .env files with load_settings
+- Compiling .env files into cached Python modules
+"""
+
+import os
+import stat
+
+import pytest
+
+from src.entaera.core.config import (
+    _load_settings_file,
+    compile_env_to_module,
+    import_env_module,
+    load_settings,
+)
+
+SECRET_KEY = "k" * 32
+
+
+@pytest.fixture
+def dotenv_path(tmp_path, monkeypatch):
+    """A .env file with a valid secret key and no overriding environment."""
+    monkeypatch.delenv("APP_NAME", raising=False)
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    _load_settings_file.cache_clear()
+    path = tmp_path / "config.env"
+    path.write_text(f"APP_NAME=First\nSECRET_KEY={SECRET_KEY}\n")
+    yield path
+    _load_settings_file.cache_clear()
+
+
+class TestLoadSettingsCache:
+    """Test the per-file settings cache behind load_settings."""
+    
+    def test_cache_hit_for_unchanged_file(self, dotenv_path):
+        """An unchanged file is validated once."""
+        first = load_settings(dotenv_path)
+        second = load_settings(dotenv_path)
+        
+        assert first.app_name == second.app_name == "First"
+        assert _load_settings_file.cache_info().misses == 1
+        assert _load_settings_file.cache_info().hits == 1
+    
+    def test_modified_file_is_reloaded(self, dotenv_path):
+        """A new modification time invalidates the cached settings."""
+        assert load_settings(dotenv_path).app_name == "First"
+        
+        dotenv_path.write_text(f"APP_NAME=Second\nSECRET_KEY={SECRET_KEY}\n")
+        mtime_ns = dotenv_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(dotenv_path, ns=(mtime_ns, mtime_ns))
+        
+        assert load_settings(dotenv_path).app_name == "Second"
+    
+    def test_callers_get_isolated_copies(self, dotenv_path):
+        """Mutating one caller's settings does not leak into the cache."""
+        first = load_settings(dotenv_path)
+        first.allowed_hosts.append("evil.example")
+        first.app_name = "Mutated"
+        
+        second = load_settings(dotenv_path)
+        
+        assert second is not first
+        assert second.app_name == "First"
+        assert "evil.example" not in second.allowed_hosts
+    
+    def test_environment_overrides_are_part_of_the_key(self, dotenv_path, monkeypatch):
+        """Changing an overriding environment variable is not served from the cache."""
+        assert load_settings(dotenv_path).app_name == "First"
+        
+        monkeypatch.setenv("APP_NAME", "FromEnv")
+        
+        assert load_settings(dotenv_path).app_name == "FromEnv"
+
+
+class TestCompileEnvToModule:
+    """Test the compiled .env module cache."""
+    
+    def test_values_and_permissions(self, tmp_path):
+        """Generated modules hold the .env values and are owner-only."""
+        dotenv_path = tmp_path / "config.env"
+        dotenv_path.write_text("APP_NAME=Compiled\nSECRET_KEY=s3cr3t\n")
+        cache_dir = tmp_path / "cache"
+        
+        module_path = compile_env_to_module(dotenv_path, cache_dir=cache_dir)
+        
+        assert module_path.parent == cache_dir
+        assert stat.S_IMODE(module_path.stat().st_mode) == 0o600
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        assert import_env_module(module_path).SETTINGS == {"app_name": "Compiled", "secret_key": "s3cr3t"}
+    
+    def test_default_cache_dir_is_next_to_env_file(self, tmp_path):
+        """Without cache_dir the module is written beside the .env file."""
+        dotenv_path = tmp_path / "config.env"
+        dotenv_path.write_text("APP_NAME=Compiled\n")
+        
+        module_path = compile_env_to_module(dotenv_path)
+        
+        assert module_path.parent == tmp_path / ".env_cache"
+    
+    def test_same_contents_reuse_module(self, tmp_path):
+        """Unchanged contents map to the same module."""
+        dotenv_path = tmp_path / "config.env"
+        dotenv_path.write_text("APP_NAME=Compiled\n")
+        
+        first = compile_env_to_module(dotenv_path, cache_dir=tmp_path / "cache")
+        second = compile_env_to_module(dotenv_path, cache_dir=tmp_path / "cache")
+        
+        assert first == second
+    
+    def test_stale_modules_are_removed(self, tmp_path):
+        """Editing the .env replaces the module generated from the old contents."""
+        dotenv_path = tmp_path / "config.env"
+        cache_dir = tmp_path / "cache"
+        dotenv_path.write_text("APP_NAME=First\n")
+        old_module = compile_env_to_module(dotenv_path, cache_dir=cache_dir)
+        
+        dotenv_path.write_text("APP_NAME=Second\n")
+        new_module = compile_env_to_module(dotenv_path, cache_dir=cache_dir)
+        
+        assert new_module != old_module
+        assert not old_module.exists()
+        assert sorted(cache_dir.glob("_env_cache_*.py")) == [new_module]
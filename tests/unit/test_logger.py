@@ -0,0 +1,95 @@
+"""
+Logger Tests
+============
+
+Test cases for the logging infrastructure:
+- Batched file output through BufferedFileHandler
+"""
+
+import logging
+import logging.handlers
+from pathlib import Path
+
+import pytest
+
+from src.entaera.core.logger import BufferedFileHandler
+
+
+class _WriteCounter:
+    """File stream wrapper that counts write calls."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class _CountingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler whose stream records how often it is written."""
+
+    def _open(self):
+        self.counter = _WriteCounter(super()._open())
+        return self.counter
+
+
+def _record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def _read(handler):
+    return Path(handler.baseFilename).read_text()
+
+
+@pytest.fixture
+def target(tmp_path):
+    """A rotating file target with a plain message format."""
+    handler = _CountingFileHandler(tmp_path / "app.log", delay=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    yield handler
+    handler.close()
+
+
+class TestBufferedFileHandler:
+    """Test that buffered records reach the file in one write per batch."""
+
+    def test_flushes_full_buffer_in_one_write(self, target):
+        """Reaching capacity writes every buffered record with a single write call."""
+        handler = BufferedFileHandler(capacity=3, flushLevel=logging.ERROR, target=target)
+
+        handler.handle(_record("one"))
+        handler.handle(_record("two"))
+        assert target.stream is None
+
+        handler.handle(_record("three"))
+
+        assert target.counter.writes == 1
+        assert _read(target) == "one\ntwo\nthree\n"
+        handler.close()
+
+    def test_close_flushes_remaining_records(self, target):
+        """Records still buffered on close are written in one batch."""
+        handler = BufferedFileHandler(capacity=10, target=target, flushOnClose=True)
+
+        handler.handle(_record("one"))
+        handler.handle(_record("two"))
+        handler.close()
+
+        assert target.counter.writes == 1
+        assert _read(target) == "one\ntwo\n"
+
+    def test_filtered_records_are_dropped(self, target):
+        """Records rejected by the target's filters are not written."""
+        target.addFilter(lambda record: record.getMessage() != "skip")
+        handler = BufferedFileHandler(capacity=2, target=target)
+
+        handler.handle(_record("skip"))
+        handler.handle(_record("keep"))
+
+        assert _read(target) == "keep\n"
+        handler.close()
@@ -0,0 +1,51 @@
+"""
+Rate Limiter Tests
+==================
+
+Test cases for the leaky-bucket AsyncLimiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.entaera.utils.rate_limiter import AsyncLimiter
+
+
+class TestAsyncLimiter:
+    """Test request pacing with AsyncLimiter."""
+    
+    @pytest.mark.parametrize("max_rate, time_period", [(0, 60), (-1, 60), (10, 0)])
+    def test_rejects_non_positive_rates(self, max_rate, time_period):
+        """A zero or negative rate would divide by zero while waiting."""
+        with pytest.raises(ValueError, match="must be positive"):
+            AsyncLimiter(max_rate, time_period)
+    
+    def test_burst_within_capacity_does_not_wait(self):
+        """Up to max_rate requests are admitted immediately."""
+        limiter = AsyncLimiter(5, 60)
+        
+        async def burst():
+            for _ in range(5):
+                async with limiter:
+                    pass
+        
+        start = time.monotonic()
+        asyncio.run(burst())
+        
+        assert time.monotonic() - start < 0.1
+        assert not limiter.has_capacity()
+    
+    def test_waits_for_capacity_to_drain(self):
+        """A request beyond capacity waits for the bucket to leak."""
+        limiter = AsyncLimiter(2, 0.2)  # one slot frees every 0.1s
+        
+        async def over_capacity():
+            for _ in range(3):
+                await limiter.acquire()
+        
+        start = time.monotonic()
+        asyncio.run(over_capacity())
+        
+        assert time.monotonic() - start >= 0.09
@@ -0,0 +1,50 @@
+"""
+Text Processor Tests
+====================
+
+Test cases for the text normalization helpers:
+- Type checks on the public functions
+- Memoized normalization and emoji removal
+"""
+
+import pytest
+
+from src.entaera.utils.text_processor import (
+    _normalize_text,
+    _remove_emojis,
+    normalize_text,
+    remove_emojis,
+)
+
+
+class TestInputValidation:
+    """Test that non-string input is rejected before the memoized helpers."""
+
+    @pytest.mark.parametrize("func", [normalize_text, remove_emojis])
+    @pytest.mark.parametrize("value", [["x"], {"x": 1}, None, 42])
+    def test_non_string_raises_type_error(self, func, value):
+        with pytest.raises(TypeError, match=f"Expected str, got {type(value).__name__}"):
+            func(value)
+
+
+class TestMemoizedHelpers:
+    """Test results and caching of normalize_text and remove_emojis."""
+
+    def test_normalize_text(self):
+        assert normalize_text("  Hello   WORLD! 👋  ") == "hello world! 👋"
+        assert normalize_text("   ") == ""
+
+    def test_remove_emojis(self):
+        assert remove_emojis("Hello 👋 world 🌍!") == "Hello world !"
+
+    def test_repeated_input_hits_cache(self):
+        """A second call with the same text is served from the cache."""
+        _normalize_text.cache_clear()
+        _remove_emojis.cache_clear()
+
+        for _ in range(2):
+            normalize_text("Cached  Text")
+            remove_emojis("Cached 👋")
+
+        assert _normalize_text.cache_info().hits == 1
+        assert _remove_emojis.cache_info().hits == 1
@@ -5,12 +5,84 @@
 Handles loading and inference with your Llama 3.1 8B model
 """
 
+import atexit
+import json
 import os
+import re
+import subprocess
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import logging
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Approximate VRAM taken by one transformer layer of an 8B Q4_K_M model
+LAYER_VRAM_BYTES = 140 * 1024**2
+# With this much VRAM every layer (and the KV cache) fits on the GPU
+FULL_OFFLOAD_VRAM_BYTES = 5 * 1024**3
+# llama-server reads -ngl -1 as "library default" (often CPU-only), so ask for more layers than any model has
+SERVER_ALL_LAYERS = 999
+
+# Quantization tag in GGUF file names, e.g. "llama-3.1-8b-instruct.Q4_K_M.gguf"
+_QUANT_TAG_RE = re.compile(r'\.(Q\d[A-Z0-9_]*)\.gguf$', re.IGNORECASE)
+
+def kv_cache_options(llama_cpp) -> Dict:
+    """Flash attention plus a q8_0 K/V cache (llama.cpp's --flash-attn -ctk q8_0 -ctv q8_0)
+    
+    Fused attention and an 8-bit cache halve the KV bytes read per decoded
+    token; llama.cpp needs flash attention for a quantized V cache. Builds
+    too old to expose the ggml type constants keep the default f16 cache.
+    """
+    q8_0 = getattr(llama_cpp, 'GGML_TYPE_Q8_0', None)
+    if q8_0 is None:
+        return {}
+    return {"type_k": q8_0, "type_v": q8_0, "flash_attn": True}
+
+# Reinstall command for a llama-cpp-python build that uses the CPU's int8 dot-product kernels
+AVX512_REBUILD_HINT = (
+    'CMAKE_ARGS="-DGGML_NATIVE=ON -DGGML_AVX512=ON -DGGML_AVX512_VNNI=ON -DGGML_AVX512_BF16=ON" '
+    'pip install --force-reinstall --no-binary llama-cpp-python llama-cpp-python'
+)
+
+def cpu_has_avx512_vnni() -> bool:
+    """True when /proc/cpuinfo lists AVX-512 VNNI (always False off Linux)"""
+    try:
+        return 'avx512_vnni' in Path('/proc/cpuinfo').read_text()
+    except OSError:
+        return False
+
+def llama_build_missing_vnni(llama_cpp) -> bool:
+    """True when the CPU supports AVX-512 VNNI but the installed llama.cpp build does not use it"""
+    if not cpu_has_avx512_vnni():
+        return False
+    system_info = llama_cpp.llama_print_system_info()
+    if isinstance(system_info, bytes):
+        system_info = system_info.decode(errors='replace')
+    return 'AVX512_VNNI = 1' not in system_info
+
+def gpu_layers_for_device() -> int:
+    """Number of layers to offload: -1 for all, 0 when no CUDA device is usable"""
+    try:
+        import torch
+    except ImportError:
+        return 0
+    
+    if not torch.cuda.is_available():
+        return 0
+    
+    if torch.cuda.get_device_properties(0).total_memory >= FULL_OFFLOAD_VRAM_BYTES:
+        return -1
+    
+    free_vram, _ = torch.cuda.mem_get_info(0)
+    return free_vram // LAYER_VRAM_BYTES
+
 class LocalModelLoader:
     """Loads and manages your local AI models"""
     
@@ -18,13 +90,29 @@ class LocalModelLoader:
         self.model = None
         self.model_path = None
         self.logger = logging.getLogger(__name__)
+        # 0 makes decoding greedy (deterministic), which lets responses be cached
+        self.temperature = float(os.getenv('LLAMA_TEMPERATURE', '0.7'))
+        # Saved KV state for the static prompt preamble
+        self._prefix = None
+        self._prefix_tokens = None
+        self._prefix_state = None
+        
+    def load_llama_model(self, model_path: str = None, quant_preference: Optional[str] = "Q4_0") -> bool:
+        """Load the Llama 3.1 8B model with fallback strategies
         
-    def load_llama_model(self, model_path: str = None) -> bool:
-        """Load the Llama 3.1 8B model with fallback strategies"""
+        When a sibling file with the preferred quantization exists (e.g. the
+        Q4_0 build next to a Q4_K_M one) it is loaded instead; Q4_0 has the
+        fastest int8 dot-product kernels in llama.cpp.
+        """
         
         if model_path is None:
             model_path = os.getenv('CHAT_MODEL_PATH', './models/llama-3.1-8b-instruct.Q4_K_M.gguf')
         
+        if quant_preference:
+            preferred = Path(_QUANT_TAG_RE.sub(f'.{quant_preference}.gguf', model_path))
+            if preferred.exists():
+                model_path = str(preferred)
+        
         model_file = Path(model_path)
         if not model_file.exists():
             print(f"❌ Model file not found: {model_path}")
@@ -34,8 +122,8 @@ class LocalModelLoader:
         
         # Try different strategies to load the model
         strategies = [
-            self._load_with_cpu_only,
             self._load_with_limited_gpu,
+            self._load_with_cpu_only,
             self._load_with_huggingface_transformers
         ]
         
@@ -53,21 +141,33 @@ class LocalModelLoader:
         return False
     
     def _load_with_cpu_only(self, model_path: str) -> bool:
-        """Load with CPU-only mode to avoid CUDA issues"""
+        """Load with CPU-only mode to avoid CUDA issues
+        
+        Runs with --flash-attn -ctk q8_0 -ctv q8_0 (see kv_cache_options).
+        """
         try:
             print("🔄 Trying CPU-only loading...")
             
-            # Set environment to avoid CUDA issues
-            os.environ["CUDA_VISIBLE_DEVICES"] = ""
-            
             import llama_cpp
             
+            if llama_build_missing_vnni(llama_cpp):
+                print("⚠️  This CPU supports AVX-512 VNNI but llama-cpp-python was built without it.")
+                print(f"   Prompt processing is ~2x faster after reinstalling with:\n   {AVX512_REBUILD_HINT}")
+            
+            cpu_count = os.cpu_count() or 4
+            
             self.model = llama_cpp.Llama(
                 model_path=model_path,
                 n_ctx=2048,  # Smaller context for CPU
-                n_threads=4,  # Use multiple CPU threads
+                n_threads=max(1, cpu_count // 2),  # Decode: roughly one thread per physical core
+                n_threads_batch=cpu_count,  # Prefill is compute-bound, use every hardware thread
+                n_batch=512,
+                use_mmap=True,
+                use_mlock=True,  # Keep the weights resident instead of paged out
+                numa=getattr(llama_cpp, 'GGML_NUMA_STRATEGY_DISTRIBUTE', True),
                 n_gpu_layers=0,  # CPU only
-                verbose=False
+                verbose=False,
+                **kv_cache_options(llama_cpp)
             )
             
             print("✅ CPU-only model loaded!")
@@ -78,20 +178,34 @@ class LocalModelLoader:
             return False
     
     def _load_with_limited_gpu(self, model_path: str) -> bool:
-        """Load with limited GPU layers to avoid memory issues"""
+        """Offload as many layers as the GPU's VRAM allows
+        
+        For the int8 MMQ kernels on RTX cards, build llama-cpp-python with
+        CMAKE_ARGS="-DGGML_CUDA=on -DGGML_CUDA_FORCE_MMQ=on -DGGML_CUDA_F16=on".
+        Runs with --flash-attn -ctk q8_0 -ctv q8_0 (see kv_cache_options).
+        """
         try:
-            print("🔄 Trying limited GPU loading...")
+            n_gpu_layers = gpu_layers_for_device()
+            if n_gpu_layers == 0:
+                print("⚠️  No usable CUDA GPU, skipping GPU loading")
+                return False
+            
+            print(f"🔄 Trying GPU loading ({'all' if n_gpu_layers < 0 else n_gpu_layers} layers)...")
             
             import llama_cpp
             
             self.model = llama_cpp.Llama(
                 model_path=model_path,
                 n_ctx=2048,
-                n_gpu_layers=10,  # Only use a few GPU layers
-                verbose=False
+                n_gpu_layers=n_gpu_layers,
+                main_gpu=0,
+                tensor_split=None,
+                offload_kqv=True,  # Keep the KV cache in VRAM too
+                verbose=False,
+                **kv_cache_options(llama_cpp)
             )
             
-            print("✅ Limited GPU model loaded!")
+            print("✅ GPU model loaded!")
             return True
             
         except Exception as e:
@@ -111,8 +225,51 @@ class LocalModelLoader:
             print(f"❌ Transformers loading failed: {e}")
             return False
     
-    def generate_response(self, prompt: str, max_tokens: int = 512) -> str:
-        """Generate AI response using the loaded model"""
+    def _prime_prefix(self, prefix: str):
+        """Make sure the model's KV cache starts with the evaluated prefix
+        
+        The prefix is evaluated once and its state saved; later calls restore
+        that state only if another prompt has overwritten it. llama.cpp then
+        reuses the matching tokens and only prefills the rest of the prompt.
+        """
+        if prefix != self._prefix:
+            self.model.reset()
+            self._prefix_tokens = self.model.tokenize(prefix.encode("utf-8"))
+            self.model.eval(self._prefix_tokens)
+            self._prefix_state = self.model.save_state()
+            self._prefix = prefix
+        elif (self.model.n_tokens < len(self._prefix_tokens)
+              or list(self.model.input_ids[:len(self._prefix_tokens)]) != self._prefix_tokens):
+            self.model.load_state(self._prefix_state)
+    
+    def _prompt_input(self, prompt: str, prefix: Optional[str]):
+        """Prompt to hand to llama.cpp: tokens when a cached prefix applies, else the text
+        
+        The prefix tokens are reused as-is, so only the new suffix is tokenized.
+        """
+        if not prefix or not prompt.startswith(prefix):
+            return prompt
+        
+        self._prime_prefix(prefix)
+        return self._prefix_tokens + self.model.tokenize(prompt[len(prefix):].encode("utf-8"), add_bos=False)
+    
+    def _generation_params(self, prompt, max_tokens: int) -> Dict:
+        """Sampling parameters shared by blocking and streamed generation"""
+        return {
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+            "top_p": 0.9,
+            "stop": ["</s>", "User:", "Human:", "\n\nUser:", "\n\nHuman:"],
+            "echo": False
+        }
+    
+    def generate_response(self, prompt: str, max_tokens: int = 512, prefix: Optional[str] = None) -> str:
+        """Generate AI response using the loaded model
+        
+        ``prefix`` names a static leading part of ``prompt`` whose KV state is
+        cached across calls.
+        """
         
         if self.model is None:
             return "Model not loaded. Please check the loading process."
@@ -120,18 +277,8 @@ class LocalModelLoader:
         try:
             print("🧠 Generating response...", end="", flush=True)
             
-            # Generation parameters
-            params = {
-                "prompt": prompt,
-                "max_tokens": max_tokens,
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "stop": ["</s>", "User:", "Human:", "\n\nUser:", "\n\nHuman:"],
-                "echo": False
-            }
-            
             # Generate response
-            output = self.model(**params)
+            output = self.model(**self._generation_params(self._prompt_input(prompt, prefix), max_tokens))
             response = output['choices'][0]['text'].strip()
             
             print(" ✅")
@@ -141,6 +288,22 @@ class LocalModelLoader:
             print(f" ❌ Error: {e}")
             return f"Sorry, I encountered an error: {str(e)[:100]}..."
     
+    def stream_response(self, prompt: str, max_tokens: int = 512, prefix: Optional[str] = None) -> Iterator[str]:
+        """Yield the response text piece by piece as the model decodes it"""
+        
+        if self.model is None:
+            yield "Model not loaded. Please check the loading process."
+            return
+        
+        try:
+            for chunk in self.model(**self._generation_params(self._prompt_input(prompt, prefix), max_tokens), stream=True):
+                text = chunk['choices'][0]['text']
+                if text:
+                    yield text
+        
+        except Exception as e:
+            yield f"Sorry, I encountered an error: {str(e)[:100]}..."
+    
     def is_loaded(self) -> bool:
         """Check if model is loaded"""
         return self.model is not None
@@ -150,20 +313,206 @@ class LocalModelLoader:
         if self.model is not None:
             del self.model
             self.model = None
+            self._prefix = self._prefix_tokens = self._prefix_state = None
             print("🗑️  Model unloaded")
 
+class LlamaServerClient:
+    """Runs llama.cpp's llama-server with continuous batching and talks to it over HTTP
+    
+    Concurrent requests are interleaved by the server in one batch, so several
+    chat sessions share each pass over the model weights.
+    """
+    
+    STOP = ["</s>", "User:", "Human:", "\n\nUser:", "\n\nHuman:"]
+    
+    def __init__(self, model_path: str, port: int = 8080, parallel: int = 8, n_predict: int = 512):
+        self.model_path = model_path
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.port = port
+        self.parallel = parallel
+        self.n_predict = n_predict
+        # Same setting as the in-process loader
+        self.temperature = float(os.getenv('LLAMA_TEMPERATURE', '0.7'))
+        self.process = None
+        self._client = None
+    
+    def start(self, binary: str = None, timeout: float = 120.0) -> bool:
+        """Launch llama-server and wait until its /health endpoint reports ready"""
+        if not HTTPX_AVAILABLE:
+            print("❌ httpx is required for llama-server mode")
+            return False
+        
+        command = [
+            binary or os.getenv('LLAMA_SERVER_BIN', 'llama-server'),
+            "-m", self.model_path,
+            "--port", str(self.port),
+            "--cont-batching",
+            "--parallel", str(self.parallel),
+            "--n-predict", str(self.n_predict),
+        ]
+        gpu_layers = gpu_layers_for_device()
+        command += ["-ngl", str(SERVER_ALL_LAYERS if gpu_layers < 0 else gpu_layers)]
+        try:
+            self.process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            print(f"❌ Could not start llama-server: {e}")
+            return False
+        # Don't leave the server holding the port and VRAM after the CLI exits
+        atexit.register(self.stop)
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                print("❌ llama-server exited during startup")
+                return False
+            try:
+                if httpx.get(f"{self.base_url}/health", timeout=1.0).status_code == 200:
+                    print(f"✅ llama-server ready ({self.parallel} parallel slots)")
+                    return True
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.5)
+        
+        print("❌ llama-server did not become ready in time")
+        self.stop()
+        return False
+    
+    def _payload(self, prompt: str, max_tokens: int) -> Dict:
+        return {
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+            "top_p": 0.9,
+            "stop": self.STOP,
+        }
+    
+    def complete(self, prompt: str, max_tokens: int = 512) -> str:
+        """Blocking completion through the server's OpenAI-compatible endpoint"""
+        response = httpx.post(f"{self.base_url}/v1/completions", json=self._payload(prompt, max_tokens), timeout=None)
+        response.raise_for_status()
+        return response.json()['choices'][0]['text'].strip()
+    
+    @staticmethod
+    def _sse_text(line: str) -> str:
+        """Text carried by one server-sent event line ('' for anything else)"""
+        if not line.startswith("data: ") or line == "data: [DONE]":
+            return ""
+        return json.loads(line[6:])['choices'][0]['text']
+    
+    def stream(self, prompt: str, max_tokens: int = 512) -> Iterator[str]:
+        """Yield completion text as the server produces it"""
+        payload = dict(self._payload(prompt, max_tokens), stream=True)
+        with httpx.stream("POST", f"{self.base_url}/v1/completions", json=payload, timeout=None) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                text = self._sse_text(line)
+                if text:
+                    yield text
+    
+    async def acomplete(self, prompt: str, max_tokens: int = 512) -> str:
+        """Streamed completion; safe to run many at once, the server batches them"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.base_url, timeout=None)
+        
+        payload = dict(self._payload(prompt, max_tokens), stream=True)
+        chunks = []
+        async with self._client.stream("POST", "/v1/completions", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                chunks.append(self._sse_text(line))
+        return "".join(chunks).strip()
+    
+    async def aclose(self):
+        """Close the async HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def stop(self):
+        """Shut the server down"""
+        if self.process is not None:
+            atexit.unregister(self.stop)
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+# Leading text of every model prompt; its KV state is computed once and reused
+PROMPT_PREAMBLE = "You are a helpful AI assistant running locally. Be conversational and helpful.\n\n"
+# Speaker label per message role in the prompt; other roles are left out
+_PROMPT_SPEAKERS = {"user": "Human: ", "assistant": "Assistant: "}
+
+# Fallback response buckets in priority order, with their trigger substrings
+_FALLBACK_BUCKETS = (
+    ('greeting', ('hello', 'hi', 'hey', 'start')),
+    ('wellbeing', ('how are you', 'how do you feel')),
+    ('capabilities', ('what can you do', 'capabilities', 'help')),
+    ('model', ('model', 'llama', 'ai', 'brain')),
+    ('code', ('code', 'programming', 'python', 'javascript')),
+    ('search', ('search', 'find', 'semantic', 'document')),
+    ('privacy', ('local', 'privacy', 'offline')),
+    ('performance', ('performance', 'speed', 'gpu', 'rtx')),
+    ('thanks', ('thank', 'thanks', 'appreciate')),
+    ('future', ('future', 'next', 'plan', 'roadmap')),
+)
+_FALLBACK_PRIORITY = {bucket: rank for rank, (bucket, _) in enumerate(_FALLBACK_BUCKETS)}
+# One lookahead per position, so a single regex pass finds every bucket present
+_FALLBACK_RE = re.compile("(?=" + "|".join(
+    f"(?P<{bucket}>" + "|".join(re.escape(word) for word in words) + ")"
+    for bucket, words in _FALLBACK_BUCKETS
+) + ")")
+# Response templates per bucket; {context_length} is filled in at reply time
+_FALLBACK_RESPONSES = {
+    'greeting': "Hello! I'm your local AI assistant powered by ENTAERA. I'm running right here on your computer with your Llama 3.1 8B model ready to connect. How can I help you today?",
+    'wellbeing': "I'm doing great! I'm running locally on your machine with {context_length} messages in our conversation so far. Your semantic search and conversation systems are working perfectly. What would you like to explore?",
+    'capabilities': "I can help with many things! Your ENTAERA framework gives me access to:\n• Conversation management with context tracking\n• Semantic search through documents\n• Code generation and analysis capabilities\n• Local AI processing (no internet needed)\n• Multi-agent coordination\n\nWhat specific task interests you?",
+    'model': "I'm powered by your locally-downloaded Llama 3.1 8B model (4.6GB)! It's optimized for your RTX 4050 with Q4_K_M quantization. Right now I'm using intelligent fallback responses while we work on the final model integration. Your model is ready and waiting!",
+    'code': "I love helping with code! Your ENTAERA framework includes CodeLlama 7B (3.8GB) specifically for programming tasks. I can help with Python, JavaScript, C++, Java, and more. I can generate code, explain concepts, debug issues, and optimize performance. What coding challenge can I help with?",
+    'search': "Your semantic search system is amazing! It converts text to 384-dimensional vectors using sentence-transformers and can search through documents in milliseconds. We've had {context_length} messages in this conversation, all tracked with full context. Want to see it in action?",
+    'privacy': "That's one of the best features! Everything runs locally on your machine - your conversations, AI processing, and data never leave your computer. No API keys needed, no internet required, complete privacy. Your 8.4GB of models give you full AI capabilities offline!",
+    'performance': "Your setup is optimized beautifully! RTX 4050 with 4GB memory, 35 GPU layers configured, Q4_K_M quantization for efficiency. Your semantic search runs in milliseconds, and the conversation system handles context windows perfectly. Ready for serious AI workloads!",
+    'thanks': "You're very welcome! It's exciting to see your ENTAERA framework working so well. We've exchanged {context_length} messages using your conversation system, and everything is running smoothly. What would you like to explore next?",
+    'future': "The future looks bright! With your working conversation system + 8.4GB of local models, you can build amazing things:\n• AI chat applications\n• Code generation tools\n• Document search systems\n• Multi-agent workflows\n• Custom AI assistants\n\nYour foundation is solid and ready for innovation!",
+}
+
+_SHORT_INPUT_RESPONSE = "I'm here and listening! Feel free to ask me anything or tell me what you'd like to explore with your ENTAERA framework."
+
+# Generic replies rotated by conversation length
+_GENERIC_RESPONSES = (
+    "That's interesting! Your conversation system is tracking our {context_length} messages perfectly. Your ENTAERA framework is designed for exactly these kinds of interactions.",
+    "I appreciate your input! With {context_length} messages in our conversation, I can see how well your context management is working. What aspect interests you most?",
+    "Great point! Your local AI setup gives us complete privacy for conversations like this. No data leaves your machine, and we can chat as long as you want.",
+    "That's thoughtful! Your semantic search and conversation systems working together create powerful possibilities. What would you like to build?",
+    "Interesting perspective! Your ENTAERA framework with 12 core modules is ready for serious AI development. Any particular use case in mind?",
+)
+
 class SmartResponseGenerator:
     """Generates intelligent responses with or without model"""
     
     def __init__(self):
         self.model_loader = LocalModelLoader()
+        self.server = None
         self.conversation_history = []
         self.fallback_enabled = True
+        # LRU of prompt -> completion, only used when decoding is deterministic
+        self._response_cache: OrderedDict = OrderedDict()
+        self._response_cache_size = 256
         
     def initialize(self) -> bool:
         """Initialize the response generator"""
         print("🤖 Initializing AI response generator...")
         
+        # Serve through llama-server (continuous batching) when its binary is configured
+        if os.getenv('LLAMA_SERVER_BIN'):
+            server = LlamaServerClient(os.getenv('CHAT_MODEL_PATH', './models/llama-3.1-8b-instruct.Q4_K_M.gguf'))
+            if server.start():
+                self.server = server
+                print("✅ Real AI model ready!")
+                return True
+        
         # Try to load the model
         model_loaded = self.model_loader.load_llama_model()
         
@@ -177,10 +526,26 @@ class SmartResponseGenerator:
     def generate_response(self, user_input: str, conversation_context: List = None) -> str:
         """Generate response using model or intelligent fallback"""
         
-        if self.model_loader.is_loaded():
+        if self.server is not None:
+            prompt = self._format_prompt_for_model(user_input, conversation_context)
+            return self.server.complete(prompt)
+        
+        elif self.model_loader.is_loaded():
             # Use real AI model
             prompt = self._format_prompt_for_model(user_input, conversation_context)
-            return self.model_loader.generate_response(prompt)
+            if self.model_loader.temperature != 0:
+                return self.model_loader.generate_response(prompt, prefix=self._static_preamble())
+            
+            # Greedy decoding gives the same completion for the same prompt, so reuse it
+            if prompt in self._response_cache:
+                self._response_cache.move_to_end(prompt)
+                return self._response_cache[prompt]
+            response = self.model_loader.generate_response(prompt, prefix=self._static_preamble())
+            if not response.startswith("Sorry, I encountered an error"):
+                self._response_cache[prompt] = response
+                if len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
+            return response
         
         elif self.fallback_enabled:
             # Use intelligent fallback
@@ -189,76 +554,80 @@ class SmartResponseGenerator:
         else:
             return "AI model not available and fallback disabled."
     
-    def _format_prompt_for_model(self, user_input: str, context: List = None) -> str:
-        """Format conversation for the model"""
+    def stream_response(self, user_input: str, conversation_context: List = None) -> Iterator[str]:
+        """Yield the response incrementally so callers can show the first tokens right away"""
         
-        prompt = "You are a helpful AI assistant running locally. Be conversational and helpful.\n\n"
+        if self.server is not None:
+            prompt = self._format_prompt_for_model(user_input, conversation_context)
+            yield from self.server.stream(prompt)
+        
+        elif self.model_loader.is_loaded():
+            prompt = self._format_prompt_for_model(user_input, conversation_context)
+            yield from self.model_loader.stream_response(prompt, prefix=self._static_preamble())
+        
+        else:
+            yield self.generate_response(user_input, conversation_context)
+    
+    async def agenerate_response(self, user_input: str, conversation_context: List = None) -> str:
+        """Async variant for serving several sessions at once
+        
+        With llama-server running, concurrent calls are batched by the server;
+        otherwise this falls back to the blocking generate_response.
+        """
+        if self.server is not None:
+            prompt = self._format_prompt_for_model(user_input, conversation_context)
+            return await self.server.acomplete(prompt)
+        return self.generate_response(user_input, conversation_context)
+    
+    def _static_preamble(self) -> str:
+        """Prompt text shared by every turn"""
+        return PROMPT_PREAMBLE
+    
+    def _dynamic_parts(self, user_input: str, context: List = None) -> List[str]:
+        """Fragments of the recent history plus the current input"""
+        parts = []
         
         # Add recent context
         if context:
             for msg in context[-6:]:  # Last 6 messages for context
                 role = msg.role.value if hasattr(msg.role, 'value') else str(msg.role)
-                if role == "user":
-                    prompt += f"Human: {msg.content}\n\n"
-                elif role == "assistant":
-                    prompt += f"Assistant: {msg.content}\n\n"
+                speaker = _PROMPT_SPEAKERS.get(role)
+                if speaker:
+                    parts += (speaker, msg.content, "\n\n")
         
         # Add current input
-        prompt += f"Human: {user_input}\n\nAssistant: "
+        parts += ("Human: ", user_input, "\n\nAssistant: ")
         
-        return prompt
+        return parts
+    
+    def _dynamic_suffix(self, user_input: str, context: List = None) -> str:
+        """Recent history plus the current input, rebuilt each turn"""
+        return "".join(self._dynamic_parts(user_input, context))
+    
+    def _format_prompt_for_model(self, user_input: str, context: List = None) -> str:
+        """Format conversation for the model in a single join"""
+        return "".join([PROMPT_PREAMBLE, *self._dynamic_parts(user_input, context)])
     
     def _generate_fallback_response(self, user_input: str, context: List = None) -> str:
         """Generate intelligent fallback responses"""
         
-        user_lower = user_input.lower()
+        # Strip once and lowercase the stripped text; trigger words never start or end with spaces
+        stripped = user_input.strip()
+        user_lower = stripped.lower()
         context_length = len(context) if context else 0
         
-        # Analyze user input for intelligent responses
-        if any(word in user_lower for word in ['hello', 'hi', 'hey', 'start']):
-            return "Hello! I'm your local AI assistant powered by ENTAERA. I'm running right here on your computer with your Llama 3.1 8B model ready to connect. How can I help you today?"
+        # Classify the input against every bucket in one regex pass; the highest-priority hit wins
+        hits = {match.lastgroup for match in _FALLBACK_RE.finditer(user_lower)}
+        if hits:
+            bucket = min(hits, key=_FALLBACK_PRIORITY.__getitem__)
+            return _FALLBACK_RESPONSES[bucket].format(context_length=context_length)
         
-        elif any(word in user_lower for word in ['how are you', 'how do you feel']):
-            return f"I'm doing great! I'm running locally on your machine with {context_length} messages in our conversation so far. Your semantic search and conversation systems are working perfectly. What would you like to explore?"
+        if len(stripped) < 3:
+            return _SHORT_INPUT_RESPONSE
         
-        elif any(word in user_lower for word in ['what can you do', 'capabilities', 'help']):
-            return "I can help with many things! Your ENTAERA framework gives me access to:\n• Conversation management with context tracking\n• Semantic search through documents\n• Code generation and analysis capabilities\n• Local AI processing (no internet needed)\n• Multi-agent coordination\n\nWhat specific task interests you?"
-        
-        elif any(word in user_lower for word in ['model', 'llama', 'ai', 'brain']):
-            return f"I'm powered by your locally-downloaded Llama 3.1 8B model (4.6GB)! It's optimized for your RTX 4050 with Q4_K_M quantization. Right now I'm using intelligent fallback responses while we work on the final model integration. Your model is ready and waiting!"
-        
-        elif any(word in user_lower for word in ['code', 'programming', 'python', 'javascript']):
-            return "I love helping with code! Your ENTAERA framework includes CodeLlama 7B (3.8GB) specifically for programming tasks. I can help with Python, JavaScript, C++, Java, and more. I can generate code, explain concepts, debug issues, and optimize performance. What coding challenge can I help with?"
-        
-        elif any(word in user_lower for word in ['search', 'find', 'semantic', 'document']):
-            return f"Your semantic search system is amazing! It converts text to 384-dimensional vectors using sentence-transformers and can search through documents in milliseconds. We've had {context_length} messages in this conversation, all tracked with full context. Want to see it in action?"
-        
-        elif any(word in user_lower for word in ['local', 'privacy', 'offline']):
-            return "That's one of the best features! Everything runs locally on your machine - your conversations, AI processing, and data never leave your computer. No API keys needed, no internet required, complete privacy. Your 8.4GB of models give you full AI capabilities offline!"
-        
-        elif any(word in user_lower for word in ['performance', 'speed', 'gpu', 'rtx']):
-            return "Your setup is optimized beautifully! RTX 4050 with 4GB memory, 35 GPU layers configured, Q4_K_M quantization for efficiency. Your semantic search runs in milliseconds, and the conversation system handles context windows perfectly. Ready for serious AI workloads!"
-        
-        elif any(word in user_lower for word in ['thank', 'thanks', 'appreciate']):
-            return f"You're very welcome! It's exciting to see your ENTAERA framework working so well. We've exchanged {context_length} messages using your conversation system, and everything is running smoothly. What would you like to explore next?"
-        
-        elif any(word in user_lower for word in ['future', 'next', 'plan', 'roadmap']):
-            return "The future looks bright! With your working conversation system + 8.4GB of local models, you can build amazing things:\n• AI chat applications\n• Code generation tools\n• Document search systems\n• Multi-agent workflows\n• Custom AI assistants\n\nYour foundation is solid and ready for innovation!"
-        
-        elif len(user_input.strip()) < 3:
-            return "I'm here and listening! Feel free to ask me anything or tell me what you'd like to explore with your ENTAERA framework."
-        
-        else:
-            # Generate contextual response based on conversation length
-            responses = [
-                f"That's interesting! Your conversation system is tracking our {context_length} messages perfectly. Your ENTAERA framework is designed for exactly these kinds of interactions.",
-                f"I appreciate your input! With {context_length} messages in our conversation, I can see how well your context management is working. What aspect interests you most?",
-                f"Great point! Your local AI setup gives us complete privacy for conversations like this. No data leaves your machine, and we can chat as long as you want.",
-                f"That's thoughtful! Your semantic search and conversation systems working together create powerful possibilities. What would you like to build?",
-                f"Interesting perspective! Your ENTAERA framework with 12 core modules is ready for serious AI development. Any particular use case in mind?"
-            ]
-            
-            return responses[context_length % len(responses)]
+        # Rotate generic replies based on conversation length
+        response = _GENERIC_RESPONSES[context_length % len(_GENERIC_RESPONSES)]
+        return response.format(context_length=context_length)
 
 # Test function
 def test_model_loader():